@@ -0,0 +1,91 @@
+"""
+Micro-benchmark: streaming DocsExtractor vs. the previous BeautifulSoup extraction.
+
+    python benchmarks/bench_extract.py saved_pages/ [--repeat 50]
+
+Every *.html file under the given directories is extracted with both
+implementations; without arguments a synthetic docs page is used.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from mcp_servers.html_extract import extract_markdown
+from docs_server import synthetic_page
+
+
+def soup_extract(html):
+    """
+    The extraction the Agents router used before the streaming extractor.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    main_content = soup.find('main')
+    if not main_content:
+        main_content = soup.find('div', {'class': 'markdown-body'})
+    if not main_content:
+        return None
+
+    parts = []
+    for elem in main_content.find_all(['h1', 'h2', 'h3', 'p', 'pre', 'code', 'ul', 'ol', 'li']):
+        if elem.name in ['h1', 'h2', 'h3']:
+            parts.append(f"\n## {elem.text.strip()}\n\n")
+        elif elem.name == 'p':
+            parts.append(f"{elem.text.strip()}\n\n")
+        elif elem.name == 'pre' or elem.name == 'code':
+            code_text = elem.text.strip()
+            if code_text:
+                parts.append(f"```python\n{code_text}\n```\n\n")
+        elif elem.name in ['ul', 'ol']:
+            for li in elem.find_all('li'):
+                parts.append(f"- {li.text.strip()}\n")
+            parts.append("\n")
+    return "".join(parts) or None
+
+
+def load_pages(dirs):
+    pages = []
+    for directory in dirs:
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if name.endswith((".html", ".htm")):
+                    with open(os.path.join(root, name), encoding="utf-8", errors="replace") as f:
+                        pages.append((os.path.relpath(os.path.join(root, name), directory), f.read()))
+    return pages or [("synthetic", synthetic_page())]
+
+
+def measure(fn, html, repeat):
+    fn(html)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(html)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dirs", nargs="*", help="Directories of saved documentation HTML")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(f"{'page':40} {'KiB':>7} {'soup ms':>9} {'stream ms':>10} {'speedup':>8} {'soup peak KiB':>14} {'stream peak KiB':>16}")
+    for name, html in load_pages(args.dirs):
+        soup_time, soup_peak = measure(soup_extract, html, args.repeat)
+        stream_time, stream_peak = measure(extract_markdown, html, args.repeat)
+        print(f"{name[:40]:40} {len(html) / 1024:7.1f} {soup_time * 1000:9.2f} {stream_time * 1000:10.2f} "
+              f"{soup_time / stream_time:7.1f}x {soup_peak / 1024:14.0f} {stream_peak / 1024:16.0f}")
+
+
+if __name__ == "__main__":
+    main()
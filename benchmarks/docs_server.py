@@ -0,0 +1,110 @@
+"""
+Local stand-in for the OpenAI Agents documentation site.
+
+    python benchmarks/docs_server.py --port 8900 --pages-dir saved_pages/ --latency 50 --failure-rate 0.05
+
+Serves saved HTML laid out like the site ("documentation/agents/" is served
+from "documentation/agents/index.html"), or a synthetic docs page for any path
+when no directory is given. Latency and failures can be injected per request.
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def synthetic_page(sections=40):
+    body = []
+    for i in range(sections):
+        body.append(f"<h2 id='s{i}'>Section {i}<a class='headerlink' href='#s{i}'>&para;</a></h2>")
+        body.append(f"<p>The <code>Runner</code> runs agent {i} until a final output is produced.</p>")
+        body.append("<ul><li>First <code>item</code></li><li>Second item</li></ul>")
+        body.append(f"<pre><code>result = Runner.run_sync(agent, 'task {i}')\nprint(result.final_output)</code></pre>")
+    return ("<html><head><script>var x = 1;</script></head><body><nav>" + "<a href='#'>link</a>" * 200
+            + "</nav><main>" + "".join(body) + "</main><footer>footer</footer></body></html>")
+
+
+class DocsServerConfig:
+    def __init__(self, pages_dir=None, latency=0.0, jitter=0.0, failure_rate=0.0, failure_status=503):
+        self.pages_dir = pages_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.synthetic = synthetic_page().encode("utf-8")
+
+
+class DocsHandler(BaseHTTPRequestHandler):
+    config: DocsServerConfig = None
+
+    def do_GET(self):
+        config = self.config
+        delay = config.latency + random.uniform(0, config.jitter)
+        if delay:
+            time.sleep(delay)
+        if config.failure_rate and random.random() < config.failure_rate:
+            self.send_error(config.failure_status)
+            return
+
+        body = self._page(self.path.split("?", 1)[0])
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _page(self, path):
+        if self.config.pages_dir is None:
+            return self.config.synthetic
+        relative = path.lstrip("/")
+        if not relative or relative.endswith("/"):
+            relative += "index.html"
+        full_path = os.path.realpath(os.path.join(self.config.pages_dir, relative))
+        if not full_path.startswith(os.path.realpath(self.config.pages_dir)) or not os.path.isfile(full_path):
+            return None
+        with open(full_path, "rb") as f:
+            return f.read()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_docs_server(port=0, **config):
+    """
+    Start the stand-in in a background thread and return (server, base_url).
+    """
+    handler = type("ConfiguredDocsHandler", (DocsHandler,), {"config": DocsServerConfig(**config)})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--pages-dir", help="Directory of saved documentation HTML")
+    parser.add_argument("--latency", type=float, default=0.0, help="Added latency per request, in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency up to this many ms")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--failure-status", type=int, default=503)
+    args = parser.parse_args(argv)
+
+    server, url = start_docs_server(
+        args.port, pages_dir=args.pages_dir, latency=args.latency / 1000, jitter=args.jitter / 1000,
+        failure_rate=args.failure_rate, failure_status=args.failure_status,
+    )
+    print(f"Serving stand-in docs at {url} (set MCP_AGENTS_DOCS_URL={url})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Load test for the Multi-MCP server.
+
+    python benchmarks/load_test.py --duration 20 --concurrency 32 --latency 50
+
+Starts a local stand-in for the OpenAI Agents docs site and `uvicorn main:app`
+pointed at it, drives a weighted mix of traffic across every router and
+listing endpoint, then reports requests/sec and p50/p95/p99 latency per
+endpoint. Pass --url to load an already running server instead.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from docs_server import start_docs_server
+
+# (weight, endpoint label, method, path, query params or JSON body)
+TRAFFIC = [
+    (10, "/mcp/openai/context", "GET", "/mcp/openai/context", {"language": "python", "function": "openai.ChatCompletion.create"}),
+    (4, "/mcp/openai/context", "GET", "/mcp/openai/context", {"language": "python", "function": "openai.Embedding.create"}),
+    (8, "/mcp/firebase/context", "GET", "/mcp/firebase/context", {"language": "javascript", "function": "firebase.auth.signIn"}),
+    (8, "/mcp/aws/context", "GET", "/mcp/aws/context", {"language": "python", "function": "boto3.client"}),
+    (8, "/mcp/openai-agents/context", "GET", "/mcp/openai-agents/context", {"language": "python", "function": "agents.Runner.run_sync"}),
+    (6, "/mcp/openai-agents/context", "GET", "/mcp/openai-agents/context", {"language": "python", "function": "agents.Handoff"}),
+    (4, "/mcp/openai-agents/context", "GET", "/mcp/openai-agents/context", {"language": "python", "function": "agents.Tracing"}),
+    (2, "/mcp/openai-agents/context", "GET", "/mcp/openai-agents/context", {"language": "python", "function": "sdk"}),
+    (6, "/mcp/frontend/context", "GET", "/mcp/frontend/context", {"component": "Button"}),
+    (3, "/mcp/frontend/context", "GET", "/mcp/frontend/context", {}),
+    (3, "/mcp/frontend/components", "GET", "/mcp/frontend/components", {}),
+    (3, "/mcp/frontend/pages", "GET", "/mcp/frontend/pages", {}),
+    (6, "/mcp/backend/context", "GET", "/mcp/backend/context", {"resource": "users"}),
+    (3, "/mcp/backend/context", "GET", "/mcp/backend/context", {"schema": "orders"}),
+    (3, "/mcp/backend/apis", "GET", "/mcp/backend/apis", {}),
+    (3, "/mcp/backend/schemas", "GET", "/mcp/backend/schemas", {}),
+    (4, "/mcp/search", "GET", "/mcp/search", {"q": "region_name"}),
+    (2, "/mcp/batch", "POST", "/mcp/batch", {"items": [
+        {"library": "aws", "language": "python", "function": "boto3.resource"},
+        {"library": "openai-agents", "language": "python", "function": "agents.Guardrails"},
+        {"library": "backend", "schema": "users"},
+    ]}),
+]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(q * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def wait_until_up(url, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url + "/")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not come up within {timeout}s")
+
+
+async def drive(url, duration, concurrency, seed):
+    rng = random.Random(seed)
+    weights = [entry[0] for entry in TRAFFIC]
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    deadline = time.monotonic() + duration
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        async def worker():
+            while time.monotonic() < deadline:
+                _, label, method, path, params = rng.choices(TRAFFIC, weights)[0]
+                start = time.perf_counter()
+                try:
+                    if method == "GET":
+                        response = await client.get(path, params=params)
+                    else:
+                        response = await client.post(path, json=params)
+                    ok = response.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                latencies[label].append(time.perf_counter() - start)
+                if not ok:
+                    errors[label] += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+    return latencies, errors, elapsed
+
+
+def report(latencies, errors, elapsed):
+    print(f"{'endpoint':30} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    total = 0
+    for label in sorted(latencies):
+        values = sorted(latencies[label])
+        total += len(values)
+        print(f"{label:30} {len(values):9d} {errors[label]:7d} {len(values) / elapsed:9.1f} "
+              f"{percentile(values, 0.50) * 1000:8.2f} {percentile(values, 0.95) * 1000:8.2f} {percentile(values, 0.99) * 1000:8.2f}")
+    all_values = sorted(v for values in latencies.values() for v in values)
+    print(f"{'TOTAL':30} {total:9d} {sum(errors.values()):7d} {total / elapsed:9.1f} "
+          f"{percentile(all_values, 0.50) * 1000:8.2f} {percentile(all_values, 0.95) * 1000:8.2f} {percentile(all_values, 0.99) * 1000:8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Load an already running server instead of starting one")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent client connections")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--pages-dir", help="Saved documentation HTML for the stand-in docs site")
+    parser.add_argument("--latency", type=float, default=50.0, help="Stand-in docs latency per request, in ms")
+    parser.add_argument("--jitter", type=float, default=20.0, help="Random extra stand-in latency, in ms")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of stand-in requests that fail")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    server = docs_server = None
+    url = args.url
+    try:
+        if url is None:
+            docs_server, docs_url = start_docs_server(
+                pages_dir=args.pages_dir, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                failure_rate=args.failure_rate,
+            )
+            port = free_port()
+            env = dict(os.environ, MCP_AGENTS_DOCS_URL=docs_url)
+            server = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--workers", str(args.workers),
+                 "--log-level", "warning"],
+                cwd=ROOT, env=env,
+            )
+            url = f"http://127.0.0.1:{port}"
+
+        asyncio.run(wait_until_up(url))
+        print(f"Driving {url} for {args.duration:.0f}s with {args.concurrency} connections")
+        report(*asyncio.run(drive(url, args.duration, args.concurrency, args.seed)))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+        if docs_server is not None:
+            docs_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
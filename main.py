@@ -1,33 +1,86 @@
+import sys
+from contextlib import AsyncExitStack, asynccontextmanager
+
 from fastapi import FastAPI
-from mcp_servers.openai_mcp import router as openai_router
-from mcp_servers.firebase_mcp import router as firebase_router
-from mcp_servers.aws_mcp import router as aws_router
-from mcp_servers.openai_agents_mcp import router as openai_agents_router
-from mcp_servers.frontend_mcp import router as frontend_router
-from mcp_servers.backend_mcp import router as backend_router
+from fastapi.responses import JSONResponse
+from mcp_servers.admission import AdmissionMiddleware
+from mcp_servers.metrics import MetricsMiddleware, router as metrics_router
+from mcp_servers.shared_cache import close_shared_cache, open_shared_cache
+from mcp_servers.snapshot import close_snapshot, open_snapshot
+from mcp_servers import registry
+from mcp_servers.search_mcp import router as search_router
+from mcp_servers.batch_mcp import router as batch_router
+from mcp_servers.sse_mcp import router as sse_router
+from mcp_servers.rpc_mcp import router as rpc_router
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the offline documentation snapshot (if configured) once per worker
+    open_snapshot()
+    # Open the cache shared with the other workers on this host (if configured)
+    open_shared_cache()
+    # Start each server's background work, such as warming its documentation pages
+    async with AsyncExitStack() as stack:
+        for server in registry.servers():
+            server_lifespan = registry.hook(server, "lifespan")
+            if server_lifespan:
+                await stack.enter_async_context(server_lifespan())
+        yield
+    close_shared_cache()
+    close_snapshot()
+    # Release the pooled upstream connections shared by the scraping routers,
+    # if any of them was used; slim workers never import the client at all
+    http_client = sys.modules.get("mcp_servers.http_client")
+    if http_client:
+        await http_client.close_client()
 
-app = FastAPI(title="Multi-MCP Server")
+app = FastAPI(title="Multi-MCP Server", lifespan=lifespan)
+# Admission runs inside the metrics middleware so rejected requests are counted too
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(MetricsMiddleware)
 
-# Register multiple MCP endpoints
-app.include_router(openai_router, prefix="/mcp")
-app.include_router(firebase_router, prefix="/mcp")
-app.include_router(aws_router, prefix="/mcp")
-app.include_router(openai_agents_router, prefix="/mcp")
-app.include_router(frontend_router, prefix="/mcp/frontend")
-app.include_router(backend_router, prefix="/mcp/backend")
+# Register the MCP endpoints enabled in mcp.json (all of them unless MCP_SERVERS is set)
+for server in registry.servers():
+    app.include_router(registry.load(server).router, prefix=server["prefix"])
+app.include_router(search_router, prefix="/mcp")
+app.include_router(batch_router, prefix="/mcp")
+app.include_router(sse_router)
+# MCP JSON-RPC: streamable HTTP at /mcp, HTTP+SSE via /sse and /messages
+app.include_router(rpc_router)
+app.include_router(metrics_router)
 
 @app.get("/")
 async def root():
     return {"message": "Multi-MCP Server Running!", 
             "available_endpoints": [
-                "/mcp/openai/context",
-                "/mcp/firebase/context",
-                "/mcp/aws/context",
-                "/mcp/openai-agents/context",
-                "/mcp/frontend/context",
-                "/mcp/backend/context"
+                *(registry.endpoint_path(server) for server in registry.servers()),
+                "/mcp/search",
+                "/mcp/batch",
+                "/mcp",
+                "/sse",
+                "/metrics",
+                "/ready"
             ]}
 
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe: 200 once every enabled server has warmed up, 503 until then.
+    """
+    servers = {}
+    for server in registry.servers():
+        readiness = registry.hook(server, "readiness")
+        if readiness:
+            servers[server["id"]] = readiness()
+    is_ready = all(report["ready"] for report in servers.values())
+    return JSONResponse({"ready": is_ready, "servers": servers}, status_code=200 if is_ready else 503)
+
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    if "--stdio" in sys.argv:
+        # Serve MCP over stdin/stdout for clients that launch the server themselves
+        import asyncio
+        from mcp_servers.stdio import serve_stdio
+        asyncio.run(serve_stdio(lifespan(app)))
+    else:
+        import uvicorn
+        uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
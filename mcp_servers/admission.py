@@ -0,0 +1,232 @@
+"""
+Admission control for lookups that scrape upstream documentation sites.
+
+A server listed in MCP_ADMISSION_LIMITS lets a fixed number of its scraping
+lookups run at once and queues a bounded number more. Only lookups that
+actually have to scrape are admitted, whichever transport asked for them
+(the /context routes, /mcp/batch items, MCP tool calls over /mcp, /messages
+or stdio, and /sse streams); answers served from memory or the cache shared
+between workers, the frontend and backend catalogs and the mock-doc lookups
+never wait, so a burst of scrapes cannot starve them. A lookup that cannot start within MCP_ADMISSION_TIMEOUT
+seconds, judged from the queue ahead of it and the recent scrape time, is
+turned away at once with Overloaded, which HTTP routes answer with 503 and a
+Retry-After header rather than leaving the client waiting. Each client may
+also run only so many scrapes at once (429 beyond that).
+
+    MCP_ADMISSION_LIMITS=openai-agents-mcp=32
+"""
+import asyncio
+import contextvars
+import json
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+
+from mcp_servers.metrics import admission_queued, admission_rejected
+
+DEFAULT_LIMITS = "openai-agents-mcp=32"
+# server id=limit pairs
+SERVER_LIMITS = {
+    server.strip(): int(limit)
+    for server, _, limit in (pair.partition("=") for pair in os.environ.get("MCP_ADMISSION_LIMITS", DEFAULT_LIMITS).split(","))
+    if server.strip() and limit.strip()
+}
+QUEUE_SIZE = int(os.environ.get("MCP_ADMISSION_QUEUE", "64"))
+ADMISSION_TIMEOUT = float(os.environ.get("MCP_ADMISSION_TIMEOUT", "2"))
+# Concurrent scrapes one client may have across the limited servers; 0 disables
+CLIENT_LIMIT = int(os.environ.get("MCP_ADMISSION_CLIENT_LIMIT", "8"))
+# Header naming the client when behind a proxy (e.g. X-Forwarded-For); the peer address otherwise
+CLIENT_HEADER = os.environ.get("MCP_ADMISSION_CLIENT_HEADER", "").lower().encode("latin-1")
+# Weight of the latest scrape in a server's moving average service time
+SERVICE_TIME_WEIGHT = 0.2
+
+
+class Overloaded(Exception):
+    """
+    A lookup turned away by admission control; retry after `retry_after` seconds.
+    """
+
+    def __init__(self, status: int, retry_after: float, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.detail = detail
+
+
+class Limiter:
+    """
+    A FIFO semaphore with a bounded queue that knows how long its requests take.
+    """
+
+    def __init__(self, limit: int, queue_size: int):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self.service_time = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def expected_wait(self) -> float:
+        # Everyone queued ahead of us must start, in batches of `limit`, before we do
+        if self.active < self.limit:
+            return 0.0
+        return (len(self._waiters) // self.limit + 1) * self.service_time
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Take a slot, waiting at most timeout seconds; False if none came free.
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return True
+        if len(self._waiters) >= self.queue_size or self.expected_wait() > timeout:
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+            return True
+        except asyncio.TimeoutError:
+            # The slot may have been handed over just as the wait ran out
+            return waiter.done()
+        except asyncio.CancelledError:
+            if waiter.done():
+                self._hand_off()
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                self._waiters.remove(waiter)
+
+    def release(self, elapsed: float):
+        self.service_time += SERVICE_TIME_WEIGHT * (elapsed - self.service_time)
+        self._hand_off()
+
+    def _hand_off(self):
+        # Pass the slot straight to the first request still waiting
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+limiters: Dict[str, Limiter] = {server: Limiter(limit, QUEUE_SIZE) for server, limit in SERVER_LIMITS.items()}
+client_slots: Dict[str, int] = {}
+# The client behind the current request, set by AdmissionMiddleware; None
+# outside HTTP requests (stdio, background refreshes), which have no client limit
+current_client: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_client", default=None)
+
+
+@asynccontextmanager
+async def admitted(server_id: str):
+    """
+    Hold one of a server's scraping slots for the duration of the block, or
+    raise Overloaded at once if none can be had in time. A server without a
+    limit is never queued. Take it only around the scrape itself, once the
+    caches have missed, so lookups they answer never wait.
+    """
+    limiter = limiters.get(server_id)
+    if limiter is None:
+        yield
+        return
+
+    admission_queued.inc(server_id)
+    try:
+        granted = await limiter.acquire(ADMISSION_TIMEOUT)
+    finally:
+        admission_queued.dec(server_id)
+    if not granted:
+        admission_rejected.inc(server_id, "overload")
+        raise Overloaded(503, limiter.expected_wait() or limiter.service_time, "Server busy, retry later")
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        limiter.release(time.monotonic() - start)
+
+
+@asynccontextmanager
+async def client_admitted(server_id: str):
+    """
+    Count the block against the current client's concurrent scrapes, or raise
+    Overloaded (429) if it already has CLIENT_LIMIT running. Enter it in each
+    caller before joining a scrape another request may be leading, so every
+    client is judged on its own lookups.
+    """
+    limiter = limiters.get(server_id)
+    client = current_client.get()
+    if limiter is None or client is None or not CLIENT_LIMIT:
+        yield
+        return
+
+    if client_slots.get(client, 0) >= CLIENT_LIMIT:
+        admission_rejected.inc(server_id, "client")
+        raise Overloaded(429, limiter.service_time, "Too many concurrent requests from this client")
+    client_slots[client] = client_slots.get(client, 0) + 1
+    try:
+        yield
+    finally:
+        client_slots[client] -= 1
+        if not client_slots[client]:
+            del client_slots[client]
+
+
+def client_key(scope) -> str:
+    if CLIENT_HEADER:
+        for name, value in scope["headers"]:
+            if name == CLIENT_HEADER:
+                return value.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+async def reject(send, error: Overloaded):
+    body = json.dumps({"detail": error.detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": error.status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(error.retry_after).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware naming the client of each request for the per-client
+    limit, and answering a request whose lookup was turned away with its
+    503 or 429 (unless the response had already started).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_wrapper(message):
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        token = current_client.set(client_key(scope))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Overloaded as e:
+            if started:
+                raise
+            await reject(send, e)
+        finally:
+            current_client.reset(token)
@@ -1,94 +1,126 @@
-from fastapi import APIRouter, Query
-import requests
+from fastapi import APIRouter, Query, Request
+from typing import Optional
 import json
 
+from mcp_servers.doc_index import fit_to_budget
+from mcp_servers.metrics import record_resolution
+from mcp_servers.resolver import EXACT, FALLBACK, FUZZY, SymbolResolver
+from mcp_servers.responses import json_response
+from mcp_servers.search_mcp import nearest_document
+from mcp_servers.snapshot import get_snapshot
+
 router = APIRouter()
 
-def fetch_aws_docs(function_name):
+# Mock documentation for different AWS functions
+mock_docs = {
+    "client": """
+    # boto3.client
+    
+    Creates a low-level service client by name.
+    
+    ## Parameters:
+    - service_name (string): Required. The name of the service, e.g., 's3', 'ec2', etc.
+    - region_name (string): Optional. The name of the region associated with the client.
+    - api_version (string): Optional. The API version to use. By default, the latest API version is used.
+    - use_ssl (boolean): Optional. Whether or not to use SSL. By default, SSL is used.
+    - verify (boolean/string): Optional. Whether or not to verify SSL certificates.
+    - endpoint_url (string): Optional. The complete URL to use for the constructed client.
+    - aws_access_key_id (string): Optional. The access key to use when creating the client.
+    - aws_secret_access_key (string): Optional. The secret key to use when creating the client.
+    - aws_session_token (string): Optional. The session token to use when creating the client.
+    
+    ## Returns:
+    - Client: A low-level service client instance
+    
+    ## Example:
+    ```python
+    import boto3
+    
+    # Create an S3 client
+    s3 = boto3.client('s3')
+    
+    # Upload a file to S3
+    s3.upload_file('file.txt', 'mybucket', 'file.txt')
+    ```
+    """,
+    "resource": """
+    # boto3.resource
+    
+    Creates a resource service client by name.
+    
+    ## Parameters:
+    - service_name (string): Required. The name of the service, e.g., 's3', 'ec2', etc.
+    - region_name (string): Optional. The name of the region associated with the client.
+    - api_version (string): Optional. The API version to use. By default, the latest API version is used.
+    - use_ssl (boolean): Optional. Whether or not to use SSL. By default, SSL is used.
+    - verify (boolean/string): Optional. Whether or not to verify SSL certificates.
+    - endpoint_url (string): Optional. The complete URL to use for the constructed client.
+    - aws_access_key_id (string): Optional. The access key to use when creating the client.
+    - aws_secret_access_key (string): Optional. The secret key to use when creating the client.
+    - aws_session_token (string): Optional. The session token to use when creating the client.
+    
+    ## Returns:
+    - ServiceResource: A resource service client instance
+    
+    ## Example:
+    ```python
+    import boto3
+    
+    # Create an S3 resource
+    s3 = boto3.resource('s3')
+    
+    # Upload a file to S3
+    s3.Bucket('mybucket').upload_file('file.txt', 'key/in/s3.txt')
+    ```
+    """
+}
+
+# Built once at import time and shared by every request
+resolver = SymbolResolver(("boto3.", "aws."), mock_docs)
+
+def resolve_aws_docs(function_name):
+    """
+    Resolve a function name to (outcome, documentation).
+    """
     # Extract specific function if format like "boto3.client"
-    if function_name.startswith("boto3."):
-        function_name = function_name[6:]  # Remove "boto3." prefix
-    elif function_name.startswith("aws."):
-        function_name = function_name[4:]  # Remove "aws." prefix
-    
-    # Mock documentation for different AWS functions
-    mock_docs = {
-        "client": """
-        # boto3.client
-        
-        Creates a low-level service client by name.
-        
-        ## Parameters:
-        - service_name (string): Required. The name of the service, e.g., 's3', 'ec2', etc.
-        - region_name (string): Optional. The name of the region associated with the client.
-        - api_version (string): Optional. The API version to use. By default, the latest API version is used.
-        - use_ssl (boolean): Optional. Whether or not to use SSL. By default, SSL is used.
-        - verify (boolean/string): Optional. Whether or not to verify SSL certificates.
-        - endpoint_url (string): Optional. The complete URL to use for the constructed client.
-        - aws_access_key_id (string): Optional. The access key to use when creating the client.
-        - aws_secret_access_key (string): Optional. The secret key to use when creating the client.
-        - aws_session_token (string): Optional. The session token to use when creating the client.
-        
-        ## Returns:
-        - Client: A low-level service client instance
-        
-        ## Example:
-        ```python
-        import boto3
-        
-        # Create an S3 client
-        s3 = boto3.client('s3')
-        
-        # Upload a file to S3
-        s3.upload_file('file.txt', 'mybucket', 'file.txt')
-        ```
-        """,
-        "resource": """
-        # boto3.resource
-        
-        Creates a resource service client by name.
-        
-        ## Parameters:
-        - service_name (string): Required. The name of the service, e.g., 's3', 'ec2', etc.
-        - region_name (string): Optional. The name of the region associated with the client.
-        - api_version (string): Optional. The API version to use. By default, the latest API version is used.
-        - use_ssl (boolean): Optional. Whether or not to use SSL. By default, SSL is used.
-        - verify (boolean/string): Optional. Whether or not to verify SSL certificates.
-        - endpoint_url (string): Optional. The complete URL to use for the constructed client.
-        - aws_access_key_id (string): Optional. The access key to use when creating the client.
-        - aws_secret_access_key (string): Optional. The secret key to use when creating the client.
-        - aws_session_token (string): Optional. The session token to use when creating the client.
-        
-        ## Returns:
-        - ServiceResource: A resource service client instance
-        
-        ## Example:
-        ```python
-        import boto3
-        
-        # Create an S3 resource
-        s3 = boto3.resource('s3')
-        
-        # Upload a file to S3
-        s3.Bucket('mybucket').upload_file('file.txt', 'key/in/s3.txt')
-        ```
-        """
-    }
+    function_name = resolver.strip_prefix(function_name)
     
     # If function is in our mock data, return it
-    for key in mock_docs:
-        if key.lower() in function_name.lower():
-            return mock_docs[key]
+    match = resolver.resolve(function_name)
+    if match:
+        record_resolution("aws", match.kind)
+        return match.kind, match.value
+    
+    # Then any documentation ingested into the offline snapshot
+    snapshot = get_snapshot()
+    if snapshot:
+        doc = snapshot.doc("aws", function_name)
+        if doc:
+            record_resolution("aws", EXACT)
+            return EXACT, doc
+    
+    # Otherwise the closest documented symbol, e.g. "client" for "boto3.Client"
+    nearest = nearest_document("aws", function_name)
+    if nearest:
+        record_resolution("aws", FUZZY)
+        return FUZZY, nearest.text
     
     # Default fallback
-    return f"Documentation for {function_name} not found. Please check the AWS boto3 documentation at https://boto3.amazonaws.com/v1/documentation/api/latest/index.html"
+    record_resolution("aws", FALLBACK)
+    return FALLBACK, f"Documentation for {function_name} not found. Please check the AWS boto3 documentation at https://boto3.amazonaws.com/v1/documentation/api/latest/index.html"
 
-@router.get("/aws/context")
-async def aws_mcp_context(
-    language: str = Query(...),
-    function: str = Query(...)
-):
-    doc_snippet = fetch_aws_docs(function)
+def fetch_aws_docs(function_name):
+    return resolve_aws_docs(function_name)[1]
+
+def search_documents():
+    """
+    Yield (library, symbol, text) tuples for the cross-library search index.
+    """
+    for symbol, doc in mock_docs.items():
+        yield "aws", symbol, doc
+
+def aws_context(language, function, max_tokens=None, max_chars=None):
+    doc_snippet = fit_to_budget(fetch_aws_docs(function), function, max_tokens, max_chars)
     
     return {
         "context": {
@@ -97,4 +129,16 @@ async def aws_mcp_context(
             "function": function,
             "documentation": doc_snippet
         }
-    } 
\ No newline at end of file
+    }
+
+@router.get("/aws/context")
+async def aws_mcp_context(
+    request: Request,
+    language: str = Query(...),
+    function: str = Query(...),
+    max_tokens: Optional[int] = Query(None, ge=1, description="Approximate token budget for the documentation"),
+    max_chars: Optional[int] = Query(None, ge=1, description="Character budget for the documentation"),
+):
+    # Resolving is a few hash lookups; the encoded payload is what gets cached
+    payload = aws_context(language, function, max_tokens, max_chars)
+    return json_response(request, key=("aws", language, function, max_tokens, max_chars), build=lambda: payload)
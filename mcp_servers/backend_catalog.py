@@ -0,0 +1,270 @@
+"""
+Backend API and database schema catalog, loaded from OpenAPI and JSON Schema files.
+
+Endpoints are indexed by resource, HTTP method, path template and
+"METHOD path" key, and tables by name and by field name, so every lookup and
+filtered listing is a dictionary lookup rather than a scan of the catalog.
+Listings are paged with opaque cursors and can be projected to a subset of
+fields.
+
+    MCP_BACKEND_SPECS=specs/openapi.yaml:specs/schemas/ uvicorn main:app
+"""
+import base64
+import binascii
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import yaml
+except ImportError:  # optional: only needed for YAML specs
+    yaml = None
+
+# os.pathsep-separated spec files or directories of them
+SPEC_PATHS = [p for p in os.environ.get("MCP_BACKEND_SPECS", "").split(os.pathsep) if p]
+DEFAULT_PAGE_SIZE = int(os.environ.get("MCP_BACKEND_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = 500
+
+HTTP_METHODS = ("GET", "PUT", "POST", "DELETE", "OPTIONS", "HEAD", "PATCH", "TRACE")
+SPEC_EXTENSIONS = (".json", ".yaml", ".yml")
+# Path segments skipped when deriving a resource from an untagged path
+PATH_NOISE_RE = re.compile(r"^(api|v\d+(\.\d+)*|\{.*\})$", re.IGNORECASE)
+
+ENDPOINT_FIELDS = ("resource", "method", "path", "summary")
+SCHEMA_FIELDS = ("name", "fields")
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"o": offset}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """
+    Return the offset a cursor points at; raises ValueError for a malformed cursor.
+    """
+    if not cursor:
+        return 0
+    try:
+        offset = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))["o"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid cursor")
+    return offset
+
+
+def project(item: dict, fields: Optional[Sequence[str]]) -> dict:
+    if not fields:
+        return item
+    return {field: item[field] for field in fields if field in item}
+
+
+def describe_type(prop: dict) -> str:
+    """
+    Render a JSON Schema property as a short type description, e.g. "string (uuid)".
+    """
+    if "$ref" in prop:
+        return f"reference to {prop['$ref'].rsplit('/', 1)[-1]}"
+    kind = prop.get("type", "object")
+    if isinstance(kind, list):
+        kind = " | ".join(kind)
+    if kind == "array":
+        return f"array of {describe_type(prop.get('items', {}))}"
+    details = []
+    if "format" in prop:
+        details.append(prop["format"])
+    if "enum" in prop:
+        details.append("enum: " + ", ".join(str(value) for value in prop["enum"]))
+    if prop.get("description"):
+        details.append(prop["description"])
+    return f"{kind} ({'; '.join(details)})" if details else kind
+
+
+def resource_for(path: str, tags: Optional[List[str]] = None) -> str:
+    if tags:
+        return tags[0]
+    for segment in path.strip("/").split("/"):
+        if segment and not PATH_NOISE_RE.match(segment):
+            return segment
+    return "default"
+
+
+class BackendCatalog:
+    def __init__(self):
+        self.endpoints: List[dict] = []
+        self.schemas: Dict[str, Dict[str, str]] = {}
+        self._schema_names: List[str] = []
+        self._by_key: Dict[str, int] = {}
+        self._by_resource: Dict[str, List[int]] = {}
+        self._by_method: Dict[str, List[int]] = {}
+        self._by_path: Dict[str, List[int]] = {}
+        self._tables_by_field: Dict[str, List[str]] = {}
+
+    def add_endpoint(self, resource: str, method: str, path: str, summary: str = ""):
+        method = method.upper()
+        key = f"{method} {path}"
+        if key in self._by_key:
+            self.endpoints[self._by_key[key]]["summary"] = summary
+            return
+        endpoint_id = len(self.endpoints)
+        self.endpoints.append({"resource": resource, "method": method, "path": path, "summary": summary})
+        self._by_key[key] = endpoint_id
+        self._by_resource.setdefault(resource, []).append(endpoint_id)
+        self._by_method.setdefault(method, []).append(endpoint_id)
+        self._by_path.setdefault(path, []).append(endpoint_id)
+
+    def add_schema(self, name: str, fields: Dict[str, str]):
+        if name in self.schemas:
+            for field in self.schemas[name]:
+                self._tables_by_field[field.lower()].remove(name)
+        else:
+            self._schema_names.append(name)
+        self.schemas[name] = fields
+        for field in fields:
+            self._tables_by_field.setdefault(field.lower(), []).append(name)
+
+    # Ingestion
+
+    def load_openapi(self, spec: dict):
+        """
+        Add every operation of an OpenAPI 3 / Swagger 2 document, and its
+        component (or definition) schemas as tables. Path items and schemas
+        that are not objects (e.g. unresolved "$ref" strings) are skipped.
+        """
+        for path, operations in (spec.get("paths") or {}).items():
+            if not isinstance(operations, dict):
+                continue
+            for method, operation in operations.items():
+                if method.upper() not in HTTP_METHODS or not isinstance(operation, dict):
+                    continue
+                summary = operation.get("summary") or operation.get("description") or operation.get("operationId", "")
+                self.add_endpoint(resource_for(path, operation.get("tags")), method, path, str(summary).strip())
+        schemas = (spec.get("components") or {}).get("schemas") or spec.get("definitions") or {}
+        for name, schema in schemas.items():
+            if isinstance(schema, dict):
+                self.load_json_schema(schema, name)
+
+    def load_json_schema(self, schema: dict, name: Optional[str] = None):
+        name = name or schema.get("title")
+        if not name:
+            raise ValueError("JSON schema needs a title to be used as a table name")
+        properties = schema.get("properties") or {}
+        self.add_schema(name, {field: describe_type(prop) for field, prop in properties.items() if isinstance(prop, dict)})
+
+    def load_file(self, path: str):
+        with open(path, encoding="utf-8") as f:
+            if path.endswith((".yaml", ".yml")):
+                if yaml is None:
+                    raise RuntimeError(f"PyYAML is required to load {path}")
+                document = yaml.safe_load(f)
+            else:
+                document = json.load(f)
+        if not isinstance(document, dict):
+            raise ValueError(f"{path} is not an OpenAPI or JSON Schema document")
+        if "openapi" in document or "swagger" in document:
+            self.load_openapi(document)
+        elif "$defs" in document or "definitions" in document:
+            for name, schema in (document.get("$defs") or document["definitions"]).items():
+                self.load_json_schema(schema, name)
+        else:
+            self.load_json_schema(document, document.get("title") or os.path.splitext(os.path.basename(path))[0])
+
+    def load_paths(self, paths: Iterable[str]):
+        """
+        Load every spec file under paths. A file that cannot be read or parsed
+        is reported and skipped, so one bad spec never keeps the app from starting.
+        """
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, files in os.walk(path):
+                    for name in sorted(files):
+                        if name.endswith(SPEC_EXTENSIONS):
+                            self._load_reported(os.path.join(root, name))
+            else:
+                self._load_reported(path)
+
+    def _load_reported(self, path: str):
+        try:
+            self.load_file(path)
+        except Exception as e:
+            print(f"Error loading backend spec {path}: {str(e)}")
+
+    # Lookups
+
+    def endpoint(self, key: str) -> Optional[dict]:
+        """
+        Look up an endpoint by "METHOD /path/template".
+        """
+        method, _, path = key.strip().partition(" ")
+        endpoint_id = self._by_key.get(f"{method.upper()} {path.strip()}")
+        return None if endpoint_id is None else self.endpoints[endpoint_id]
+
+    def resources(self) -> List[str]:
+        return list(self._by_resource)
+
+    def resource_endpoints(self, resource: str) -> List[dict]:
+        return [self.endpoints[i] for i in self._by_resource.get(resource, ())]
+
+    def tables_with_field(self, field: str) -> List[str]:
+        return self._tables_by_field.get(field.lower(), [])
+
+    def find_endpoints(self, resource: Optional[str] = None, method: Optional[str] = None,
+                       path: Optional[str] = None) -> Sequence[int]:
+        """
+        Return ids of the endpoints matching every given filter, in catalog order.
+        """
+        candidates = []
+        if resource is not None:
+            candidates.append(self._by_resource.get(resource, []))
+        if method is not None:
+            candidates.append(self._by_method.get(method.upper(), []))
+        if path is not None:
+            candidates.append(self._by_path.get(path, []))
+        if not candidates:
+            return range(len(self.endpoints))
+        # Walk the smallest posting list and check the others by membership
+        candidates.sort(key=len)
+        rest = [set(ids) for ids in candidates[1:]]
+        return [i for i in candidates[0] if all(i in ids for ids in rest)]
+
+    def list_endpoints(self, resource=None, method=None, path=None, cursor=None,
+                       limit=DEFAULT_PAGE_SIZE, fields=None) -> Tuple[List[dict], Optional[str]]:
+        """
+        Return one page of matching endpoints and the cursor of the next page (None on the last).
+        """
+        ids = self.find_endpoints(resource, method, path)
+        return _page(ids, cursor, limit, lambda i: project(self.endpoints[i], fields))
+
+    def list_schemas(self, field=None, cursor=None, limit=DEFAULT_PAGE_SIZE, fields=None) -> Tuple[List[dict], Optional[str]]:
+        """
+        Return one page of tables (those having `field`, if given) and the next page's cursor.
+        """
+        names = self.tables_with_field(field) if field is not None else self._schema_names
+        return _page(names, cursor, limit, lambda name: project({"name": name, "fields": self.schemas[name]}, fields))
+
+
+def _page(keys: Sequence, cursor, limit, render) -> Tuple[List[dict], Optional[str]]:
+    offset = decode_cursor(cursor)
+    items = [render(key) for key in keys[offset:offset + limit]]
+    return items, encode_cursor(offset + limit) if offset + limit < len(keys) else None
+
+
+def build_catalog(backend_apis: Dict[str, Dict[str, str]], database_schemas: Dict[str, Dict[str, str]],
+                  spec_paths: Sequence[str] = ()) -> BackendCatalog:
+    """
+    Build the catalog from spec files when any are configured, otherwise from
+    the built-in sample tables ({"resource": {"METHOD /path": summary}} and
+    {"table": {"field": type}}).
+    """
+    catalog = BackendCatalog()
+    if spec_paths:
+        catalog.load_paths(spec_paths)
+        return catalog
+    for resource, endpoints in backend_apis.items():
+        for key, summary in endpoints.items():
+            method, _, path = key.partition(" ")
+            catalog.add_endpoint(resource, method, path, summary)
+    for name, fields in database_schemas.items():
+        catalog.add_schema(name, dict(fields))
+    return catalog
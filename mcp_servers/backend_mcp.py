@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import Optional, Dict, List
 import json
 
+from mcp_servers.backend_catalog import (
+    DEFAULT_PAGE_SIZE, ENDPOINT_FIELDS, MAX_PAGE_SIZE, SCHEMA_FIELDS, SPEC_PATHS, build_catalog,
+)
+from mcp_servers.doc_index import fit_context
+from mcp_servers.responses import json_response
+from mcp_servers.search import search_index
+from mcp_servers.semantic import semantic_index
+
 router = APIRouter()
 
-# Sample backend API endpoints data
+# Sample backend API endpoints data, served when no MCP_BACKEND_SPECS are configured
 backend_apis = {
     "users": {
         "GET /api/users": "List all users in the system",
@@ -58,14 +66,37 @@ database_schemas = {
     }
 }
 
-@router.get("/context")
-async def get_backend_context(
-    resource: Optional[str] = Query(None, description="Backend resource name (users, products, orders)"),
-    endpoint: Optional[str] = Query(None, description="API endpoint"),
-    schema: Optional[str] = Query(None, description="Database schema name")
-):
+# Indexed endpoints and tables, from the spec files or the samples above
+catalog = build_catalog(backend_apis, database_schemas, SPEC_PATHS)
+
+# Bumped whenever the catalog changes so precomputed responses are re-rendered
+catalog_version = 0
+
+def invalidate_catalog():
     """
-    Get context information about backend APIs or database schemas.
+    Call after mutating backend_apis or database_schemas, or after the spec
+    files have changed: rebuilds the catalog, its indexes and its entries in
+    the search indexes.
+    """
+    global catalog, catalog_version
+    catalog = build_catalog(backend_apis, database_schemas, SPEC_PATHS)
+    catalog_version += 1
+    documents = list(search_documents())
+    search_index.replace_group(__name__, documents)
+    semantic_index.replace_group(__name__, documents)
+
+def search_documents():
+    """
+    Yield (library, symbol, text) tuples for the cross-library search index.
+    """
+    for ep in catalog.endpoints:
+        yield "backend", f"{ep['method']} {ep['path']}", f"{ep['summary']} ({ep['resource']})"
+    for schema, fields in catalog.schemas.items():
+        yield "backend", f"{schema} schema", "\n".join(f"{field}: {data_type}" for field, data_type in fields.items())
+
+def backend_context(resource=None, endpoint=None, schema=None):
+    """
+    Build context information about backend APIs or database schemas.
     """
     context = {
         "library": "backend",
@@ -73,52 +104,121 @@ async def get_backend_context(
     
     # If resource and endpoint are specified, provide API details
     if resource and endpoint:
-        if resource in backend_apis and endpoint in backend_apis[resource]:
+        endpoint_info = catalog.endpoint(endpoint)
+        if endpoint_info and endpoint_info["resource"] == resource:
             context["resource"] = resource
             context["endpoint"] = endpoint
-            endpoint_info = backend_apis[resource][endpoint]
-            context["documentation"] = f"\n# {endpoint} ({resource})\n\n{endpoint_info}\n"
+            context["documentation"] = f"\n# {endpoint} ({resource})\n\n{endpoint_info['summary']}\n"
             return {"context": context}
     
     # If only resource is specified, list all endpoints for that resource
     if resource and not endpoint:
-        if resource in backend_apis:
+        endpoints = catalog.resource_endpoints(resource)
+        if endpoints:
             context["resource"] = resource
-            context["documentation"] = f"\n# {resource.capitalize()} API Endpoints\n\n"
-            for ep, desc in backend_apis[resource].items():
-                context["documentation"] += f"- {ep}: {desc}\n"
+            lines = [f"\n# {resource.capitalize()} API Endpoints\n\n"]
+            lines.extend(f"- {ep['method']} {ep['path']}: {ep['summary']}\n" for ep in endpoints)
+            context["documentation"] = "".join(lines)
             return {"context": context}
     
     # If schema is specified, provide schema details
     if schema:
-        if schema in database_schemas:
+        if schema in catalog.schemas:
             context["schema"] = schema
-            context["documentation"] = f"\n# {schema.capitalize()} Schema\n\n"
-            for field, data_type in database_schemas[schema].items():
-                context["documentation"] += f"- {field}: {data_type}\n"
+            lines = [f"\n# {schema.capitalize()} Schema\n\n"]
+            lines.extend(f"- {field}: {data_type}\n" for field, data_type in catalog.schemas[schema].items())
+            context["documentation"] = "".join(lines)
             return {"context": context}
     
     # If nothing specific is requested, provide overview of available resources
-    context["documentation"] = "\n# Backend Resources\n\n## API Resources\n"
-    for res in backend_apis.keys():
-        context["documentation"] += f"- {res}\n"
+    lines = ["\n# Backend Resources\n\n## API Resources\n"]
+    lines.extend(f"- {res}\n" for res in catalog.resources())
     
-    context["documentation"] += "\n## Database Schemas\n"
-    for schema in database_schemas.keys():
-        context["documentation"] += f"- {schema}\n"
+    lines.append("\n## Database Schemas\n")
+    lines.extend(f"- {schema}\n" for schema in catalog.schemas)
+    context["documentation"] = "".join(lines)
     
     return {"context": context}
 
+@router.get("/context")
+async def get_backend_context(
+    request: Request,
+    resource: Optional[str] = Query(None, description="Backend resource name (users, products, orders)"),
+    endpoint: Optional[str] = Query(None, description="API endpoint"),
+    schema: Optional[str] = Query(None, description="Database schema name"),
+    max_tokens: Optional[int] = Query(None, ge=1, description="Approximate token budget for the documentation"),
+    max_chars: Optional[int] = Query(None, ge=1, description="Character budget for the documentation"),
+):
+    """
+    Get context information about backend APIs or database schemas.
+    """
+    query = " ".join(filter(None, (resource, endpoint, schema)))
+    return json_response(
+        request,
+        key=("backend/context", catalog_version, resource, endpoint, schema, max_tokens, max_chars),
+        build=lambda: fit_context(backend_context(resource, endpoint, schema), query, max_tokens, max_chars),
+    )
+
+def parse_fields(fields: Optional[str], allowed) -> Optional[tuple]:
+    if not fields:
+        return None
+    requested = tuple(field.strip() for field in fields.split(",") if field.strip())
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(unknown)}; choose from {', '.join(allowed)}")
+    return requested
+
+def paged(build):
+    try:
+        return build()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/apis")
-async def list_apis():
+async def list_apis(
+    request: Request,
+    resource: Optional[str] = Query(None, description="Only endpoints of this resource"),
+    method: Optional[str] = Query(None, description="Only endpoints with this HTTP method"),
+    path: Optional[str] = Query(None, description="Only endpoints with this path template, e.g. /api/users/{id}"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return: resource, method, path, summary"),
+):
     """
-    List all available backend API endpoints.
+    List backend API endpoints, one page at a time.
     """
-    return {"apis": backend_apis}
+    projection = parse_fields(fields, ENDPOINT_FIELDS)
+
+    def build():
+        apis, next_cursor = catalog.list_endpoints(resource, method, path, cursor, limit, projection)
+        return {"apis": apis, "next_cursor": next_cursor}
+
+    return json_response(
+        request,
+        key=("backend/apis", catalog_version, resource, method, path, cursor, limit, projection),
+        build=lambda: paged(build),
+    )
 
 @router.get("/schemas")
-async def list_schemas():
+async def list_schemas(
+    request: Request,
+    field: Optional[str] = Query(None, description="Only tables with this field, e.g. user_id"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return: name, fields"),
+):
     """
-    List all available database schemas.
+    List database schemas, one page at a time.
     """
-    return {"schemas": database_schemas} 
\ No newline at end of file
+    projection = parse_fields(fields, SCHEMA_FIELDS)
+
+    def build():
+        schemas, next_cursor = catalog.list_schemas(field, cursor, limit, projection)
+        return {"schemas": schemas, "next_cursor": next_cursor}
+
+    return json_response(
+        request,
+        key=("backend/schemas", catalog_version, field, cursor, limit, projection),
+        build=lambda: paged(build),
+    )
+ 
\ No newline at end of file
@@ -0,0 +1,85 @@
+import asyncio
+import os
+from fastapi import APIRouter, Request
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from mcp_servers import registry
+from mcp_servers.admission import Overloaded
+from mcp_servers.doc_index import fit_context
+from mcp_servers.responses import json_response
+
+router = APIRouter()
+
+MAX_BATCH_ITEMS = int(os.environ.get("MCP_MAX_BATCH_ITEMS", "100"))
+
+class BatchItem(BaseModel):
+    library: str = Field(..., description="openai, firebase, aws, openai-agents, frontend or backend")
+    language: Optional[str] = None
+    function: Optional[str] = None
+    # Backend resource queries
+    resource: Optional[str] = None
+    endpoint: Optional[str] = None
+    schema_name: Optional[str] = Field(None, alias="schema")
+    # Frontend resource queries
+    component: Optional[str] = None
+    page: Optional[str] = None
+    # Documentation budget, as on the /context endpoints
+    max_tokens: Optional[int] = Field(None, ge=1)
+    max_chars: Optional[int] = Field(None, ge=1)
+
+    model_config = {"populate_by_name": True}
+
+    def key(self):
+        return (self.library, self.language, self.function, self.resource,
+                self.endpoint, self.schema_name, self.component, self.page,
+                self.max_tokens, self.max_chars)
+
+class BatchRequest(BaseModel):
+    items: List[BatchItem] = Field(..., max_length=MAX_BATCH_ITEMS)
+
+async def resolve_item(item: BatchItem):
+    """
+    Resolve one batch item to the same payload its GET endpoint would return.
+    """
+    # Library names and aliases come from the registry; the router is imported on first use
+    build = registry.context_builder(item.library)
+    if build is None:
+        raise ValueError(f"Unknown library: {item.library}")
+    if item.library == "backend":
+        query = " ".join(filter(None, (item.resource, item.endpoint, item.schema_name)))
+        return fit_context(build(item.resource, item.endpoint, item.schema_name), query, item.max_tokens, item.max_chars)
+    if item.library == "frontend":
+        query = item.component or item.page or ""
+        return fit_context(build(item.component, item.page), query, item.max_tokens, item.max_chars)
+
+    if not item.language or not item.function:
+        raise ValueError("language and function are required")
+    result = build(item.language, item.function, item.max_tokens, item.max_chars)
+    if asyncio.iscoroutine(result):
+        result = await result
+    return result
+
+async def _settle(item: BatchItem):
+    try:
+        return {"status": "ok", **await resolve_item(item)}
+    except Overloaded as e:
+        return {"status": "error", "error": e.detail, "retry_after": e.retry_after}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+@router.post("/batch")
+async def batch_context(batch: BatchRequest, request: Request):
+    """
+    Resolve many context queries in one round trip. Identical items are resolved
+    once, distinct items concurrently, and results are returned in request order.
+    """
+    unique = {}
+    for item in batch.items:
+        unique.setdefault(item.key(), item)
+
+    keys = list(unique)
+    settled = await asyncio.gather(*(_settle(unique[key]) for key in keys))
+    by_key = dict(zip(keys, settled))
+
+    return json_response(request, {"results": [by_key[item.key()] for item in batch.items]})
@@ -0,0 +1,59 @@
+import time
+
+
+class CircuitBreaker:
+    """
+    Stop calling an upstream that keeps failing.
+
+    The breaker opens after `threshold` consecutive failures and rejects calls
+    for `reset_timeout` seconds. It then lets a single probe through
+    (half-open): a success closes it again, a failure reopens it for another
+    `reset_timeout`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """
+        Return True if a call may go ahead. In the half-open state only the
+        first caller (the probe) is let through.
+        """
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        # A probe that never reported back (e.g. was cancelled) is replaced
+        # once it has been outstanding for reset_timeout as well
+        if now - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self.opened_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def abandon(self):
+        """
+        Forget a call that ended without an outcome (e.g. was cancelled). An
+        abandoned probe lets the next call probe at once.
+        """
+        if self.state == self.HALF_OPEN:
+            self.opened_at = time.monotonic() - self.reset_timeout
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
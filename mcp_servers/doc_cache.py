@@ -0,0 +1,127 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from mcp_servers.singleflight import SingleFlight
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with TTL, LRU eviction and stale-while-revalidate.
+
+    Entries younger than `ttl` are served as-is. Entries older than `ttl` but
+    within `ttl + stale_ttl` are still served from memory while a single
+    background task reloads them. Anything older is treated as a miss.
+    Concurrent misses and refreshes for the same key share one load.
+    """
+
+    def __init__(self, name: str, maxsize: int = 256, ttl: float = 300.0, stale_ttl: float = 3600.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._refreshing = set()
+        self._tasks = set()
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return a fresh or stale value without triggering a load, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.monotonic() - stored_at >= self.ttl + self.stale_ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for key, loading it with `loader` on a miss.
+        A None result from the loader is returned but never cached.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._schedule_refresh(key, loader)
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        return await self._flights.do(key, lambda: self._load(key, loader))
+
+    async def _load(self, key, loader):
+        value = await loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key, loader):
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, loader))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key, loader):
+        try:
+            value = await self._flights.do(key, lambda: self._load(key, loader))
+            if value is not None:
+                self.refreshes += 1
+        except Exception as e:
+            print(f"Error refreshing {self.name} cache entry {key}: {str(e)}")
+        finally:
+            self._refreshing.discard(key)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "coalesced": self._flights.shared,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,202 @@
+import re
+import textwrap
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# Identifiers, optionally dotted (e.g. "runner.run_sync")
+TOKEN_RE = re.compile(r"[a-z0-9_]+(?:\.[a-z0-9_]+)*")
+SECTION_SPLIT_RE = re.compile(r"\n##\s+")
+# Split before a "## " heading, keeping the heading with its section
+SECTION_HEAD_RE = re.compile(r"\n(?=##\s)")
+# Words and punctuation marks, each roughly one LLM token
+WORD_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+# Characters added between sections when a budgeted document is reassembled
+SECTION_SEPARATOR = "\n\n"
+
+
+def split_sections(text: str) -> List[str]:
+    """
+    Split markdown into its "## " sections, for sending a document piece by piece.
+    """
+    # Dedent so the indented built-in docs split on their "## " headings too
+    return [part.strip() for part in SECTION_HEAD_RE.split(textwrap.dedent(text)) if part.strip()]
+
+
+def count_tokens(text: str) -> int:
+    """
+    Approximate the number of LLM tokens in text by counting words and punctuation.
+    """
+    return len(WORD_PIECE_RE.findall(text))
+
+
+def truncate(text: str, max_tokens: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+    """
+    Cut text to at most max_tokens tokens and max_chars characters.
+    """
+    if max_tokens is not None:
+        for count, match in enumerate(WORD_PIECE_RE.finditer(text), 1):
+            if count == max_tokens:
+                text = text[:match.end()]
+                break
+    if max_chars is not None and len(text) > max_chars:
+        cut = text[:max_chars]
+        # Avoid ending on half a word when there is an earlier break
+        if not text[max_chars].isspace() and re.search(r"\s", cut):
+            cut = re.sub(r"\S*$", "", cut)
+        text = cut
+    return text.rstrip()
+
+
+def singular(word: str) -> str:
+    if len(word) > 3 and word.endswith("s"):
+        return word[:-1]
+    return word
+
+
+def token_keys(token: str) -> List[str]:
+    """
+    Lookup keys for a lowercase token: the token itself, its dotted parts and
+    their singular forms, so "Handoff" resolves a "Handoffs" section.
+    """
+    keys = [token]
+    if "." in token:
+        keys.extend(part for part in token.split(".") if part)
+    return keys + [singular(key) for key in keys if singular(key) != key]
+
+
+class Section:
+    __slots__ = ("heading", "text", "tokens")
+
+    def __init__(self, heading: str, text: str):
+        self.heading = heading
+        self.text = text
+        # Counted once at indexing time so budgeting a response is arithmetic
+        self.tokens = count_tokens(text)
+
+
+class SectionIndex:
+    """
+    A documentation page parsed once into sections, with lookups by heading
+    and by lowercase token so resolving a symbol is a dictionary lookup.
+    """
+
+    def __init__(self, sections: List[Section], text: str):
+        self.sections = sections
+        self.text = text
+        self.headings: Dict[str, int] = {}
+        self.tokens: Dict[str, List[int]] = {}
+        self.token_count = sum(section.tokens for section in sections)
+
+        for i, section in enumerate(sections):
+            if section.heading:
+                self.headings.setdefault(section.heading.lower(), i)
+            for token in set(TOKEN_RE.findall(section.text.lower())):
+                for key in token_keys(token):
+                    ids = self.tokens.setdefault(key, [])
+                    if not ids or ids[-1] != i:
+                        ids.append(i)
+
+    @classmethod
+    def from_markdown(cls, text: str) -> "SectionIndex":
+        sections = []
+        for part in SECTION_SPLIT_RE.split(text):
+            part = part.strip()
+            if not part:
+                continue
+            heading = part.split("\n", 1)[0].strip()
+            sections.append(Section(heading, f"## {part}"))
+        return cls(sections, text.strip())
+
+    @classmethod
+    def from_document(cls, text: str) -> "SectionIndex":
+        """
+        Index a document as-is, keeping any text before its first "## " heading
+        as a section of its own.
+        """
+        sections = []
+        for part in split_sections(text):
+            heading = part.split("\n", 1)[0].strip().lstrip("#").strip()
+            sections.append(Section(heading, part))
+        return cls(sections, text.strip())
+
+    def find(self, name: str) -> Optional[Section]:
+        """
+        Return the section documenting `name`: an exact heading match first,
+        otherwise the first section mentioning it.
+        """
+        query = name.strip().lower()
+        if query in self.headings:
+            return self.sections[self.headings[query]]
+        for key in (query, singular(query)):
+            ids = self.tokens.get(key)
+            if ids:
+                return self.sections[ids[0]]
+        return None
+
+    def rank(self, query: str) -> List[int]:
+        """
+        Return section positions, most relevant to query first: sections whose
+        heading is the query, then by how many of the query's tokens they
+        mention, ties keeping document order.
+        """
+        scores = [0] * len(self.sections)
+        heading = self.headings.get(query.strip().lower())
+        if heading is not None:
+            scores[heading] += len(self.sections)
+        keys = {key for token in TOKEN_RE.findall(query.lower()) for key in token_keys(token)}
+        for key in keys:
+            for i in self.tokens.get(key, ()):
+                scores[i] += 1
+        return sorted(range(len(self.sections)), key=lambda i: -scores[i])
+
+    def budgeted(self, query: str, max_tokens: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+        """
+        Return the sections most relevant to query that fit within max_tokens
+        and max_chars, in document order. If even the most relevant section
+        does not fit, it is truncated to the budget.
+        """
+        chosen = []
+        tokens = chars = 0
+        for i in self.rank(query):
+            section = self.sections[i]
+            extra = len(SECTION_SEPARATOR) if chosen else 0
+            if ((max_tokens is None or tokens + section.tokens <= max_tokens)
+                    and (max_chars is None or chars + extra + len(section.text) <= max_chars)):
+                chosen.append(i)
+                tokens += section.tokens
+                chars += extra + len(section.text)
+        if not chosen:
+            return truncate(self.sections[self.rank(query)[0]].text, max_tokens, max_chars) if self.sections else ""
+        return SECTION_SEPARATOR.join(self.sections[i].text for i in sorted(chosen))
+
+
+@lru_cache(maxsize=1024)
+def document_index(text: str) -> SectionIndex:
+    # Documents are long-lived strings, so each is split and counted once.
+    # Dedent so the indented built-in docs split on their "## " headings too
+    return SectionIndex.from_document(textwrap.dedent(text))
+
+
+def fit_to_budget(text: str, query: str, max_tokens: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+    """
+    Reduce a document to its sections most relevant to query within the given
+    token and character budgets; the document is returned unchanged without one.
+    """
+    if max_tokens is None and max_chars is None:
+        return text
+    index = document_index(text)
+    if (max_tokens is None or index.token_count <= max_tokens) and (
+            max_chars is None or len(text) <= max_chars):
+        return text
+    return index.budgeted(query, max_tokens, max_chars)
+
+
+def fit_context(payload: dict, query: str, max_tokens: Optional[int] = None, max_chars: Optional[int] = None) -> dict:
+    """
+    Return a {"context": {...}} payload with its documentation fitted to the budget.
+    """
+    if max_tokens is None and max_chars is None:
+        return payload
+    context = dict(payload["context"])
+    context["documentation"] = fit_to_budget(context["documentation"], query, max_tokens, max_chars)
+    return {**payload, "context": context}
@@ -1,82 +1,116 @@
-from fastapi import APIRouter, Query
-import requests
+from fastapi import APIRouter, Query, Request
+from typing import Optional
 import json
 
+from mcp_servers.doc_index import fit_to_budget
+from mcp_servers.metrics import record_resolution
+from mcp_servers.resolver import EXACT, FALLBACK, FUZZY, SymbolResolver
+from mcp_servers.responses import json_response
+from mcp_servers.search_mcp import nearest_document
+from mcp_servers.snapshot import get_snapshot
+
 router = APIRouter()
 
-def fetch_firebase_docs(function_name):
-    # Extract specific function if format like "firebase.auth.signIn"
-    if function_name.startswith("firebase."):
-        function_name = function_name[9:]  # Remove "firebase." prefix
+# Mock documentation for different Firebase functions
+mock_docs = {
+    "auth.signIn": """
+    # firebase.auth.signIn
     
-    # Mock documentation for different Firebase functions
-    mock_docs = {
-        "auth.signIn": """
-        # firebase.auth.signIn
-        
-        Signs in a user with the provided email and password.
-        
-        ## Parameters:
-        - email (string): Required. The user's email address.
-        - password (string): Required. The user's password.
-        
-        ## Returns:
-        - UserCredential: Contains an access token and information about the user.
-        
-        ## Example:
-        ```javascript
-        import { getAuth, signInWithEmailAndPassword } from "firebase/auth";
-        
-        const auth = getAuth();
-        signInWithEmailAndPassword(auth, email, password)
-          .then((userCredential) => {
-            // Signed in 
-            const user = userCredential.user;
-            // ...
-          })
-          .catch((error) => {
-            const errorCode = error.code;
-            const errorMessage = error.message;
-          });
-        ```
-        """,
-        "firestore.collection": """
-        # firebase.firestore.collection
-        
-        Gets a CollectionReference instance that refers to the collection at the specified path.
-        
-        ## Parameters:
-        - path (string): Required. Path to the collection.
-        
-        ## Returns:
-        - CollectionReference: A reference to the collection.
-        
-        ## Example:
-        ```javascript
-        import { collection, getDocs } from "firebase/firestore";
-        
-        const querySnapshot = await getDocs(collection(db, "cities"));
-        querySnapshot.forEach((doc) => {
-          console.log(`${doc.id} => ${doc.data()}`);
-        });
-        ```
-        """
-    }
+    Signs in a user with the provided email and password.
+    
+    ## Parameters:
+    - email (string): Required. The user's email address.
+    - password (string): Required. The user's password.
+    
+    ## Returns:
+    - UserCredential: Contains an access token and information about the user.
+    
+    ## Example:
+    ```javascript
+    import { getAuth, signInWithEmailAndPassword } from "firebase/auth";
+    
+    const auth = getAuth();
+    signInWithEmailAndPassword(auth, email, password)
+      .then((userCredential) => {
+        // Signed in 
+        const user = userCredential.user;
+        // ...
+      })
+      .catch((error) => {
+        const errorCode = error.code;
+        const errorMessage = error.message;
+      });
+    ```
+    """,
+    "firestore.collection": """
+    # firebase.firestore.collection
+    
+    Gets a CollectionReference instance that refers to the collection at the specified path.
+    
+    ## Parameters:
+    - path (string): Required. Path to the collection.
+    
+    ## Returns:
+    - CollectionReference: A reference to the collection.
+    
+    ## Example:
+    ```javascript
+    import { collection, getDocs } from "firebase/firestore";
+    
+    const querySnapshot = await getDocs(collection(db, "cities"));
+    querySnapshot.forEach((doc) => {
+      console.log(`${doc.id} => ${doc.data()}`);
+    });
+    ```
+    """
+}
+
+# Built once at import time and shared by every request
+resolver = SymbolResolver(("firebase.",), mock_docs)
+
+def resolve_firebase_docs(function_name):
+    """
+    Resolve a function name to (outcome, documentation).
+    """
+    # Extract specific function if format like "firebase.auth.signIn"
+    function_name = resolver.strip_prefix(function_name)
     
     # If function is in our mock data, return it
-    for key in mock_docs:
-        if key.lower() in function_name.lower():
-            return mock_docs[key]
+    match = resolver.resolve(function_name)
+    if match:
+        record_resolution("firebase", match.kind)
+        return match.kind, match.value
+    
+    # Then any documentation ingested into the offline snapshot
+    snapshot = get_snapshot()
+    if snapshot:
+        doc = snapshot.doc("firebase", function_name)
+        if doc:
+            record_resolution("firebase", EXACT)
+            return EXACT, doc
+    
+    # Otherwise the closest documented symbol, e.g. "auth.signIn" for "auth.signInWithEmailAndPassword"
+    nearest = nearest_document("firebase", function_name)
+    if nearest:
+        record_resolution("firebase", FUZZY)
+        return FUZZY, nearest.text
     
     # Default fallback
-    return f"Documentation for {function_name} not found. Please check the Firebase documentation at https://firebase.google.com/docs/reference"
+    record_resolution("firebase", FALLBACK)
+    return FALLBACK, f"Documentation for {function_name} not found. Please check the Firebase documentation at https://firebase.google.com/docs/reference"
 
-@router.get("/firebase/context")
-async def firebase_mcp_context(
-    language: str = Query(...),
-    function: str = Query(...)
-):
-    doc_snippet = fetch_firebase_docs(function)
+def fetch_firebase_docs(function_name):
+    return resolve_firebase_docs(function_name)[1]
+
+def search_documents():
+    """
+    Yield (library, symbol, text) tuples for the cross-library search index.
+    """
+    for symbol, doc in mock_docs.items():
+        yield "firebase", symbol, doc
+
+def firebase_context(language, function, max_tokens=None, max_chars=None):
+    doc_snippet = fit_to_budget(fetch_firebase_docs(function), function, max_tokens, max_chars)
     
     return {
         "context": {
@@ -85,4 +119,16 @@ async def firebase_mcp_context(
             "function": function,
             "documentation": doc_snippet
         }
-    } 
\ No newline at end of file
+    }
+
+@router.get("/firebase/context")
+async def firebase_mcp_context(
+    request: Request,
+    language: str = Query(...),
+    function: str = Query(...),
+    max_tokens: Optional[int] = Query(None, ge=1, description="Approximate token budget for the documentation"),
+    max_chars: Optional[int] = Query(None, ge=1, description="Character budget for the documentation"),
+):
+    # Resolving is a few hash lookups; the encoded payload is what gets cached
+    payload = firebase_context(language, function, max_tokens, max_chars)
+    return json_response(request, key=("firebase", language, function, max_tokens, max_chars), build=lambda: payload)
@@ -0,0 +1,456 @@
+"""
+Frontend component and page catalog, indexed from the project's source tree.
+
+Set MCP_FRONTEND_SOURCES to the component directories and every React
+(.jsx/.tsx/.js/.ts), Vue and Svelte file under them is parsed for its
+components: their names, props and doc comments. Files under a pages/, app/,
+routes/ or views/ directory, and components named *Page, are listed as pages.
+
+What each file yielded is kept in a cache file together with the file's
+mtime, size and content hash, so a restarted worker only re-reads the files
+that changed since, and a running worker polls the tree and re-indexes just
+the files that were added, changed or removed.
+
+    MCP_FRONTEND_SOURCES=web/src/components:web/src/pages uvicorn main:app
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# os.pathsep-separated source directories (or single files)
+SOURCE_PATHS = [p for p in os.environ.get("MCP_FRONTEND_SOURCES", "").split(os.pathsep) if p]
+# Seconds between scans of the source tree for changed files; 0 disables watching
+WATCH_INTERVAL = float(os.environ.get("MCP_FRONTEND_WATCH_INTERVAL", "2"))
+INDEX_CACHE_PATH = os.environ.get("MCP_FRONTEND_INDEX_CACHE")
+# Bump when parsing changes so cached results from older versions are discarded
+PARSER_VERSION = 1
+
+SOURCE_EXTENSIONS = (".jsx", ".tsx", ".js", ".ts", ".vue", ".svelte")
+SKIP_DIRS = {"node_modules", "dist", "build", "coverage", "out", "__tests__", "__mocks__"}
+SKIP_SUFFIXES = (".d.ts", ".test.js", ".test.ts", ".test.jsx", ".test.tsx",
+                 ".spec.js", ".spec.ts", ".spec.jsx", ".spec.tsx", ".stories.jsx", ".stories.tsx")
+PAGE_DIRS = {"pages", "app", "routes", "views"}
+
+# Top-level function, arrow/wrapped and class components
+DECLARATION_RE = re.compile(
+    r"^(?:export\s+(?:default\s+)?)?(?:"
+    r"(?:async\s+)?function\s+(?P<function>[A-Z]\w*)\s*(?:<[^>(]*>)?\s*(?=\()"
+    r"|(?:const|let|var)\s+(?P<variable>[A-Z]\w*)\s*(?::\s*(?P<annotation>[^=]+?))?\s*=\s*"
+    r"(?:(?:React\.)?(?:memo|forwardRef)\s*(?:<[^>(]*>)?\s*\(\s*)*(?:async\s+)?(?:function\s*\w*\s*)?(?=\()"
+    r"|class\s+(?P<cls>[A-Z]\w*)\s+extends\s+(?:React\.)?(?:Pure)?Component\b\s*(?:<\s*(?P<class_props>\w+))?"
+    r")",
+    re.MULTILINE,
+)
+PROPS_TYPE_RE = re.compile(r"^(?:export\s+)?(?:interface\s+(\w+)(?:\s+extends\s+[^{]+)?|type\s+(\w+)\s*=)\s*(?=\{)", re.MULTILINE)
+GENERIC_PROPS_RE = re.compile(r"<\s*(\w+)\s*>")
+DOC_COMMENT_RE = re.compile(r"/\*\*((?:(?!\*/).)*)\*/\s*$", re.DOTALL)
+HTML_COMMENT_RE = re.compile(r"^\s*<!--(.*?)-->", re.DOTALL)
+VUE_PROPS_RE = re.compile(r"defineProps\s*(?:<\s*(?=\{)|\(\s*(?=[{\[]))")
+SVELTE_PROP_RE = re.compile(r"^\s*export\s+let\s+(\w+)\s*(?::\s*([^=;\n]+?))?\s*(=|;|$)", re.MULTILINE)
+MEMBER_RE = re.compile(r"^(?:readonly\s+)?['\"]?([A-Za-z_$][\w$]*)['\"]?(\?)?\s*:\s*(.+)$", re.DOTALL)
+
+BRACKETS = {"(": ")", "{": "}", "[": "]", "<": ">"}
+
+
+class Prop(NamedTuple):
+    name: str
+    type: str
+    required: bool
+
+
+class FileEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    components: List[dict]
+
+
+class Changes(NamedTuple):
+    """
+    The result of scanning the source tree: re-parsed files, files whose
+    content is unchanged but whose mtime moved, and files that disappeared.
+    """
+    parsed: Dict[str, FileEntry]
+    touched: Dict[str, FileEntry]
+    removed: List[str]
+
+    def __bool__(self):
+        return bool(self.parsed or self.removed)
+
+
+def _balanced(text: str, start: int) -> Tuple[str, int]:
+    """
+    Return the text inside the bracket at text[start] and the index after its
+    closing bracket, skipping string literals and nested brackets.
+    """
+    closers = [BRACKETS[text[start]]]
+    i = start + 1
+    quote = None
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"`":
+            quote = char
+        elif char == "=" and text[i + 1:i + 2] == ">":
+            i += 1  # "=>" inside a type, not a closing ">"
+        elif char in BRACKETS and (char != "<" or closers[-1] == ">"):
+            closers.append(BRACKETS[char])
+        elif char == closers[-1]:
+            closers.pop()
+            if not closers:
+                return text[start + 1:i], i + 1
+        i += 1
+    return text[start + 1:], len(text)
+
+
+def _split_top_level(text: str, separators: str) -> List[str]:
+    parts, depth, current, quote = [], 0, [], None
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"`":
+            quote = char
+        elif char in "({[<":
+            depth += 1
+        elif char in ")}]>" and depth:
+            depth -= 1
+        elif char in separators and not depth:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+
+def _clean_doc(comment: str) -> str:
+    lines = [re.sub(r"^\s*\*\s?", "", line).rstrip() for line in comment.strip().splitlines()]
+    # Keep the description; @param/@example blocks are tag noise here
+    description = []
+    for line in lines:
+        if line.lstrip().startswith("@"):
+            break
+        description.append(line)
+    return "\n".join(description).strip()
+
+
+def _doc_before(text: str, position: int) -> str:
+    match = DOC_COMMENT_RE.search(text, 0, position)
+    return _clean_doc(match.group(1)) if match else ""
+
+
+def _type_members(body: str) -> List[Prop]:
+    props = []
+    for member in _split_top_level(re.sub(r"/\*.*?\*/|//[^\n]*", "", body, flags=re.DOTALL), ";,\n"):
+        match = MEMBER_RE.match(member)
+        if match:
+            props.append(Prop(match.group(1), " ".join(match.group(3).split()), not match.group(2)))
+    return props
+
+
+def _prop_types(text: str) -> Dict[str, List[Prop]]:
+    """
+    Return the members of every interface and object type alias in a file, by type name.
+    """
+    types = {}
+    for match in PROPS_TYPE_RE.finditer(text):
+        body, _ = _balanced(text, match.end())
+        types[match.group(1) or match.group(2)] = _type_members(body)
+    return types
+
+
+def _destructured(params: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Return the names destructured from a "{ a, b = 1 }: Props" parameter and its type name.
+    """
+    params = params.strip()
+    if not params.startswith("{"):
+        first = _split_top_level(params, ",")[:1]
+        annotation = first[0].partition(":")[2].strip() if first else ""
+        return [], annotation or None
+    body, end = _balanced(params, 0)
+    names = []
+    for part in _split_top_level(body, ","):
+        if part.startswith("..."):
+            continue
+        name = re.match(r"[A-Za-z_$][\w$]*", part)
+        if name:
+            names.append(name.group(0))
+    annotation = params[end:].lstrip()
+    return names, _split_top_level(annotation[1:], ",")[0] if annotation[1:].strip() and annotation.startswith(":") else None
+
+
+def _props_for(name: str, params: str, type_name: Optional[str], types: Dict[str, List[Prop]]) -> List[Prop]:
+    names, annotation = _destructured(params)
+    type_name = type_name or annotation
+    if type_name and type_name.startswith("{"):
+        return _type_members(type_name[1:-1])
+    known = types.get(type_name or "") or types.get(f"{name}Props") or []
+    if not names:
+        return known
+    by_name = {prop.name: prop for prop in known}
+    return [by_name.get(prop) or Prop(prop, "", False) for prop in names]
+
+
+def is_page(path: str, name: str) -> bool:
+    return name.endswith("Page") or bool(PAGE_DIRS.intersection(path.replace("\\", "/").split("/")[:-1]))
+
+
+def _record(name: str, path: str, description: str, props: List[Prop]) -> dict:
+    return {
+        "name": name,
+        "kind": "page" if is_page(path, name) else "component",
+        "description": description,
+        "props": [prop._asdict() for prop in props],
+        "path": path,
+    }
+
+
+def _component_name(path: str) -> str:
+    stem = os.path.basename(path).split(".")[0]
+    if stem.lower() in ("index", "+page", "page"):
+        stem = os.path.basename(os.path.dirname(path)) or stem
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[-_\s+]+", stem) if part)
+
+
+def parse_script(text: str, path: str) -> List[dict]:
+    """
+    Return the components declared at the top level of a JavaScript or TypeScript module.
+    """
+    types = _prop_types(text)
+    components = []
+    for match in DECLARATION_RE.finditer(text):
+        name = match.group("function") or match.group("variable") or match.group("cls")
+        params, type_name = "", None
+        if match.group("cls"):
+            type_name = match.group("class_props")
+        else:
+            params, _ = _balanced(text, match.end())
+            generic = GENERIC_PROPS_RE.search(match.group("annotation") or "")
+            type_name = generic.group(1) if generic else None
+        components.append(_record(name, path, _doc_before(text, match.start()), _props_for(name, params, type_name, types)))
+    return components
+
+
+def parse_vue(text: str, path: str) -> List[dict]:
+    props = []
+    match = VUE_PROPS_RE.search(text)
+    if match:
+        start = match.end()
+        body, _ = _balanced(text, start)
+        if text[start] == "[":
+            props = [Prop(name, "", False) for name in re.findall(r"['\"](\w+)['\"]", body)]
+        elif text[match.start():start].rstrip().endswith("<"):
+            props = _type_members(body)
+        else:
+            for member in _split_top_level(body, ","):
+                key, _, value = member.partition(":")
+                required = re.search(r"required\s*:\s*true", value) is not None
+                kind = re.search(r"type\s*:\s*(\w+)", value)
+                props.append(Prop(key.strip().strip("'\""), (kind.group(1) if kind else value.strip()), required))
+    doc = HTML_COMMENT_RE.match(text) or re.search(r"<script[^>]*>\s*/\*\*(.*?)\*/", text, re.DOTALL)
+    return [_record(_component_name(path), path, _clean_doc(doc.group(1)) if doc else "", props)]
+
+
+def parse_svelte(text: str, path: str) -> List[dict]:
+    props = [Prop(name, (kind or "").strip(), end != "=") for name, kind, end in SVELTE_PROP_RE.findall(text)]
+    doc = HTML_COMMENT_RE.match(text)
+    return [_record(_component_name(path), path, _clean_doc(doc.group(1)) if doc else "", props)]
+
+
+def parse_file(text: str, path: str) -> List[dict]:
+    if path.endswith(".vue"):
+        return parse_vue(text, path)
+    if path.endswith(".svelte"):
+        return parse_svelte(text, path)
+    return parse_script(text, path)
+
+
+def default_cache_path(roots: Sequence[str]) -> str:
+    # One cache file per source configuration, outside the project tree
+    digest = hashlib.sha1(os.pathsep.join(os.path.abspath(root) for root in roots).encode()).hexdigest()[:12]
+    return os.path.join(tempfile.gettempdir(), f"mcp-frontend-index-{digest}.json")
+
+
+class FrontendCatalog:
+    """
+    Components and pages by name, rebuilt per file: each file's components
+    can be replaced or dropped without touching the rest of the catalog.
+    When two files declare the same name, the one with the smaller path wins.
+    """
+
+    def __init__(self, roots: Sequence[str] = (), cache_path: Optional[str] = None):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.cache_path = cache_path
+        self.files: Dict[str, FileEntry] = {}
+        self.components: Dict[str, dict] = {}
+        self.pages: Dict[str, dict] = {}
+        self._definitions: Dict[str, Dict[str, dict]] = {}
+        self.parsed = 0
+
+    # Index maintenance
+
+    def add(self, record: dict, path: str = ""):
+        self._definitions.setdefault(record["name"], {})[path] = record
+        self._settle(record["name"])
+
+    def _settle(self, name: str):
+        self.components.pop(name, None)
+        self.pages.pop(name, None)
+        definitions = self._definitions.get(name)
+        if not definitions:
+            self._definitions.pop(name, None)
+            return
+        record = definitions[min(definitions)]
+        (self.pages if record["kind"] == "page" else self.components)[name] = record
+
+    def _drop(self, path: str):
+        entry = self.files.pop(path, None)
+        for record in entry.components if entry else ():
+            self._definitions.get(record["name"], {}).pop(path, None)
+            self._settle(record["name"])
+
+    def apply(self, changes: Changes):
+        """
+        Swap the components of every changed file into the catalog. Runs on the
+        event loop thread, so readers never see a half-applied scan.
+        """
+        for path in changes.removed:
+            self._drop(path)
+        for path, entry in changes.parsed.items():
+            self._drop(path)
+            self.files[path] = entry
+            for record in entry.components:
+                self.add(record, path)
+        self.files.update(changes.touched)
+
+    # Scanning
+
+    def _walk(self) -> Iterable[Tuple[str, os.stat_result]]:
+        for root in self.roots:
+            if os.path.isfile(root):
+                yield root, os.stat(root)
+                continue
+            for directory, dirs, files in os.walk(root):
+                dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
+                for name in files:
+                    if name.endswith(SOURCE_EXTENSIONS) and not name.endswith(SKIP_SUFFIXES):
+                        path = os.path.join(directory, name)
+                        try:
+                            yield path, os.stat(path)
+                        except OSError:
+                            continue  # removed while walking
+
+    def _relative(self, path: str) -> str:
+        # Relative to the root's parent, so a root named pages/ still marks its files as pages
+        for root in self.roots:
+            if path == root or path.startswith(root + os.sep):
+                return os.path.relpath(path, os.path.dirname(root))
+        return path
+
+    def scan(self) -> Changes:
+        """
+        Compare the source tree with the indexed files and parse only those
+        that were added or whose content changed. Reads but never modifies the
+        catalog, so it can run in a worker thread.
+        """
+        parsed, touched, seen = {}, {}, set()
+        for path, stat in self._walk():
+            seen.add(path)
+            entry = self.files.get(path)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                seen.discard(path)
+                continue
+            digest = hashlib.sha1(data).hexdigest()
+            if entry and entry.digest == digest:
+                touched[path] = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                continue
+            try:
+                components = parse_file(data.decode("utf-8", errors="replace"), self._relative(path))
+            except Exception as e:
+                print(f"Error indexing {path}: {str(e)}")
+                components = []
+            parsed[path] = FileEntry(stat.st_mtime_ns, stat.st_size, digest, components)
+        self.parsed += len(parsed)
+        return Changes(parsed, touched, [path for path in self.files if path not in seen])
+
+    def refresh(self) -> Changes:
+        changes = self.scan()
+        self.apply(changes)
+        if changes or changes.touched:
+            self.save()
+        return changes
+
+    # Persistence
+
+    def load(self):
+        """
+        Index the files recorded in the cache file, as they were at the last scan.
+        """
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading frontend index cache: {str(e)}")
+            return
+        if cached.get("version") != PARSER_VERSION or cached.get("roots") != self.roots:
+            return
+        files = {path: FileEntry(*entry) for path, entry in cached.get("files", {}).items()}
+        self.apply(Changes(files, {}, []))
+
+    def save(self):
+        if not self.cache_path:
+            return
+        payload = {"version": PARSER_VERSION, "roots": self.roots, "files": self.files}
+        try:
+            # Write then rename so a crash never leaves a truncated cache
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(self.cache_path) or ".",
+                                             delete=False) as f:
+                json.dump(payload, f)
+            os.replace(f.name, self.cache_path)
+        except OSError as e:
+            print(f"Error writing frontend index cache: {str(e)}")
+
+    def stats(self) -> dict:
+        return {
+            "files": len(self.files),
+            "components": len(self.components),
+            "pages": len(self.pages),
+            "parsed": self.parsed,
+            "cache": self.cache_path,
+        }
+
+
+def build_catalog(frontend_components: Dict[str, str], frontend_pages: Dict[str, str],
+                  source_paths: Sequence[str] = ()) -> FrontendCatalog:
+    """
+    Build the catalog from the source tree when any sources are configured
+    (starting from the cache file, so only changed files are parsed), otherwise
+    from the built-in sample tables of {"name": description}.
+    """
+    if source_paths:
+        catalog = FrontendCatalog(source_paths, INDEX_CACHE_PATH or default_cache_path(source_paths))
+        catalog.load()
+        catalog.refresh()
+        return catalog
+    catalog = FrontendCatalog()
+    for name, description in frontend_components.items():
+        catalog.add({"name": name, "kind": "component", "description": description, "props": [], "path": ""})
+    for name, description in frontend_pages.items():
+        catalog.add({"name": name, "kind": "page", "description": description, "props": [], "path": ""})
+    return catalog
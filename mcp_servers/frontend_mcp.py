@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Query
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, Query, Request
 from typing import Optional
+import asyncio
 import json
 
+from mcp_servers.doc_index import fit_context
+from mcp_servers.frontend_catalog import SOURCE_PATHS, WATCH_INTERVAL, build_catalog
+from mcp_servers.responses import json_response
+from mcp_servers.search import search_index
+from mcp_servers.semantic import semantic_index
+
 router = APIRouter()
 
-# Sample frontend components data
+# Sample frontend components data, served when no MCP_FRONTEND_SOURCES are configured
 frontend_components = {
     "Button": "A reusable button component with various styles and states.",
     "Card": "A container component for displaying content in a card format.",
@@ -20,13 +28,85 @@ frontend_pages = {
     "Profile": "User profile page with personal information.",
 }
 
-@router.get("/context")
-async def get_frontend_context(
-    component: Optional[str] = Query(None, description="Frontend component name"),
-    page: Optional[str] = Query(None, description="Frontend page name"),
-):
+# Components and pages by name, from the source tree or the samples above
+catalog = build_catalog(frontend_components, frontend_pages, SOURCE_PATHS)
+
+# Bumped whenever the catalog changes so precomputed responses are re-rendered
+catalog_version = 0
+
+def invalidate_catalog():
     """
-    Get context information about frontend components or pages.
+    Call after mutating frontend_components or frontend_pages, or to rescan
+    the whole source tree (files unchanged since the last scan are not re-read).
+    """
+    global catalog
+    catalog = build_catalog(frontend_components, frontend_pages, SOURCE_PATHS)
+    catalog_changed()
+
+def catalog_changed():
+    global catalog_version
+    catalog_version += 1
+    documents = list(search_documents())
+    search_index.replace_group(__name__, documents)
+    semantic_index.replace_group(__name__, documents)
+
+def search_documents():
+    """
+    Yield (library, symbol, text) tuples for the cross-library search index.
+    """
+    for records in (catalog.components, catalog.pages):
+        for name, record in records.items():
+            props = ", ".join(prop["name"] for prop in record["props"])
+            yield "frontend", name, f"{record['description']} Props: {props}" if props else record["description"]
+
+async def watch_sources():
+    """
+    Poll the source tree and re-index the files that changed. Stat-ing and
+    parsing run in a thread; the changes are applied on the event loop.
+    """
+    while True:
+        await asyncio.sleep(WATCH_INTERVAL)
+        current = catalog
+        try:
+            changes = await asyncio.to_thread(current.scan)
+        except Exception as e:
+            print(f"Error scanning frontend sources: {str(e)}")
+            continue
+        if current is not catalog or not (changes or changes.touched):
+            continue
+        current.apply(changes)
+        await asyncio.to_thread(current.save)
+        if changes:
+            catalog_changed()
+
+@asynccontextmanager
+async def lifespan():
+    """
+    Keep the catalog in step with the source tree while the app runs.
+    """
+    task = asyncio.create_task(watch_sources()) if SOURCE_PATHS and WATCH_INTERVAL > 0 else None
+    try:
+        yield
+    finally:
+        if task:
+            task.cancel()
+
+def describe(record: dict) -> str:
+    lines = [f"\n# {record['name']}\n"]
+    if record["description"]:
+        lines.append(f"\n{record['description']}\n")
+    if record["props"]:
+        lines.append("\n## Props\n\n")
+        for prop in record["props"]:
+            details = ", ".join(filter(None, (prop["type"], "required" if prop["required"] else "optional")))
+            lines.append(f"- {prop['name']}: {details}\n")
+    if record["path"]:
+        lines.append(f"\nDefined in `{record['path']}`\n")
+    return "".join(lines)
+
+def frontend_context(component=None, page=None):
+    """
+    Build context information about frontend components or pages.
     """
     context = {
         "library": "frontend",
@@ -34,39 +114,69 @@ async def get_frontend_context(
     
     # If component is specified, provide component details
     if component:
-        component_info = frontend_components.get(component, "Component not found")
+        record = catalog.components.get(component)
         context["component"] = component
-        context["documentation"] = f"\n# {component}\n\n{component_info}\n"
+        context["documentation"] = describe(record) if record else f"\n# {component}\n\nComponent not found\n"
         return {"context": context}
     
     # If page is specified, provide page details
     if page:
-        page_info = frontend_pages.get(page, "Page not found")
+        record = catalog.pages.get(page)
         context["page"] = page
-        context["documentation"] = f"\n# {page}\n\n{page_info}\n"
+        context["documentation"] = describe(record) if record else f"\n# {page}\n\nPage not found\n"
         return {"context": context}
     
     # If neither is specified, provide list of available components and pages
-    context["documentation"] = "\n# Frontend Resources\n\n## Components\n"
-    for comp, desc in frontend_components.items():
-        context["documentation"] += f"- {comp}: {desc}\n"
+    lines = ["\n# Frontend Resources\n\n## Components\n"]
+    lines.extend(f"- {comp}: {catalog.components[comp]['description']}\n" for comp in catalog.components)
     
-    context["documentation"] += "\n## Pages\n"
-    for p, desc in frontend_pages.items():
-        context["documentation"] += f"- {p}: {desc}\n"
+    lines.append("\n## Pages\n")
+    lines.extend(f"- {p}: {catalog.pages[p]['description']}\n" for p in catalog.pages)
+    context["documentation"] = "".join(lines)
     
     return {"context": context}
 
+@router.get("/context")
+async def get_frontend_context(
+    request: Request,
+    component: Optional[str] = Query(None, description="Frontend component name"),
+    page: Optional[str] = Query(None, description="Frontend page name"),
+    max_tokens: Optional[int] = Query(None, ge=1, description="Approximate token budget for the documentation"),
+    max_chars: Optional[int] = Query(None, ge=1, description="Character budget for the documentation"),
+):
+    """
+    Get context information about frontend components or pages.
+    """
+    return json_response(
+        request,
+        key=("frontend/context", catalog_version, component, page, max_tokens, max_chars),
+        build=lambda: fit_context(frontend_context(component, page), component or page or "", max_tokens, max_chars),
+    )
+
 @router.get("/components")
-async def list_components():
+async def list_components(request: Request):
     """
     List all available frontend components.
     """
-    return {"components": frontend_components}
+    return json_response(
+        request, key=("frontend/components", catalog_version),
+        build=lambda: {"components": {name: catalog.components[name]["description"] for name in catalog.components}},
+    )
 
 @router.get("/pages")
-async def list_pages():
+async def list_pages(request: Request):
     """
     List all available frontend pages.
     """
-    return {"pages": frontend_pages} 
\ No newline at end of file
+    return json_response(
+        request, key=("frontend/pages", catalog_version),
+        build=lambda: {"pages": {name: catalog.pages[name]["description"] for name in catalog.pages}},
+    )
+
+@router.get("/index")
+async def index_stats():
+    """
+    Report how many source files, components and pages are indexed.
+    """
+    return catalog.stats()
+ 
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Hedged documentation lookups using the "fallbackEndpoint" declared in mcp.json.
+
+The primary server's resolver gets a head start of MCP_HEDGE_DELAY seconds.
+If it has not produced a good answer by then (or gives up early), the
+fallback server's resolver runs alongside it and the first good answer wins;
+only the primary's outcome is recorded in the resolution metrics.
+An answer is good unless its outcome is FALLBACK ("not found"); when neither
+server finds anything, the primary's answer is returned. A primary turned
+away by admission control is not answered for by the fallback's "not found".
+"""
+import asyncio
+import os
+from typing import Any, Optional, Tuple
+
+from mcp_servers import registry
+from mcp_servers.admission import Overloaded
+from mcp_servers.metrics import recording_resolutions
+from mcp_servers.resolver import FALLBACK
+
+HEDGE_DELAY = float(os.environ.get("MCP_HEDGE_DELAY", "0.5"))
+
+# Losing lookups are left to finish so the pages they fetch still reach the caches
+_background = set()
+
+
+def _finished(task: "asyncio.Task"):
+    _background.discard(task)
+    if not task.cancelled():
+        # Mark a failure retrieved; nobody is waiting for the loser
+        task.exception()
+
+
+async def _resolve(server: dict, function_name: str) -> Tuple[str, Any]:
+    result = registry.resolver(server)(function_name)
+    if asyncio.iscoroutine(result):
+        result = await result
+    return result
+
+
+def _good(task: "asyncio.Task") -> bool:
+    return not task.cancelled() and task.exception() is None and task.result()[0] != FALLBACK
+
+
+async def hedged_resolve(server_id: str, function_name: str, delay: Optional[float] = None) -> Tuple[str, str, Any]:
+    """
+    Resolve function_name on the given server, hedging with its fallback server.
+    Returns (source server id, outcome, documentation).
+    """
+    server = registry.server(server_id)
+    fallback = registry.fallback_for(server)
+    primary = asyncio.ensure_future(_resolve(server, function_name))
+    if fallback is None:
+        return (server_id,) + await primary
+
+    delay = HEDGE_DELAY if delay is None else delay
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done and _good(primary):
+        return (server_id,) + primary.result()
+
+    # The task copies the context, so the fallback's lookup is not counted as its own
+    token = recording_resolutions.set(False)
+    try:
+        secondary = asyncio.ensure_future(_resolve(fallback, function_name))
+    finally:
+        recording_resolutions.reset(token)
+    sources = {primary: server_id, secondary: fallback["id"]}
+    pending = {primary, secondary}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in (primary, secondary):
+                if task in done and _good(task):
+                    return (sources[task],) + task.result()
+    finally:
+        for task in pending:
+            _background.add(task)
+            task.add_done_callback(_finished)
+    # Neither found the function; the primary's answer stands unless it failed
+    # (other than by being turned away, which the caller should retry)
+    failure = primary.exception()
+    if failure is not None and not isinstance(failure, Overloaded) and secondary.exception() is None:
+        return (fallback["id"],) + secondary.result()
+    return (server_id,) + primary.result()
@@ -0,0 +1,164 @@
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, List, Optional
+
+HEADING_TAGS = ("h1", "h2", "h3")
+LIST_TAGS = ("ul", "ol")
+SKIP_TAGS = ("script", "style", "template")
+# Block-level tags that implicitly close an open <p>
+P_CLOSERS = ("p", "ul", "ol", "pre", "div", "table", "blockquote", "section", "h1", "h2", "h3", "h4", "h5", "h6")
+
+
+class DocsExtractor(HTMLParser):
+    """
+    Single-pass, event-driven extractor turning a documentation page into
+    markdown-like blocks (headings, paragraphs, code and list items).
+
+    Only the first <main> or <div class="markdown-body"> is read, or the whole
+    document with whole_page=True. Feed it HTML in chunks and drain the
+    finished blocks as they appear; memory is bounded by the block being built
+    plus any blocks not yet drained. Each list item is emitted exactly once,
+    and inline <code> stays part of its paragraph.
+    """
+
+    def __init__(self, whole_page: bool = False):
+        super().__init__(convert_charrefs=True)
+        self._blocks: List[str] = []
+        # Read the whole document as if inside an <html> that never closes
+        self._container: Optional[str] = "html" if whole_page else None
+        self._container_depth = 2 if whole_page else 0
+        self._done = False
+        self._skip_depth = 0
+        self._list_depth = 0
+        # Element currently being captured, its nesting depth and text so far
+        self._capture: Optional[str] = None
+        self._capture_depth = 0
+        self._text: List[str] = []
+
+    def drain(self) -> List[str]:
+        blocks, self._blocks = self._blocks, []
+        return blocks
+
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if self._container is None:
+            if tag == "main" or (tag == "div" and "markdown-body" in (dict(attrs).get("class") or "").split()):
+                self._container = tag
+                self._container_depth = 1
+            return
+        if tag == self._container:
+            self._container_depth += 1
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+            return
+
+        if self._capture == "p" and tag in P_CLOSERS:
+            self._flush()
+        if self._capture is not None:
+            if tag == self._capture == "li":
+                # </li> is optional: a sibling item implicitly closes the open one
+                self._flush()
+            else:
+                if tag == self._capture:
+                    self._capture_depth += 1
+                elif self._capture == "li" and tag in LIST_TAGS:
+                    # A nested list ends the outer item's own text
+                    self._flush()
+                if tag in LIST_TAGS:
+                    self._list_depth += 1
+                return
+
+        if tag in LIST_TAGS:
+            self._list_depth += 1
+        elif tag in HEADING_TAGS or tag in ("p", "pre", "li", "code"):
+            self._capture = tag
+            self._capture_depth = 1
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if self._done or self._container is None:
+            return
+        if tag in SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+            return
+
+        if self._capture is not None and tag == self._capture:
+            self._capture_depth -= 1
+            if self._capture_depth == 0:
+                self._flush()
+        if tag in LIST_TAGS and self._list_depth:
+            if self._capture == "li":
+                self._flush()
+            self._list_depth -= 1
+            if self._capture is None:
+                self._blocks.append("\n")
+
+        if tag == self._container:
+            self._container_depth -= 1
+            if self._container_depth == 0:
+                self._flush()
+                self._done = True
+
+    def handle_data(self, data):
+        if self._capture is not None and not self._skip_depth:
+            self._text.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self):
+        tag, self._capture = self._capture, None
+        if tag is None:
+            return
+        text = "".join(self._text).strip()
+        self._text = []
+        if tag in HEADING_TAGS:
+            self._blocks.append(f"\n## {text}\n\n")
+        elif tag == "li":
+            self._blocks.append(f"- {text}\n")
+        elif not text:
+            return
+        elif tag in ("pre", "code"):
+            self._blocks.append(f"```python\n{text}\n```\n\n")
+        else:
+            self._blocks.append(f"{text}\n\n")
+
+
+def iter_blocks(html: str, whole_page: bool = False) -> Iterator[str]:
+    extractor = DocsExtractor(whole_page)
+    extractor.feed(html)
+    extractor.close()
+    yield from extractor.drain()
+
+
+def extract_markdown(html: str) -> Optional[str]:
+    """
+    Turn a documentation page into markdown-like text, reading the whole page
+    when it has no main content, or None if nothing could be extracted.
+    """
+    return "".join(iter_blocks(html)) or "".join(iter_blocks(html, whole_page=True)) or None
+
+
+class SectionGrouper:
+    """
+    Group extracted blocks into "## " sections, releasing each section as soon
+    as the next heading shows it is complete.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+
+    def add(self, blocks: Iterable[str]) -> List[str]:
+        sections = []
+        for block in blocks:
+            if block.startswith("\n## ") and self._parts:
+                sections.append("".join(self._parts))
+                self._parts = []
+            self._parts.append(block)
+        return sections
+
+    def finish(self) -> List[str]:
+        sections = ["".join(self._parts)] if self._parts else []
+        self._parts = []
+        return sections
@@ -0,0 +1,233 @@
+import asyncio
+import os
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from mcp_servers.circuit_breaker import CircuitBreaker
+from mcp_servers.doc_cache import TTLCache
+from mcp_servers.metrics import upstream_circuit_open, upstream_fetches, upstream_latency
+from mcp_servers.singleflight import SingleFlight
+
+# Upstream fetch settings, overridable per deployment
+FETCH_TIMEOUT = float(os.environ.get("MCP_FETCH_TIMEOUT", "10"))
+CONNECT_TIMEOUT = float(os.environ.get("MCP_CONNECT_TIMEOUT", "5"))
+MAX_CONNECTIONS = int(os.environ.get("MCP_MAX_CONNECTIONS", "50"))
+MAX_CONNECTIONS_PER_HOST = int(os.environ.get("MCP_MAX_CONNECTIONS_PER_HOST", "8"))
+KEEPALIVE_EXPIRY = float(os.environ.get("MCP_KEEPALIVE_EXPIRY", "30"))
+# Consecutive failures (transport errors, 5xx, 429) before a host's circuit opens
+BREAKER_THRESHOLD = int(os.environ.get("MCP_BREAKER_THRESHOLD", "5"))
+# Seconds an open circuit rejects fetches before letting a probe through
+BREAKER_RESET = float(os.environ.get("MCP_BREAKER_RESET", "30"))
+# Seconds a URL that answered 4xx (and, in the routers, a symbol that was not found) is remembered
+NEGATIVE_CACHE_TTL = float(os.environ.get("MCP_NEGATIVE_CACHE_TTL", "30"))
+
+# Create headers to mimic a browser
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+}
+
+_client: Optional[httpx.AsyncClient] = None
+_host_slots: Dict[str, asyncio.Semaphore] = {}
+_flights = SingleFlight()
+_breakers: Dict[str, CircuitBreaker] = {}
+
+# URLs that recently answered with a client error, so they are not refetched
+not_found = TTLCache("not-found", maxsize=1024, ttl=NEGATIVE_CACHE_TTL, stale_ttl=0)
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared keep-alive client used by every scraping router.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(FETCH_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            follow_redirects=True,
+        )
+    return _client
+
+
+def url_host(url: str) -> str:
+    return urlsplit(url).netloc
+
+
+def _host_slot(url: str) -> asyncio.Semaphore:
+    # httpx only bounds the pool as a whole, so cap each upstream host separately
+    host = url_host(url)
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)
+    return slot
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker(BREAKER_THRESHOLD, BREAKER_RESET)
+    return breaker
+
+
+def _admit(url: str, host: str) -> bool:
+    """
+    Return False, without touching the network, for a URL recently found
+    missing or a host whose circuit is open.
+    """
+    if not_found.get(url):
+        return False
+    breaker = breaker_for(host)
+    if breaker.allow():
+        upstream_circuit_open.set(host, value=0.0 if breaker.state == breaker.CLOSED else 1.0)
+        return True
+    upstream_fetches.inc(host, "rejected")
+    return False
+
+
+def _settle(url: str, host: str, status: Optional[int]):
+    """
+    Feed a fetch outcome (None for a transport error) to the host's breaker and
+    remember URLs that answered with a client error.
+    """
+    breaker = breaker_for(host)
+    if status is None or status >= 500 or status == 429:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+        if status != 200:
+            not_found.set(url, True)
+    upstream_circuit_open.set(host, value=0.0 if breaker.state == breaker.CLOSED else 1.0)
+
+
+def circuit_stats() -> dict:
+    return {
+        host: {"state": breaker.state, "failures": breaker.failures, "rejected": breaker.rejected}
+        for host, breaker in _breakers.items()
+    }
+
+
+async def fetch_text(url: str) -> Optional[str]:
+    """
+    Fetch a page through the shared pool. Returns the body on a 200 response
+    and None otherwise, immediately so for a URL that recently answered 4xx or
+    a host whose circuit is open; transport errors propagate to the caller.
+    Concurrent fetches of the same URL share a single request.
+    """
+    if not _admit(url, url_host(url)):
+        return None
+    return await _flights.do(url, lambda: _fetch(url))
+
+
+def _connect_tracer(host: str):
+    """
+    Return an httpx trace hook recording how long new connections take to
+    open (TCP plus TLS). Reused keep-alive connections record nothing.
+    """
+    started = {}
+
+    async def trace(event: str, info):
+        if event == "connection.connect_tcp.started":
+            started["at"] = time.perf_counter()
+        elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete") and "at" in started:
+            started["done"] = time.perf_counter()
+        elif event.endswith(".send_request_headers.started") and "done" in started:
+            upstream_latency.observe(started.pop("done") - started.pop("at"), host, "connect")
+
+    return trace
+
+
+async def _fetch(url: str) -> Optional[str]:
+    host = url_host(url)
+    async with _host_slot(url):
+        start = time.perf_counter()
+        try:
+            response = await get_client().get(url, extensions={"trace": _connect_tracer(host)})
+        except httpx.HTTPError:
+            upstream_fetches.inc(host, "error")
+            _settle(url, host, None)
+            raise
+        upstream_latency.observe(time.perf_counter() - start, host, "download")
+    upstream_fetches.inc(host, str(response.status_code))
+    _settle(url, host, response.status_code)
+    if response.status_code != 200:
+        return None
+    return response.text
+
+
+async def stream_text(url: str):
+    """
+    Yield a page's body in decoded chunks as it downloads, so callers can start
+    processing before the whole page has arrived. Yields nothing for a non-200
+    response, a URL that recently answered 4xx or a host whose circuit is open.
+
+    The download runs in its own task and buffers chunks the caller has not
+    taken yet, so a slow consumer never holds the host's slot. A caller that
+    stops early cancels the download.
+    """
+    host = url_host(url)
+    if not _admit(url, host):
+        return
+    chunks: asyncio.Queue = asyncio.Queue()
+    download = asyncio.create_task(_download(url, host, chunks))
+    try:
+        while True:
+            chunk = await chunks.get()
+            if chunk is None:
+                break
+            yield chunk
+        # Re-raise a transport error from the download
+        await download
+    finally:
+        if not download.done():
+            download.cancel()
+
+
+async def _download(url: str, host: str, chunks: asyncio.Queue):
+    status: Optional[int] = None
+    settled = False
+    try:
+        async with _host_slot(url):
+            start = time.perf_counter()
+            try:
+                async with get_client().stream("GET", url, extensions={"trace": _connect_tracer(host)}) as response:
+                    status = response.status_code
+                    upstream_fetches.inc(host, str(status))
+                    if status == 200:
+                        async for chunk in response.aiter_text():
+                            chunks.put_nowait(chunk)
+            except httpx.HTTPError:
+                upstream_fetches.inc(host, "error")
+                settled = True
+                _settle(url, host, None)
+                raise
+            if status == 200:
+                upstream_latency.observe(time.perf_counter() - start, host, "download")
+        settled = True
+        _settle(url, host, status)
+    finally:
+        if not settled:
+            # Cancelled: the host answered if its status arrived; otherwise we
+            # learnt nothing, but a half-open probe must not stay outstanding
+            if status is None:
+                breaker_for(host).abandon()
+            else:
+                _settle(url, host, status)
+        chunks.put_nowait(None)
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _host_slots.clear()
+    _breakers.clear()
@@ -0,0 +1,187 @@
+"""
+Prometheus metrics without external dependencies.
+
+Metrics are plain dicts keyed by label values, so recording is a couple of
+dict operations and a bisect; rendering happens only when /metrics is scraped.
+"""
+import contextvars
+import time
+from bisect import bisect_left
+from typing import Dict, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.routing import Match
+
+router = APIRouter()
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, *labels, amount=1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self):
+        for labels, value in self._values.items():
+            yield self.name, _format_labels(self.labels, labels), value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels, amount=1.0):
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def set(self, *labels, value):
+        self._values[labels] = value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[Tuple, list] = {}
+
+    def observe(self, value, *labels):
+        series = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self):
+        for labels, series in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield f"{self.name}_bucket", _format_labels(self.labels, labels, ("le", le)), cumulative
+            yield f"{self.name}_sum", _format_labels(self.labels, labels), series[-1]
+            yield f"{self.name}_count", _format_labels(self.labels, labels), cumulative
+
+
+REGISTRY = []
+
+
+def register(metric):
+    REGISTRY.append(metric)
+    return metric
+
+
+http_requests = register(Counter(
+    "mcp_http_requests_total", "HTTP requests by route, method and status.", ("route", "method", "status")))
+http_latency = register(Histogram(
+    "mcp_http_request_duration_seconds", "HTTP request latency by route.", ("route",)))
+http_in_flight = register(Gauge(
+    "mcp_http_requests_in_flight", "HTTP requests currently being served, by route.", ("route",)))
+doc_resolutions = register(Counter(
+    "mcp_doc_resolutions_total", "Documentation lookups by library and outcome (exact, fuzzy, fallback).",
+    ("library", "outcome")))
+upstream_fetches = register(Counter(
+    "mcp_upstream_fetches_total", "Upstream documentation fetches by host and status.", ("host", "status")))
+upstream_latency = register(Histogram(
+    "mcp_upstream_fetch_duration_seconds", "Upstream documentation fetch time by host and phase "
+    "(connect, download, parse, extract).", ("host", "phase")))
+upstream_circuit_open = register(Gauge(
+    "mcp_upstream_circuit_open", "1 while the circuit breaker for an upstream host is open or probing.", ("host",)))
+admission_queued = register(Gauge(
+    "mcp_admission_queued", "Scraping lookups waiting for a slot, by server.", ("server",)))
+admission_rejected = register(Counter(
+    "mcp_admission_rejected_total", "Scraping lookups turned away by admission control, by reason (client, overload).",
+    ("server", "reason")))
+
+
+# Cleared for lookups made on another server's behalf (hedged fallbacks), which
+# would otherwise count as lookups of a library nobody asked for
+recording_resolutions: contextvars.ContextVar[bool] = contextvars.ContextVar("recording_resolutions", default=True)
+
+
+def record_resolution(library, outcome):
+    if recording_resolutions.get():
+        doc_resolutions.inc(library, outcome)
+
+
+def render() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{labels} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts, latency and in-flight requests
+    per route template (e.g. "/mcp/aws/context"), so label cardinality stays fixed.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._routes: Dict[str, str] = {}
+
+    def _route_for(self, scope):
+        path = scope["path"]
+        route = self._routes.get(path)
+        if route is None:
+            route = "unmatched"
+            for candidate in scope["app"].router.routes:
+                match, _ = candidate.matches(scope)
+                if match != Match.NONE:
+                    route = getattr(candidate, "path", path)
+                    break
+            if len(self._routes) < 1024:
+                self._routes[path] = route
+        return route
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = self._route_for(scope)
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        http_in_flight.inc(route)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_in_flight.dec(route)
+            http_latency.observe(time.perf_counter() - start, route)
+            http_requests.inc(route, scope["method"], str(status["code"]))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(render(), media_type="text/plain; version=0.0.4")
@@ -1,284 +1,585 @@
-from fastapi import APIRouter, Query
-import requests
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, Query, Request
+from typing import Optional
+import asyncio
 import json
-from bs4 import BeautifulSoup
-import re
+import os
+import random
+import time
+
+from mcp_servers.admission import Overloaded, admitted, client_admitted
+from mcp_servers.doc_cache import TTLCache
+from mcp_servers.doc_index import SectionIndex, fit_to_budget, split_sections
+from mcp_servers.hedge import hedged_resolve
+from mcp_servers.html_extract import DocsExtractor, SectionGrouper, extract_markdown
+from mcp_servers.http_client import NEGATIVE_CACHE_TTL, circuit_stats, fetch_text, not_found, stream_text, url_host
+from mcp_servers.metrics import record_resolution, upstream_latency
+from mcp_servers.resolver import EXACT, FALLBACK, FUZZY, SymbolResolver
+from mcp_servers.responses import json_response
+from mcp_servers.search import search_index
+from mcp_servers.search_mcp import nearest_document
+from mcp_servers.semantic import semantic_index
+from mcp_servers.shared_cache import get_shared_cache, load_shared
+from mcp_servers.snapshot import OFFLINE, get_snapshot
 
 router = APIRouter()
 
-def fetch_openai_agents_docs(function_name):
+SERVER_ID = "openai-agents-mcp"
+
+# Overridable so the router can be pointed at a mirror or a local stand-in
+base_url = os.environ.get("MCP_AGENTS_DOCS_URL", "https://openai.github.io/openai-agents-python/")
+
+# Define mapping of function names to documentation pages
+doc_pages = {
+    "Agent": "documentation/agents/",
+    "Runner": "documentation/running-agents/",
+    "Handoff": "documentation/handoffs/",
+    "Guardrail": "documentation/guardrails/",
+    "Tool": "documentation/tools/",
+    "Tracing": "documentation/tracing/",
+    "Voice": "documentation/voice-agents/",
+}
+
+CACHE_TTL = float(os.environ.get("MCP_DOC_CACHE_TTL", "300"))
+CACHE_STALE_TTL = float(os.environ.get("MCP_DOC_CACHE_STALE_TTL", "3600"))
+
+# Parsed section indexes keyed by target URL
+page_cache = TTLCache(
+    "pages",
+    maxsize=int(os.environ.get("MCP_PAGE_CACHE_SIZE", "64")),
+    ttl=CACHE_TTL,
+    stale_ttl=CACHE_STALE_TTL,
+)
+
+# Scraped documentation keyed by the cleaned, lowercased function name
+section_cache = TTLCache(
+    "sections",
+    maxsize=int(os.environ.get("MCP_SECTION_CACHE_SIZE", "1024")),
+    ttl=CACHE_TTL,
+    stale_ttl=CACHE_STALE_TTL,
+)
+
+# Function names whose scrape found nothing, so they go straight to the mock
+# docs or snapshot until the entry expires
+missing_sections = TTLCache(
+    "missing-sections",
+    maxsize=int(os.environ.get("MCP_SECTION_CACHE_SIZE", "1024")),
+    ttl=NEGATIVE_CACHE_TTL,
+    stale_ttl=0,
+)
+
+# Mock documentation used when scraping fails
+mock_docs = {
+    "Agent": """
+    # Agent
+    
+    The core primitive in the OpenAI Agents SDK. Agents are LLMs equipped with instructions and tools.
+    
+    ## Usage:
+    ```python
+    from agents import Agent, Runner
+
+    agent = Agent(name="Assistant", instructions="You are a helpful assistant")
+    
+    result = Runner.run_sync(agent, "Write a haiku about recursion in programming.")
+    print(result.final_output)
+    ```
+    
+    ## Parameters:
+    - name (string): Required. A descriptive name for the agent.
+    - instructions (string): Required. The system instructions that define the agent's behavior.
+    - tools (List[Tool]): Optional. A list of tools the agent can use.
+    - model_settings (ModelSettings): Optional. Settings for the LLM backing the agent.
+    """,
+    
+    "Runner.run_sync": """
+    # Runner.run_sync
+    
+    Runs an agent synchronously and returns the result.
+    
+    ## Parameters:
+    - agent (Agent): Required. The agent to run.
+    - input (str): Required. The input to the agent.
+    - run_context (RunContext): Optional. Context for the run, including values for tool arguments.
+    
+    ## Returns:
+    - AgentResult: Contains the final output and other information about the run.
+    
+    ## Example:
+    ```python
+    from agents import Agent, Runner
+    
+    agent = Agent(name="Assistant", instructions="You are a helpful assistant")
+    
+    result = Runner.run_sync(agent, "Write a haiku about recursion in programming.")
+    print(result.final_output)
+    ```
+    """,
+    
+    "Handoff": """
+    # Handoff
+    
+    A feature that allows agents to delegate tasks to other agents.
+    
+    ## Usage:
+    ```python
+    from agents import Agent, Handoff
+    
+    main_agent = Agent(
+        name="Main",
+        instructions="You are a helpful assistant that can delegate tasks to specialists."
+    )
+    
+    math_agent = Agent(
+        name="Math Specialist",
+        instructions="You are a math genius who can solve complex math problems."
+    )
+    
+    # Register the math agent as a handoff target
+    main_agent.add_handoff(
+        Handoff(
+            name="math_specialist",
+            target=math_agent,
+            description="Delegate math problems to a specialist"
+        )
+    )
+    ```
+    """,
+    
+    "Guardrails": """
+    # Guardrails
+    
+    Enables input validation for agents to enforce safety and other constraints.
+    
+    ## Example:
+    ```python
+    from agents import Agent, Guardrails
+    
+    # Create a guardrail that rejects offensive content
+    guardrails = Guardrails(
+        instructions="Reject any input that contains offensive content."
+    )
+    
+    agent = Agent(
+        name="Assistant",
+        instructions="You are a helpful assistant",
+        guardrails=guardrails
+    )
+    ```
+    """
+}
+
+# Default fallback overview of the SDK
+sdk_overview = """
+# OpenAI Agents SDK
+
+The OpenAI Agents SDK enables you to build agentic AI apps in a lightweight, easy-to-use package with very few abstractions. It's a production-ready upgrade of previous experimentation for agents.
+
+## Key Features:
+- **Agents**: LLMs equipped with instructions and tools
+- **Handoffs**: Allow agents to delegate to other agents for specific tasks
+- **Guardrails**: Enable the inputs to agents to be validated
+- **Tracing**: Built-in visualization and debugging of agent workflows
+
+## Installation:
+```bash
+pip install openai-agents
+```
+
+## Documentation:
+Full documentation available at: https://openai.github.io/openai-agents-python/
+"""
+
+AGENTS_PREFIXES = ("agents.", "openai.agents.")
+# Names answered with the SDK overview built from the landing page
+OVERVIEW_NAMES = ("agents", "openai_agents", "openai-agents", "sdk")
+
+# Built once at import time and shared by every request; pages are also routed
+# by substring, so "function_tool" and "InputGuardrail" reach their own pages
+page_resolver = SymbolResolver(AGENTS_PREFIXES, doc_pages, substring=True)
+resolver = SymbolResolver(AGENTS_PREFIXES, mock_docs)
+
+def extract_page_content(html):
+    """
+    Turn a documentation page into markdown-like text, reading the whole page
+    when it has no main content, or None if nothing could be extracted.
     """
-    Fetch documentation for OpenAI Agents SDK functions.
-    Uses the official OpenAI Agents Python SDK documentation site with BeautifulSoup
-    for parsing and extracting relevant information.
+    return extract_markdown(html)
+
+def build_overview(index):
     """
-    base_url = "https://openai.github.io/openai-agents-python/"
+    Build the SDK overview (title, intro, features and installation) from the
+    already parsed landing page, so it is never fetched or parsed twice.
+    """
+    if not index.sections:
+        return None
     
-    # Extract specific parts of the function name
-    clean_function_name = function_name
-    if function_name.startswith("agents."):
-        clean_function_name = function_name[7:]  # Remove "agents." prefix
-    elif function_name.startswith("openai.agents."):
-        clean_function_name = function_name[13:]  # Remove "openai.agents." prefix
-    
-    # Create headers to mimic a browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-    }
+    # Extract title and introduction
+    intro = index.sections[0]
+    parts = [f"# {intro.heading}\n\n"]
+    body = intro.text.split("\n", 1)[1].strip() if "\n" in intro.text else ""
+    if body:
+        parts.append(f"{body}\n\n")
     
-    # Define mapping of function names to documentation pages
-    doc_pages = {
-        "Agent": "documentation/agents/",
-        "Runner": "documentation/running-agents/",
-        "Handoff": "documentation/handoffs/",
-        "Guardrails": "documentation/guardrails/",
-        "Tool": "documentation/tools/",
-        "Tracing": "documentation/tracing/",
-        "Voice": "documentation/voice-agents/",
-    }
+    # Extract key features and installation info
+    for marker in ("Why use", "Installation"):
+        for section in index.sections[1:]:
+            if marker in section.heading:
+                parts.append(f"{section.text}\n\n")
+                break
     
+    return "".join(parts)
+
+async def fetch_page(url):
+    html = await fetch_text(url)
+    if html is None:
+        return None
+    start = time.perf_counter()
+    content_text = extract_page_content(html)
+    upstream_latency.observe(time.perf_counter() - start, url_host(url), "parse")
+    return content_text
+
+async def fetch_page_admitted(url):
+    async with admitted(SERVER_ID):
+        return await fetch_page(url)
+
+async def load_page(url, admit=False):
+    """
+    Load a page from the offline snapshot, or fetch it (through the cache shared
+    between workers, if configured), and parse it once into a section index.
+    With admit, a page that has to be fetched waits for a scraping slot first.
+    """
+    snapshot = get_snapshot()
+    content_text = snapshot.page(url) if snapshot else None
+    if content_text is None and not OFFLINE:
+        fetch = fetch_page_admitted if admit else fetch_page
+        content_text = await load_shared("pages", url, CACHE_TTL, lambda: fetch(url))
+    if content_text is None:
+        return None
+    return index_page(url, content_text)
+
+def index_page(url, content_text):
+    start = time.perf_counter()
+    index = SectionIndex.from_markdown(content_text)
+    upstream_latency.observe(time.perf_counter() - start, url_host(url), "extract")
+    # Keep search results in step with the freshly loaded page
+    sections = [("openai-agents", section.heading, section.text) for section in index.sections]
+    search_index.replace_group(url, sections)
+    semantic_index.replace_group(url, sections)
+    return index
+
+async def load_overview():
+    index = await page_cache.get_or_load(base_url, lambda: load_page(base_url, admit=True))
+    if index is None:
+        return None
+    return build_overview(index)
+
+def page_url_for(clean_function_name):
     # Try to find the appropriate page based on the function name
-    target_url = base_url
-    for key, path in doc_pages.items():
-        if key.lower() in clean_function_name.lower():
-            target_url = base_url + path
-            break
+    page = page_resolver.resolve(clean_function_name)
+    if page:
+        return base_url + page.value
+    return base_url
+
+# Warm-up and scheduled refresh of every page the router can serve
+PREFETCH = os.environ.get("MCP_PREFETCH", "1").lower() not in ("0", "false", "no")
+PREFETCH_CONCURRENCY = int(os.environ.get("MCP_PREFETCH_CONCURRENCY", "4"))
+REFRESH_INTERVAL = float(os.environ.get("MCP_REFRESH_INTERVAL", str(CACHE_TTL)))
+# Each refresh cycle starts after REFRESH_INTERVAL +/- this fraction, so workers drift apart
+REFRESH_JITTER = float(os.environ.get("MCP_REFRESH_JITTER", "0.1"))
+
+warmup = {"done": False, "loaded": [], "failed": []}
+
+def known_page_urls():
+    return list(dict.fromkeys([base_url] + [base_url + page for page in doc_pages.values()]))
+
+async def reload_pages(urls, force=False):
+    """
+    Load pages with at most PREFETCH_CONCURRENCY in flight and return
+    (url, loaded) pairs. With force, cached pages are reloaded too; a page that
+    fails to reload keeps its cached copy.
+    """
+    slots = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    async def reload(url):
+        async with slots:
+            try:
+                if not force:
+                    return url, await page_cache.get_or_load(url, lambda: load_page(url)) is not None
+                index = await load_page(url)
+                if index is not None:
+                    page_cache.set(url, index)
+                return url, index is not None
+            except Exception as e:
+                print(f"Error prefetching {url}: {str(e)}")
+                return url, False
+
+    return await asyncio.gather(*(reload(url) for url in urls))
+
+async def prefetch_pages():
+    results = await reload_pages(known_page_urls())
+    warmup["loaded"] = [url for url, loaded in results if loaded]
+    warmup["failed"] = [url for url, loaded in results if not loaded]
+    warmup["done"] = True
+
+async def refresh_pages():
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL * random.uniform(1 - REFRESH_JITTER, 1 + REFRESH_JITTER))
+        await reload_pages(known_page_urls(), force=True)
+
+@asynccontextmanager
+async def lifespan():
+    """
+    Warm every known page in the background at startup, then keep them fresh.
+    """
+    tasks = [asyncio.create_task(prefetch_pages()), asyncio.create_task(refresh_pages())] if PREFETCH else []
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def readiness():
+    return {
+        "ready": warmup["done"] or not PREFETCH,
+        "pages": len(known_page_urls()),
+        "loaded": len(warmup["loaded"]),
+        "failed": warmup["failed"],
+    }
+
+async def scrape_openai_agents_docs(clean_function_name):
+    """
+    Scrape the documentation page matching the function name and return
+    (outcome, text) for the relevant section, or None when nothing could be scraped.
+    """
+    # Check for main SDK documentation request
+    if clean_function_name.lower() in OVERVIEW_NAMES:
+        try:
+            overview = await page_cache.get_or_load((base_url, "overview"), load_overview)
+            if overview:
+                return FUZZY, overview
+        except Overloaded:
+            raise
+        except Exception as e:
+            print(f"Error scraping main documentation: {str(e)}")
+    
+    target_url = page_url_for(clean_function_name)
     
     # If the function looks like a main concept (Agent, Runner, etc.), try to scrape its documentation
     try:
-        response = requests.get(target_url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract main content
-            main_content = soup.find('main')
-            if not main_content:
-                main_content = soup.find('div', {'class': 'markdown-body'})
+        index = await page_cache.get_or_load(target_url, lambda: load_page(target_url, admit=True))
+        
+        # If we found specific content for the function
+        if index and index.text:
+            # Try to extract just the relevant section
+            section = index.find(clean_function_name)
+            if section:
+                return EXACT, section.text
             
-            if main_content:
-                # Extract headings and content
-                content_text = ""
-                for elem in main_content.find_all(['h1', 'h2', 'h3', 'p', 'pre', 'code', 'ul', 'ol', 'li']):
-                    if elem.name in ['h1', 'h2', 'h3']:
-                        content_text += f"\n## {elem.text.strip()}\n\n"
-                    elif elem.name == 'p':
-                        content_text += f"{elem.text.strip()}\n\n"
-                    elif elem.name == 'pre' or elem.name == 'code':
-                        code_text = elem.text.strip()
-                        if code_text:
-                            content_text += f"```python\n{code_text}\n```\n\n"
-                    elif elem.name in ['ul', 'ol']:
-                        for li in elem.find_all('li'):
-                            content_text += f"- {li.text.strip()}\n"
-                        content_text += "\n"
-                
-                # If we found specific content for the function
-                if content_text:
-                    # Check if our specific function is mentioned in the content
-                    if clean_function_name.lower() in content_text.lower():
-                        # Try to extract just the relevant section
-                        sections = re.split(r'\n##\s+', content_text)
-                        for section in sections:
-                            if clean_function_name.lower() in section.lower():
-                                return f"## {section.strip()}"
-                        
-                        # If we couldn't find a specific section, return the whole content
-                        return content_text.strip()
-                    else:
-                        # Return general content if specific function not found
-                        return content_text.strip()
+            # Return general content if specific function not found
+            return FUZZY, index.text
+    except Overloaded:
+        raise
     except Exception as e:
         print(f"Error scraping documentation: {str(e)}")
     
-    # Fall back to mock documentation if scraping fails or no specific content found
-    mock_docs = {
-        "Agent": """
-        # Agent
-        
-        The core primitive in the OpenAI Agents SDK. Agents are LLMs equipped with instructions and tools.
-        
-        ## Usage:
-        ```python
-        from agents import Agent, Runner
+    return None
 
-        agent = Agent(name="Assistant", instructions="You are a helpful assistant")
-        
-        result = Runner.run_sync(agent, "Write a haiku about recursion in programming.")
-        print(result.final_output)
-        ```
-        
-        ## Parameters:
-        - name (string): Required. A descriptive name for the agent.
-        - instructions (string): Required. The system instructions that define the agent's behavior.
-        - tools (List[Tool]): Optional. A list of tools the agent can use.
-        - model_settings (ModelSettings): Optional. Settings for the LLM backing the agent.
-        """,
-        
-        "Runner.run_sync": """
-        # Runner.run_sync
-        
-        Runs an agent synchronously and returns the result.
-        
-        ## Parameters:
-        - agent (Agent): Required. The agent to run.
-        - input (str): Required. The input to the agent.
-        - run_context (RunContext): Optional. Context for the run, including values for tool arguments.
-        
-        ## Returns:
-        - AgentResult: Contains the final output and other information about the run.
-        
-        ## Example:
-        ```python
-        from agents import Agent, Runner
-        
-        agent = Agent(name="Assistant", instructions="You are a helpful assistant")
-        
-        result = Runner.run_sync(agent, "Write a haiku about recursion in programming.")
-        print(result.final_output)
-        ```
-        """,
-        
-        "Handoff": """
-        # Handoff
-        
-        A feature that allows agents to delegate tasks to other agents.
-        
-        ## Usage:
-        ```python
-        from agents import Agent, Handoff
-        
-        main_agent = Agent(
-            name="Main",
-            instructions="You are a helpful assistant that can delegate tasks to specialists."
-        )
-        
-        math_agent = Agent(
-            name="Math Specialist",
-            instructions="You are a math genius who can solve complex math problems."
-        )
-        
-        # Register the math agent as a handoff target
-        main_agent.add_handoff(
-            Handoff(
-                name="math_specialist",
-                target=math_agent,
-                description="Delegate math problems to a specialist"
-            )
-        )
-        ```
-        """,
-        
-        "Guardrails": """
-        # Guardrails
-        
-        Enables input validation for agents to enforce safety and other constraints.
-        
-        ## Example:
-        ```python
-        from agents import Agent, Guardrails
-        
-        # Create a guardrail that rejects offensive content
-        guardrails = Guardrails(
-            instructions="Reject any input that contains offensive content."
-        )
-        
-        agent = Agent(
-            name="Assistant",
-            instructions="You are a helpful assistant",
-            guardrails=guardrails
-        )
-        ```
-        """
-    }
+async def load_section(clean_function_name):
+    scraped = await load_shared(
+        "sections", clean_function_name.lower(), CACHE_TTL,
+        lambda: scrape_openai_agents_docs(clean_function_name),
+    )
+    # The shared cache hands back JSON lists
+    return tuple(scraped) if scraped else None
+
+async def load_cached(cache, key, loader):
+    """
+    Return the cached value for key, loading it on a miss. A miss may join a
+    scrape another request is leading, so it is counted against this caller's
+    own client limit before joining.
+    """
+    if cache.get(key) is not None:
+        return await cache.get_or_load(key, loader)
+    async with client_admitted(SERVER_ID):
+        return await cache.get_or_load(key, loader)
+
+async def resolve_openai_agents_docs(function_name):
+    """
+    Resolve documentation for OpenAI Agents SDK functions.
+    Uses the official OpenAI Agents Python SDK documentation site, extracting the
+    relevant information with a single-pass streaming HTML extractor. Pages are fetched through the
+    shared async client so a slow docs site never blocks the event loop, and both
+    pages and extracted sections are served from memory (and from the cache
+    shared between workers, if configured) while fresh.
+    Returns (outcome, documentation) and records the outcome.
+    """
+    # Extract specific parts of the function name
+    clean_function_name = resolver.strip_prefix(function_name)
     
-    # Check for main SDK documentation request
-    if clean_function_name.lower() in ["agents", "openai_agents", "openai-agents", "sdk"]:
-        try:
-            response = requests.get(base_url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract title and introduction
-                title = soup.find('h1')
-                intro_section = soup.find('section', {'id': 'intro'})
-                content = ""
-                
-                if title:
-                    content += f"# {title.text.strip()}\n\n"
-                
-                if intro_section:
-                    for p in intro_section.find_all('p'):
-                        content += f"{p.text.strip()}\n\n"
-                
-                # Extract key features and installation info
-                features_section = soup.find('h2', string=lambda text: 'Why use' in text if text else False)
-                if features_section:
-                    content += f"## {features_section.text.strip()}\n\n"
-                    next_elem = features_section.find_next(['p', 'ul'])
-                    while next_elem and next_elem.name in ['p', 'ul']:
-                        if next_elem.name == 'p':
-                            content += f"{next_elem.text.strip()}\n\n"
-                        elif next_elem.name == 'ul':
-                            for li in next_elem.find_all('li'):
-                                content += f"- {li.text.strip()}\n"
-                            content += "\n"
-                        next_elem = next_elem.find_next(['p', 'ul', 'h2'])
-                        if next_elem and next_elem.name == 'h2':
-                            break
-                
-                install_section = soup.find('h2', string=lambda text: 'Installation' in text if text else False)
-                if install_section:
-                    content += f"## {install_section.text.strip()}\n\n"
-                    next_elem = install_section.find_next(['p', 'pre'])
-                    if next_elem and next_elem.name == 'pre':
-                        content += f"```bash\n{next_elem.text.strip()}\n```\n\n"
-                
-                if content:
-                    return content
-        except Exception as e:
-            print(f"Error scraping main documentation: {str(e)}")
+    key = clean_function_name.lower()
+    if not missing_sections.get(key):
+        scraped = await load_cached(section_cache, key, lambda: load_section(clean_function_name))
+        if scraped:
+            record_resolution("openai-agents", scraped[0])
+            return scraped
+        missing_sections.set(key, True)
     
     # If function is in our mock data, return it
-    for key, doc in mock_docs.items():
-        if key.lower() in clean_function_name.lower():
-            return doc
+    match = resolver.resolve(clean_function_name)
+    if match:
+        record_resolution("openai-agents", match.kind)
+        return match.kind, match.value
+    
+    snapshot = get_snapshot()
+    if snapshot:
+        doc = snapshot.doc("openai-agents", clean_function_name)
+        if doc:
+            record_resolution("openai-agents", EXACT)
+            return EXACT, doc
+    
+    # Otherwise the closest documented symbol or scraped section
+    nearest = nearest_document("openai-agents", clean_function_name)
+    if nearest:
+        record_resolution("openai-agents", FUZZY)
+        return FUZZY, nearest.text
     
     # Default fallback
-    sdk_overview = """
-    # OpenAI Agents SDK
+    record_resolution("openai-agents", FALLBACK)
+    return FALLBACK, f"Documentation for {function_name} not found in the OpenAI Agents SDK. Here's an overview of the SDK:\n\n{sdk_overview}"
 
-    The OpenAI Agents SDK enables you to build agentic AI apps in a lightweight, easy-to-use package with very few abstractions. It's a production-ready upgrade of previous experimentation for agents.
+async def fetch_openai_agents_docs(function_name):
+    return (await resolve_openai_agents_docs(function_name))[1]
+
+async def stream_openai_agents_docs(function_name):
+    """
+    Yield the documentation for a function section by section. When the target
+    page is not cached yet, each section is yielded as soon as it has been
+    extracted, before the rest of the page has downloaded, and the page is
+    cached once fully read. A page that has to be scraped waits for an
+    admission slot like any other scraping lookup.
+    """
+    clean_function_name = resolver.strip_prefix(function_name)
+    if clean_function_name.lower() in OVERVIEW_NAMES:
+        # The overview is assembled from the landing page rather than streamed
+        for section in split_sections(await fetch_openai_agents_docs(function_name)):
+            yield section
+        return
     
-    ## Key Features:
-    - **Agents**: LLMs equipped with instructions and tools
-    - **Handoffs**: Allow agents to delegate to other agents for specific tasks
-    - **Guardrails**: Enable the inputs to agents to be validated
-    - **Tracing**: Built-in visualization and debugging of agent workflows
+    target_url = page_url_for(clean_function_name)
+    snapshot = get_snapshot()
     
-    ## Installation:
-    ```bash
-    pip install openai-agents
-    ```
+    shared = get_shared_cache()
+    if (target_url not in page_cache and not OFFLINE and not (snapshot and snapshot.page(target_url))
+            and not (shared and await shared.get_async("pages", target_url, CACHE_TTL))):
+        # Extract while the page downloads and send each section once complete.
+        # The slot is held while sections are relayed, which the SSE transport
+        # bounds by running at most MCP_SSE_QUEUE_SIZE sections ahead of the client.
+        extractor = DocsExtractor()
+        grouper = SectionGrouper()
+        parts = []
+        complete = False
+        async with client_admitted(SERVER_ID), admitted(SERVER_ID):
+            try:
+                async for chunk in stream_text(target_url):
+                    extractor.feed(chunk)
+                    for section in grouper.add(extractor.drain()):
+                        parts.append(section)
+                        yield section.strip()
+                extractor.close()
+                complete = True
+            except Exception as e:
+                print(f"Error scraping documentation: {str(e)}")
+        for section in grouper.add(extractor.drain()) + grouper.finish():
+            parts.append(section)
+            yield section.strip()
+        if parts:
+            # Only a fully read page is cached; a truncated one is just streamed
+            if complete:
+                content_text = "".join(parts)
+                page_cache.set(target_url, index_page(target_url, content_text))
+                if shared:
+                    await shared.set_async("pages", target_url, content_text)
+            return
     
-    ## Documentation:
-    Full documentation available at: https://openai.github.io/openai-agents-python/
-    """
+    index = None
+    try:
+        index = await load_cached(page_cache, target_url, lambda: load_page(target_url, admit=True))
+    except Overloaded:
+        raise
+    except Exception as e:
+        print(f"Error scraping documentation: {str(e)}")
+    if index and index.sections:
+        for section in index.sections:
+            yield section.text
+        return
     
-    return f"Documentation for {function_name} not found in the OpenAI Agents SDK. Here's an overview of the SDK:\n\n{sdk_overview}"
+    for section in split_sections(await fetch_openai_agents_docs(function_name)):
+        yield section
 
-@router.get("/openai-agents/context")
-async def openai_agents_mcp_context(
-    language: str = Query(...),
-    function: str = Query(...)
-):
-    doc_snippet = fetch_openai_agents_docs(function)
+def search_documents():
+    """
+    Yield (library, symbol, text) tuples for the cross-library search index.
+    Scraped pages are added to the index as they are loaded.
+    """
+    for symbol, doc in mock_docs.items():
+        yield "openai-agents", symbol, doc
+    yield "openai-agents", "OpenAI Agents SDK", sdk_overview
+
+async def openai_agents_context(language, function, max_tokens=None, max_chars=None):
+    # Falls back to the server behind mcp.json's fallbackEndpoint when scraping is slow;
+    # "source" records which server answered
+    source, _, doc_snippet = await hedged_resolve("openai-agents-mcp", function)
+    doc_snippet = fit_to_budget(doc_snippet, resolver.strip_prefix(function), max_tokens, max_chars)
     
     return {
         "context": {
             "language": language,
             "library": "openai-agents",
             "function": function,
-            "documentation": doc_snippet
+            "documentation": doc_snippet,
+            "source": source
         }
-    } 
\ No newline at end of file
+    }
+
+@router.get("/openai-agents/context")
+async def openai_agents_mcp_context(
+    request: Request,
+    language: str = Query(...),
+    function: str = Query(...),
+    max_tokens: Optional[int] = Query(None, ge=1, description="Approximate token budget for the documentation"),
+    max_chars: Optional[int] = Query(None, ge=1, description="Character budget for the documentation"),
+):
+    payload = await openai_agents_context(language, function, max_tokens, max_chars)
+    # Key on the resolved document itself: the section cache hands back the same
+    # string object until a refresh replaces it, so hot responses are encoded
+    # and compressed once per refresh
+    return json_response(
+        request,
+        key=("openai-agents", language, function, payload["context"]["source"], payload["context"]["documentation"]),
+        build=lambda: payload,
+    )
+
+@router.get("/openai-agents/ready")
+async def openai_agents_ready():
+    """
+    Report whether the startup warm-up of the documentation pages has finished.
+    """
+    return readiness()
+
+@router.get("/openai-agents/cache")
+async def openai_agents_cache_stats():
+    """
+    Report hit/miss/eviction counters for the page and section caches, the
+    negative caches and the upstream circuit breakers.
+    """
+    return {
+        "cache": {
+            "pages": page_cache.stats(),
+            "sections": section_cache.stats(),
+            "missing_sections": {"size": len(missing_sections)},
+            "missing_pages": {"size": len(not_found)},
+        },
+        "circuits": circuit_stats(),
+        "shared": get_shared_cache().stats() if get_shared_cache() else None,
+    }
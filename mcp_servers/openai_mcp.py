@@ -1,79 +1,113 @@
-from fastapi import APIRouter, Query
-import requests
+from fastapi import APIRouter, Query, Request
+from typing import Optional
 import json
 
+from mcp_servers.doc_index import fit_to_budget
+from mcp_servers.metrics import record_resolution
+from mcp_servers.resolver import EXACT, FALLBACK, FUZZY, SymbolResolver
+from mcp_servers.responses import json_response
+from mcp_servers.search_mcp import nearest_document
+from mcp_servers.snapshot import get_snapshot
+
 router = APIRouter()
 
-def fetch_openai_docs(function_name):
+# Mock documentation for different OpenAI functions
+mock_docs = {
+    "ChatCompletion.create": """
+    # ChatCompletion.create
+    
+    Creates a chat completion for the provided messages.
+    
+    ## Parameters:
+    - model (string): Required. The model to use for chat completion.
+    - messages (array): Required. An array of message objects representing the conversation so far.
+    - temperature (number): Optional. Controls randomness. Higher values like 0.8 make output more random, while lower values like 0.2 make it more focused.
+    - max_tokens (integer): Optional. The maximum number of tokens to generate in the chat completion.
+    
+    ## Example:
+    ```python
+    import openai
+    
+    response = openai.ChatCompletion.create(
+      model="gpt-3.5-turbo",
+      messages=[
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Hello!"}
+      ]
+    )
+    ```
+    """,
+    "Completion.create": """
+    # Completion.create
+    
+    Creates a completion for the provided prompt.
+    
+    ## Parameters:
+    - model (string): Required. The model to use for the completion.
+    - prompt (string): Optional. The prompt to complete from.
+    - temperature (number): Optional. Controls randomness. Higher values like 0.8 make output more random, while lower values like 0.2 make it more focused.
+    - max_tokens (integer): Optional. The maximum number of tokens to generate in the completion.
+    
+    ## Example:
+    ```python
+    import openai
+    
+    response = openai.Completion.create(
+      model="text-davinci-003",
+      prompt="Once upon a time",
+      max_tokens=50
+    )
+    ```
+    """
+}
+
+# Built once at import time and shared by every request
+resolver = SymbolResolver(("openai.",), mock_docs)
+
+def resolve_openai_docs(function_name):
+    """
+    Resolve a function name to (outcome, documentation).
+    """
     # Extract the specific function we're looking for
     # For example, from "openai.ChatCompletion.create" extract "ChatCompletion.create"
-    if function_name.startswith("openai."):
-        function_name = function_name[7:]  # Remove "openai." prefix
-    
-    # Mock documentation for different OpenAI functions
-    mock_docs = {
-        "ChatCompletion.create": """
-        # ChatCompletion.create
-        
-        Creates a chat completion for the provided messages.
-        
-        ## Parameters:
-        - model (string): Required. The model to use for chat completion.
-        - messages (array): Required. An array of message objects representing the conversation so far.
-        - temperature (number): Optional. Controls randomness. Higher values like 0.8 make output more random, while lower values like 0.2 make it more focused.
-        - max_tokens (integer): Optional. The maximum number of tokens to generate in the chat completion.
-        
-        ## Example:
-        ```python
-        import openai
-        
-        response = openai.ChatCompletion.create(
-          model="gpt-3.5-turbo",
-          messages=[
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": "Hello!"}
-          ]
-        )
-        ```
-        """,
-        "Completion.create": """
-        # Completion.create
-        
-        Creates a completion for the provided prompt.
-        
-        ## Parameters:
-        - model (string): Required. The model to use for the completion.
-        - prompt (string): Optional. The prompt to complete from.
-        - temperature (number): Optional. Controls randomness. Higher values like 0.8 make output more random, while lower values like 0.2 make it more focused.
-        - max_tokens (integer): Optional. The maximum number of tokens to generate in the completion.
-        
-        ## Example:
-        ```python
-        import openai
-        
-        response = openai.Completion.create(
-          model="text-davinci-003",
-          prompt="Once upon a time",
-          max_tokens=50
-        )
-        ```
-        """
-    }
+    function_name = resolver.strip_prefix(function_name)
     
     # If function is in our mock data, return it
-    for key in mock_docs:
-        if key.lower() in function_name.lower():
-            return mock_docs[key]
+    match = resolver.resolve(function_name)
+    if match:
+        record_resolution("openai", match.kind)
+        return match.kind, match.value
+    
+    # Then any documentation ingested into the offline snapshot
+    snapshot = get_snapshot()
+    if snapshot:
+        doc = snapshot.doc("openai", function_name)
+        if doc:
+            record_resolution("openai", EXACT)
+            return EXACT, doc
+    
+    # Otherwise the closest documented symbol, e.g. "ChatCompletion.create" for "chat.completions.create"
+    nearest = nearest_document("openai", function_name)
+    if nearest:
+        record_resolution("openai", FUZZY)
+        return FUZZY, nearest.text
     
     # Default fallback
-    return f"Documentation for {function_name} not found. Please check the OpenAI API reference at https://platform.openai.com/docs/api-reference"
+    record_resolution("openai", FALLBACK)
+    return FALLBACK, f"Documentation for {function_name} not found. Please check the OpenAI API reference at https://platform.openai.com/docs/api-reference"
 
-@router.get("/openai/context")
-async def openai_mcp_context(
-    language: str = Query(...),
-    function: str = Query(...)
-):
-    doc_snippet = fetch_openai_docs(function)
+def fetch_openai_docs(function_name):
+    return resolve_openai_docs(function_name)[1]
+
+def search_documents():
+    """
+    Yield (library, symbol, text) tuples for the cross-library search index.
+    """
+    for symbol, doc in mock_docs.items():
+        yield "openai", symbol, doc
+
+def openai_context(language, function, max_tokens=None, max_chars=None):
+    doc_snippet = fit_to_budget(fetch_openai_docs(function), function, max_tokens, max_chars)
     
     return {
         "context": {
@@ -82,4 +116,16 @@ async def openai_mcp_context(
             "function": function,
             "documentation": doc_snippet
         }
-    } 
\ No newline at end of file
+    }
+
+@router.get("/openai/context")
+async def openai_mcp_context(
+    request: Request,
+    language: str = Query(...),
+    function: str = Query(...),
+    max_tokens: Optional[int] = Query(None, ge=1, description="Approximate token budget for the documentation"),
+    max_chars: Optional[int] = Query(None, ge=1, description="Character budget for the documentation"),
+):
+    # Resolving is a few hash lookups; the encoded payload is what gets cached
+    payload = openai_context(language, function, max_tokens, max_chars)
+    return json_response(request, key=("openai", language, function, max_tokens, max_chars), build=lambda: payload)
@@ -0,0 +1,342 @@
+"""
+The Model Context Protocol over JSON-RPC 2.0, independent of the transport.
+
+Every enabled server in mcp.json is exposed as a tool named after its context
+builder (e.g. "aws_context"), whose arguments are the builder's parameters,
+and as a resource template "<library>://context{?arg,...}". A Session answers
+one message at a time; each request runs as its own task, so a transport can
+keep many requests in flight on one connection and send each response as soon
+as it is ready, in whatever order they finish.
+"""
+import asyncio
+import inspect
+import os
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from pydantic import ValidationError
+
+from mcp_servers import registry
+from mcp_servers.admission import Overloaded
+from mcp_servers.batch_mcp import BatchItem, resolve_item
+from mcp_servers.search import search_index
+from mcp_servers.search_mcp import ensure_indexed
+
+# Newest first; a client asking for another version is offered the newest
+PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
+SERVER_INFO = {"name": "multi-mcp-server", "version": "1.0.0"}
+# HTTP sessions kept per worker; the least recently used is closed beyond this
+SESSION_LIMIT = int(os.environ.get("MCP_SESSION_LIMIT", "1024"))
+INSTRUCTIONS = (
+    "Look up SDK documentation with the *_context tools (pass the function or class name), "
+    "project frontend components and backend APIs with frontend_context and backend_context, "
+    "or search every corpus at once with search_docs."
+)
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+# Implementation-defined server error: a lookup turned away by admission control
+SERVER_BUSY = -32000
+
+PARAMETER_DESCRIPTIONS = {
+    "language": "Programming language of the SDK, e.g. python or javascript",
+    "function": "Function, class or method to document, e.g. Runner.run or boto3.client",
+    "component": "Frontend component name",
+    "page": "Frontend page name",
+    "resource": "Backend API resource, e.g. users",
+    "endpoint": "Backend endpoint as \"METHOD /path\", e.g. GET /api/users",
+    "schema": "Database schema (table) name",
+    "max_tokens": "Approximate token budget for the documentation",
+    "max_chars": "Character budget for the documentation",
+}
+BUDGET_PARAMETERS = ("max_tokens", "max_chars")
+
+SEARCH_TOOL = {
+    "name": "search_docs",
+    "description": "Full-text search across every documentation corpus, ranked with BM25.",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "q": {"type": "string", "description": "Search terms, e.g. region_name"},
+            "library": {"type": "string", "description": "Restrict results to one library"},
+            "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 10},
+        },
+        "required": ["q"],
+    },
+}
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def error_response(request_id: Any, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def is_request(message: Any) -> bool:
+    return isinstance(message, dict) and "method" in message and "id" in message
+
+
+def _parameters(server: dict) -> List[inspect.Parameter]:
+    builder = registry.context_builder(server["libraries"][0])
+    return [p for p in inspect.signature(builder).parameters.values() if p.name not in BUDGET_PARAMETERS]
+
+
+def _tool(server: dict) -> dict:
+    properties, required = {}, []
+    for parameter in _parameters(server):
+        properties[parameter.name] = {"type": "string", "description": PARAMETER_DESCRIPTIONS.get(parameter.name, "")}
+        if parameter.default is inspect.Parameter.empty:
+            required.append(parameter.name)
+    for name in BUDGET_PARAMETERS:
+        # Every builder is budgeted the same way through resolve_item
+        properties[name] = {"type": "integer", "minimum": 1, "description": PARAMETER_DESCRIPTIONS[name]}
+    return {
+        "name": server["context"],
+        "description": server.get("description", server["name"]),
+        "inputSchema": {"type": "object", "properties": properties, "required": required},
+    }
+
+
+def tools() -> List[dict]:
+    return [_tool(server) for server in registry.servers()] + [SEARCH_TOOL]
+
+
+def _server_for_tool(name: str) -> Optional[dict]:
+    for server in registry.servers():
+        if server["context"] == name:
+            return server
+    return None
+
+
+async def resolve(server: dict, arguments: Dict[str, Any]) -> dict:
+    """
+    Resolve a context query for one server, the way /mcp/batch resolves an item.
+    """
+    if not isinstance(arguments, dict):
+        raise RpcError(INVALID_PARAMS, "arguments must be an object")
+    try:
+        item = BatchItem(library=server["libraries"][0], **arguments)
+    except (TypeError, ValidationError) as e:
+        raise RpcError(INVALID_PARAMS, str(e))
+    return await resolve_item(item)
+
+
+def search(arguments: Dict[str, Any]) -> str:
+    if not arguments.get("q"):
+        raise RpcError(INVALID_PARAMS, "q is required")
+    ensure_indexed()
+    results = search_index.search(arguments["q"], limit=int(arguments.get("limit", 10)), library=arguments.get("library"))
+    if not results:
+        return "No results."
+    return "\n".join(f"- {r['library']}: {r['symbol']} ({r['score']}) {r['snippet']}" for r in results)
+
+
+async def call_tool(params: dict) -> dict:
+    name = params.get("name")
+    arguments = params.get("arguments") or {}
+    if name == SEARCH_TOOL["name"]:
+        return {"content": [{"type": "text", "text": search(arguments)}], "isError": False}
+    server = _server_for_tool(name)
+    if server is None:
+        raise RpcError(INVALID_PARAMS, f"Unknown tool: {name}")
+    try:
+        payload = await resolve(server, arguments)
+    except ValueError as e:
+        # Bad input the model can correct, reported as a tool error rather than a protocol error
+        return {"content": [{"type": "text", "text": str(e)}], "isError": True}
+    except Overloaded as e:
+        return {"content": [{"type": "text", "text": f"{e.detail} (retry in {e.retry_after} s)"}], "isError": True}
+    return {"content": [{"type": "text", "text": payload["context"]["documentation"]}], "isError": False}
+
+
+def resource_templates() -> List[dict]:
+    templates = []
+    for server in registry.servers():
+        names = ",".join(parameter.name for parameter in _parameters(server))
+        templates.append({
+            "uriTemplate": f"{server['libraries'][0]}://context{{?{names}}}",
+            "name": server["context"],
+            "description": server.get("description", server["name"]),
+            "mimeType": "text/markdown",
+        })
+    return templates
+
+
+def resources() -> List[dict]:
+    # Servers whose builder needs no arguments have an overview to list
+    listed = []
+    for server in registry.servers():
+        if all(parameter.default is not inspect.Parameter.empty for parameter in _parameters(server)):
+            listed.append({
+                "uri": f"{server['libraries'][0]}://context",
+                "name": server["name"],
+                "description": server.get("description", ""),
+                "mimeType": "text/markdown",
+            })
+    return listed
+
+
+async def read_resource(params: dict) -> dict:
+    uri = params.get("uri") or ""
+    parts = urlsplit(uri)
+    server = registry.server_for(parts.scheme)
+    if server is None or parts.netloc != "context":
+        raise RpcError(INVALID_PARAMS, f"Unknown resource: {uri}")
+    try:
+        payload = await resolve(server, dict(parse_qsl(parts.query)))
+    except ValueError as e:
+        raise RpcError(INVALID_PARAMS, str(e))
+    except Overloaded as e:
+        raise RpcError(SERVER_BUSY, f"{e.detail} (retry in {e.retry_after} s)")
+    return {"contents": [{"uri": uri, "mimeType": "text/markdown", "text": payload["context"]["documentation"]}]}
+
+
+class Session:
+    """
+    One client's protocol state. `handle` takes a single JSON-RPC message and
+    returns its response (None for notifications and cancelled requests);
+    callers run several `handle` calls concurrently to multiplex requests.
+    """
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.protocol_version = PROTOCOL_VERSIONS[0]
+        self.initialized = False
+        # Where responses go on transports that send them on a separate stream
+        self.outbox: Optional[asyncio.Queue] = None
+        self._in_flight: Dict[Any, asyncio.Task] = {}
+        self._cancelled = set()
+        self._tasks = set()
+
+    async def handle(self, message: Any) -> Optional[dict]:
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" or not isinstance(message.get("method"), str):
+            if isinstance(message, dict) and ("result" in message or "error" in message):
+                return None  # a response to a server request; this server sends none
+            return error_response(message.get("id") if isinstance(message, dict) else None,
+                                  INVALID_REQUEST, "Invalid Request")
+        if "id" not in message:
+            self._notify(message["method"], message.get("params") or {})
+            return None
+
+        request_id = message["id"]
+        if isinstance(request_id, (bool, dict, list)) or request_id is None:
+            return error_response(None, INVALID_REQUEST, "Request id must be a string or a number")
+        task = asyncio.ensure_future(self._dispatch(message["method"], message.get("params") or {}))
+        self._in_flight[request_id] = task
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if request_id in self._cancelled:
+                return None  # cancelled by the client: no response is sent
+            task.cancel()
+            raise
+        except RpcError as e:
+            return error_response(request_id, e.code, e.message)
+        except Exception as e:
+            print(f"Error handling {message['method']}: {str(e)}")
+            return error_response(request_id, INTERNAL_ERROR, str(e))
+        finally:
+            if self._in_flight.get(request_id) is task:
+                del self._in_flight[request_id]
+                self._cancelled.discard(request_id)
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _notify(self, method: str, params: dict):
+        if method == "notifications/initialized":
+            self.initialized = True
+        elif method == "notifications/cancelled":
+            request_id = params.get("requestId")
+            task = self._in_flight.get(request_id) if isinstance(request_id, (str, int)) else None
+            if task:
+                self._cancelled.add(request_id)
+                task.cancel()
+
+    def submit(self, message: Any, deliver: Callable[[dict], None]):
+        """
+        Handle a message in the background and pass its response, if any, to deliver.
+        """
+        task = asyncio.ensure_future(self._deliver(message, deliver))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, message: Any, deliver: Callable[[dict], None]):
+        response = await self.handle(message)
+        if response is not None:
+            deliver(response)
+
+    async def drain(self):
+        """
+        Wait for every submitted message to be answered.
+        """
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def close(self):
+        for task in [*self._in_flight.values(), *self._tasks]:
+            task.cancel()
+        if self.outbox is not None:
+            self.outbox.put_nowait(None)
+
+    async def _dispatch(self, method: str, params: dict) -> dict:
+        if method == "initialize":
+            return self._initialize(params)
+        if method == "ping":
+            return {}
+        if method == "tools/list":
+            return {"tools": tools()}
+        if method == "tools/call":
+            return await call_tool(params)
+        if method == "resources/list":
+            return {"resources": resources()}
+        if method == "resources/templates/list":
+            return {"resourceTemplates": resource_templates()}
+        if method == "resources/read":
+            return await read_resource(params)
+        raise RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+
+    def _initialize(self, params: dict) -> dict:
+        requested = params.get("protocolVersion")
+        self.protocol_version = requested if requested in PROTOCOL_VERSIONS else PROTOCOL_VERSIONS[0]
+        return {
+            "protocolVersion": self.protocol_version,
+            "capabilities": {"tools": {"listChanged": False}, "resources": {"listChanged": False}},
+            "serverInfo": SERVER_INFO,
+            "instructions": INSTRUCTIONS,
+        }
+
+
+_sessions: "OrderedDict[str, Session]" = OrderedDict()
+
+
+def open_session() -> Session:
+    session = Session()
+    _sessions[session.id] = session
+    while len(_sessions) > SESSION_LIMIT:
+        _, evicted = _sessions.popitem(last=False)
+        evicted.close()
+    return session
+
+
+def get_session(session_id: str) -> Optional[Session]:
+    session = _sessions.get(session_id)
+    if session is not None:
+        _sessions.move_to_end(session_id)
+    return session
+
+
+def close_session(session_id: str) -> bool:
+    session = _sessions.pop(session_id, None)
+    if session is None:
+        return False
+    session.close()
+    return True
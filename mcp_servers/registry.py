@@ -0,0 +1,119 @@
+"""
+The server registry in mcp.json, and lazy access to the routers it lists.
+
+Each entry names the module implementing it ("module"), the prefix its router
+is mounted under ("prefix"), its context builder ("context") and, for
+documentation servers, its resolver ("resolve"). Optional "lifespan" and
+"readiness" name a module's startup/shutdown context manager and its readiness
+report. Router modules are imported
+only when a server is enabled and first used, so a worker started with
+MCP_SERVERS=frontend-mcp,backend-mcp never imports the documentation routers.
+"""
+import importlib
+import json
+import os
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+REGISTRY_PATH = os.environ.get(
+    "MCP_REGISTRY", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mcp.json"))
+# Comma-separated server ids to serve; every registered server when unset
+ENABLED = [s.strip() for s in os.environ.get("MCP_SERVERS", "").split(",") if s.strip()]
+
+_servers: Optional[List[dict]] = None
+_by_library: Dict[str, dict] = {}
+_by_id: Dict[str, dict] = {}
+
+
+def servers() -> List[dict]:
+    """
+    Return the enabled registry entries, in mcp.json order.
+    """
+    global _servers
+    if _servers is None:
+        with open(REGISTRY_PATH, encoding="utf-8") as f:
+            registered = json.load(f)["servers"]
+        known = {server["id"] for server in registered}
+        unknown = [server_id for server_id in ENABLED if server_id not in known]
+        if unknown:
+            raise ValueError(f"Unknown server in MCP_SERVERS: {', '.join(unknown)}")
+        _servers = [server for server in registered if not ENABLED or server["id"] in ENABLED]
+        for server in _servers:
+            _by_id[server["id"]] = server
+            for library in server.get("libraries", ()):
+                _by_library.setdefault(library, server)
+    return _servers
+
+
+def server(server_id: str) -> Optional[dict]:
+    servers()
+    return _by_id.get(server_id)
+
+
+def server_for(library: str) -> Optional[dict]:
+    servers()
+    return _by_library.get(library)
+
+
+def load(server: dict) -> ModuleType:
+    return importlib.import_module(server["module"])
+
+
+def modules() -> List[ModuleType]:
+    return [load(server) for server in servers()]
+
+
+def context_builder(library: str) -> Optional[Callable]:
+    """
+    Return the context builder for a library (or alias), importing its router
+    module on first use, or None if no enabled server handles the library.
+    """
+    server = server_for(library)
+    if server is None:
+        return None
+    return getattr(load(server), server["context"])
+
+
+def resolver(server: dict) -> Callable:
+    """
+    Return a server's resolver, which maps a function name to (outcome, documentation).
+    """
+    return getattr(load(server), server["resolve"])
+
+
+def fallback_for(server: dict) -> Optional[dict]:
+    """
+    Return the enabled server behind a server's "fallbackEndpoint", if any.
+    """
+    if "fallbackEndpoint" not in server:
+        return None
+    path = urlsplit(server["fallbackEndpoint"]).path
+    for candidate in servers():
+        if candidate is not server and "resolve" in candidate and endpoint_path(candidate) == path:
+            return candidate
+    return None
+
+
+def section_streamer(library: str) -> Optional[Callable]:
+    """
+    Return the section-by-section documentation generator for a library, if its
+    server declares one ("stream").
+    """
+    server = server_for(library)
+    if server is None or "stream" not in server:
+        return None
+    return getattr(load(server), server["stream"])
+
+
+def hook(server: dict, name: str) -> Optional[Callable]:
+    """
+    Return the module function named by a server's optional field, or None.
+    """
+    if name not in server:
+        return None
+    return getattr(load(server), server[name])
+
+
+def endpoint_path(server: dict) -> str:
+    return urlsplit(server["endpoint"]).path
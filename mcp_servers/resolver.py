@@ -0,0 +1,113 @@
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+# How a documentation lookup was answered
+EXACT = "exact"        # a documented symbol or section matched
+FUZZY = "fuzzy"        # only related or general documentation was found
+FALLBACK = "fallback"  # nothing matched; a "not found" message was returned
+
+
+class Match(NamedTuple):
+    symbol: str
+    value: Any
+    # EXACT for whole segments, FUZZY for a prefix or substring of the name
+    kind: str = EXACT
+
+
+class SymbolResolver:
+    """
+    Resolve a requested function name to a documented symbol.
+
+    Symbols are indexed by their lowercase dotted segments, so resolving a name
+    is a handful of hash lookups regardless of how many symbols are indexed.
+    A symbol matches on whole segments first ("client" does not match
+    "boto3.resource_client_helper"), and the longest match wins, ties going to
+    the leftmost one. Failing that, a symbol whose last segment begins a
+    segment of the name up to a camelCase or "_" word boundary matches
+    ("auth.signIn" for "auth.signInWithEmailAndPassword", but "client" not
+    for "clientele"), longest symbol first. With substring=True, a last
+    resort matches the first symbol (in registration order) that occurs
+    anywhere in the name, as the routers used to. Both fallbacks are FUZZY
+    matches.
+    """
+
+    def __init__(self, prefixes: Iterable[str] = (), entries: Optional[Dict[str, Any]] = None,
+                 substring: bool = False):
+        # Longest prefix first so "openai.agents." wins over "openai."
+        self.prefixes = tuple(sorted((p.lower() for p in prefixes), key=len, reverse=True))
+        self.substring = substring
+        self._index: Dict[Tuple[str, ...], Match] = {}
+        self._max_segments = 0
+        # Lengths of the symbols' last segments, longest first, for prefix matching
+        self._tail_lengths: Tuple[int, ...] = ()
+        self._ordered: Dict[str, Match] = {}
+        for symbol, value in (entries or {}).items():
+            self.add(symbol, value)
+
+    def __len__(self):
+        return len(self._index)
+
+    def add(self, symbol: str, value: Any):
+        key = self._segments(symbol)
+        if not key:
+            return
+        # First registration wins, matching dict order of the source table
+        match = self._index.setdefault(key, Match(symbol, value))
+        self._ordered.setdefault(".".join(key), match)
+        self._max_segments = max(self._max_segments, len(key))
+        if len(key[-1]) not in self._tail_lengths:
+            self._tail_lengths = tuple(sorted(self._tail_lengths + (len(key[-1]),), reverse=True))
+
+    def strip_prefix(self, name: str) -> str:
+        """
+        Remove a library prefix such as "boto3." from name, preserving its case.
+        """
+        lowered = name.lower()
+        for prefix in self.prefixes:
+            if lowered.startswith(prefix):
+                return name[len(prefix):]
+        return name
+
+    def resolve(self, name: str) -> Optional[Match]:
+        parts = self._parts(self.strip_prefix(name.strip()))
+        segments = tuple(part.lower() for part in parts)
+        for length in range(min(len(segments), self._max_segments), 0, -1):
+            for start in range(len(segments) - length + 1):
+                match = self._index.get(segments[start:start + length])
+                if match is not None:
+                    return match
+        match = self._resolve_prefix(parts, segments) or (self._resolve_substring(segments) if self.substring else None)
+        return match._replace(kind=FUZZY) if match else None
+
+    def _resolve_prefix(self, parts: Tuple[str, ...], segments: Tuple[str, ...]) -> Optional[Match]:
+        # Same spans as above, with the last segment cut at each indexed length
+        # that ends a word of it
+        for length in range(min(len(segments), self._max_segments), 0, -1):
+            for start in range(len(segments) - length + 1):
+                end = start + length - 1
+                head, tail = segments[start:end], segments[end]
+                for size in self._tail_lengths:
+                    if size < len(tail) and self._word_boundary(parts[end], size):
+                        match = self._index.get(head + (tail[:size],))
+                        if match is not None:
+                            return match
+        return None
+
+    def _resolve_substring(self, segments: Tuple[str, ...]) -> Optional[Match]:
+        name = ".".join(segments)
+        for symbol, match in self._ordered.items():
+            if symbol in name:
+                return match
+        return None
+
+    @staticmethod
+    def _word_boundary(part: str, size: int) -> bool:
+        # "signIn|With", "resource|_client": the next word starts at size
+        return part[size] == "_" or part[size].isupper()
+
+    @staticmethod
+    def _parts(name: str) -> Tuple[str, ...]:
+        return tuple(part for part in name.split(".") if part)
+
+    @classmethod
+    def _segments(cls, name: str) -> Tuple[str, ...]:
+        return tuple(part.lower() for part in cls._parts(name))
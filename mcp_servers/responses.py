@@ -0,0 +1,146 @@
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from mcp_servers.doc_cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # optional: only used when MCP_FAST_JSON is enabled
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional: br is only offered when installed
+    brotli = None
+
+FAST_JSON = os.environ.get("MCP_FAST_JSON", "").lower() in ("1", "true", "yes") and orjson is not None
+COMPRESS_MIN_SIZE = int(os.environ.get("MCP_COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.environ.get("MCP_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.environ.get("MCP_BROTLI_QUALITY", "5"))
+
+# Preference order when a client accepts several encodings
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+class EncodedPayload:
+    """
+    A serialized payload, its ETag and any compressed variants produced so far.
+    """
+
+    __slots__ = ("body", "etag", "_variants")
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = etag
+        self._variants: Dict[str, bytes] = {}
+
+    def compressed(self, encoding: str) -> bytes:
+        data = self._variants.get(encoding)
+        if data is None:
+            if encoding == "br":
+                data = brotli.compress(self.body, quality=BROTLI_QUALITY)
+            else:
+                data = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+            self._variants[encoding] = data
+        return data
+
+
+# Encoded payloads keyed by the caller's cache key. Keys embed a catalog
+# version where the data can change, so stale renders simply age out.
+response_cache = TTLCache(
+    "responses",
+    maxsize=int(os.environ.get("MCP_RESPONSE_CACHE_SIZE", "2048")),
+    ttl=float("inf"),
+    stale_ttl=0.0,
+)
+
+
+def dumps(payload: Any) -> bytes:
+    if FAST_JSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_payload(payload: Any) -> EncodedPayload:
+    body = dumps(payload)
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    return EncodedPayload(body, etag)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the preferred content-coding the client accepts, or None for identity.
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    # Each content-coding is a distinct representation and needs its own strong ETag
+    return etag if encoding is None else etag[:-1] + f'-{encoding}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/")
+        if candidate == "*" or candidate == etag:
+            return True
+        for encoding in ENCODINGS:
+            if candidate == variant_etag(etag, encoding):
+                return True
+    return False
+
+
+def json_response(
+    request: Request,
+    payload: Any = None,
+    *,
+    key: Optional[Hashable] = None,
+    build: Optional[Callable[[], Any]] = None,
+) -> Response:
+    """
+    Serialize a payload with a content-hash ETag, answering 304 when the client
+    already holds it and compressing bodies above COMPRESS_MIN_SIZE when the
+    client accepts it. With `key` and `build`, the payload is encoded (and each
+    compressed variant produced) once and reused until it is evicted.
+    """
+    encoded = response_cache.get(key) if key is not None else None
+    if encoded is None:
+        encoded = encode_payload(build() if build is not None else payload)
+        if key is not None:
+            response_cache.set(key, encoded)
+
+    encoding = None
+    if len(encoded.body) >= COMPRESS_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    headers = {"ETag": variant_etag(encoded.etag, encoding), "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), encoded.etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return Response(encoded.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(encoded.compressed(encoding), media_type="application/json", headers=headers)
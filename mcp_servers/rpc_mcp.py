@@ -0,0 +1,108 @@
+import asyncio
+import json
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from mcp_servers.protocol import (
+    INVALID_REQUEST, PARSE_ERROR, Session, close_session, error_response, get_session, is_request, open_session,
+)
+from mcp_servers.sse_mcp import sse_event
+
+router = APIRouter()
+
+SESSION_HEADER = "Mcp-Session-Id"
+
+def parse_messages(body: bytes):
+    """
+    Return the JSON-RPC messages in a request body, whether it was a batch, and
+    an error response if it could not be parsed.
+    """
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return [], False, JSONResponse(error_response(None, PARSE_ERROR, "Parse error"), status_code=400)
+    if payload == []:
+        return [], True, JSONResponse(error_response(None, INVALID_REQUEST, "Invalid Request"), status_code=400)
+    return (payload, True, None) if isinstance(payload, list) else ([payload], False, None)
+
+async def stream_responses(pending):
+    """
+    Send each response as soon as its request completes, in completion order.
+    """
+    try:
+        for next_done in asyncio.as_completed(pending):
+            response = await next_done
+            if response is not None:
+                yield sse_event("message", response)
+    finally:
+        # The client went away: stop the requests still running
+        for task in pending:
+            task.cancel()
+
+@router.post("/mcp")
+async def mcp_post(request: Request):
+    """
+    Streamable HTTP transport: POST one JSON-RPC message or a batch. Requests
+    in a batch run concurrently; with `Accept: text/event-stream` each response
+    is streamed as soon as it is ready, otherwise they are returned together.
+    """
+    messages, batch, error = parse_messages(await request.body())
+    if error:
+        return error
+
+    session_id = request.headers.get(SESSION_HEADER)
+    headers = {}
+    if session_id:
+        session = get_session(session_id)
+        if session is None:
+            return JSONResponse(error_response(None, INVALID_REQUEST, "Unknown or expired session"), status_code=404)
+    elif any(isinstance(m, dict) and m.get("method") == "initialize" for m in messages):
+        session = open_session()
+        headers[SESSION_HEADER] = session.id
+    else:
+        # Without a session each POST is served on its own
+        session = Session()
+
+    pending = [asyncio.ensure_future(session.handle(message)) for message in messages]
+    requests = sum(1 for message in messages if is_request(message))
+    if requests > 1 and "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            stream_responses(pending),
+            media_type="text/event-stream",
+            headers={**headers, "Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    responses = [response for response in await asyncio.gather(*pending) if response is not None]
+    if not responses:
+        return Response(status_code=202, headers=headers)
+    return JSONResponse(responses if batch else responses[0], headers=headers)
+
+@router.get("/mcp")
+async def mcp_get():
+    # This server never initiates messages, so there is no stream to open
+    return Response(status_code=405, headers={"Allow": "POST, DELETE"})
+
+@router.delete("/mcp")
+async def mcp_delete(request: Request):
+    """
+    End a session, cancelling its requests still in flight.
+    """
+    if not close_session(request.headers.get(SESSION_HEADER, "")):
+        return Response(status_code=404)
+    return Response(status_code=200)
+
+@router.post("/messages")
+async def legacy_messages(request: Request, session_id: str = Query(...)):
+    """
+    HTTP+SSE transport: messages posted here are answered on the session's
+    /sse stream, each as soon as it completes.
+    """
+    session = get_session(session_id)
+    if session is None or session.outbox is None:
+        return JSONResponse(error_response(None, INVALID_REQUEST, "Unknown or expired session"), status_code=404)
+    messages, _, error = parse_messages(await request.body())
+    if error:
+        return error
+    for message in messages:
+        session.submit(message, session.outbox.put_nowait)
+    return Response(status_code=202)
@@ -0,0 +1,132 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+TERM_RE = re.compile(r"[a-z0-9_]+")
+SNIPPET_RADIUS = 80
+
+
+def tokenize(text: str) -> List[str]:
+    return TERM_RE.findall(text.lower())
+
+
+class Document(NamedTuple):
+    library: str
+    symbol: str
+    text: str
+    length: int
+    group: Optional[str]
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index with BM25 ranking.
+
+    Documents can be added and removed one at a time or replaced as a group
+    (e.g. every section of one scraped page), so refreshed pages update the
+    index without rebuilding it.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._docs: Dict[int, Document] = {}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._groups: Dict[str, List[int]] = {}
+        self._keys: Counter = Counter()
+        self._total_length = 0
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def contains(self, library: str, symbol: str) -> bool:
+        return self._keys[(library, symbol.lower())] > 0
+
+    def add(self, library: str, symbol: str, text: str, group: Optional[str] = None) -> int:
+        terms = Counter(tokenize(symbol) + tokenize(text))
+        doc_id = self._next_id
+        self._next_id += 1
+        length = sum(terms.values())
+        self._docs[doc_id] = Document(library, symbol, text, length, group)
+        self._keys[(library, symbol.lower())] += 1
+        self._total_length += length
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        if group is not None:
+            self._groups.setdefault(group, []).append(doc_id)
+        return doc_id
+
+    def remove(self, doc_id: int):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self._keys[(doc.library, doc.symbol.lower())] -= 1
+        self._total_length -= doc.length
+        for term in set(tokenize(doc.symbol) + tokenize(doc.text)):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def replace_group(self, group: str, documents: Iterable[Tuple[str, str, str]]):
+        """
+        Atomically swap every document in `group` for the given (library, symbol, text) tuples.
+        """
+        for doc_id in self._groups.pop(group, []):
+            self.remove(doc_id)
+        for library, symbol, text in documents:
+            self.add(library, symbol, text, group)
+
+    def search(self, query: str, limit: int = 10, library: Optional[str] = None) -> List[dict]:
+        terms = set(tokenize(query))
+        if not terms or not self._docs:
+            return []
+
+        n = len(self._docs)
+        avg_length = self._total_length / n or 1.0
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                doc = self._docs[doc_id]
+                if library and doc.library != library:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * doc.length / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        results = []
+        for doc_id, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1]):
+            doc = self._docs[doc_id]
+            results.append({
+                "library": doc.library,
+                "symbol": doc.symbol,
+                "score": round(score, 4),
+                "snippet": snippet(doc.text, terms),
+            })
+        return results
+
+
+def snippet(text: str, terms) -> str:
+    """
+    Return a short window of text around the first matching term.
+    """
+    lowered = text.lower()
+    positions = [pos for pos in (lowered.find(term) for term in terms) if pos >= 0]
+    start = max(min(positions, default=0) - SNIPPET_RADIUS, 0)
+    window = " ".join(text[start:start + 2 * SNIPPET_RADIUS].split())
+    if start > 0:
+        window = "..." + window
+    if start + 2 * SNIPPET_RADIUS < len(text):
+        window += "..."
+    return window
+
+
+# Shared index over every documentation corpus served by the app
+search_index = InvertedIndex()
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Query, Request
+from typing import Optional
+
+from mcp_servers import registry
+from mcp_servers.doc_index import SectionIndex
+from mcp_servers.responses import json_response
+from mcp_servers.search import search_index
+from mcp_servers.semantic import Neighbour, semantic_index
+from mcp_servers.snapshot import get_snapshot
+
+router = APIRouter()
+
+_indexed = False
+
+def build_search_index():
+    """
+    Index every enabled router (and the offline snapshot, if open) for full-text
+    and nearest-neighbour lookups. Scraped Agents pages are added incrementally
+    as they are loaded.
+    """
+    global _indexed
+    for module in registry.modules():
+        documents = list(module.search_documents())
+        search_index.replace_group(module.__name__, documents)
+        semantic_index.replace_group(module.__name__, documents)
+
+    snapshot = get_snapshot()
+    if snapshot:
+        documents = []
+        for library, symbol, doc in snapshot.all_docs():
+            if not search_index.contains(library, symbol):
+                documents.append((library, symbol, doc))
+        search_index.replace_group("snapshot", documents)
+        semantic_index.replace_group("snapshot", documents)
+        for url, content in snapshot.pages():
+            index = SectionIndex.from_markdown(content)
+            sections = [("openai-agents", section.heading, section.text) for section in index.sections]
+            search_index.replace_group(url, sections)
+            semantic_index.replace_group(url, sections)
+    _indexed = True
+
+def ensure_indexed():
+    if not _indexed:
+        build_search_index()
+
+def nearest_document(library: str, name: str) -> Optional[Neighbour]:
+    """
+    Return the indexed symbol or section of a library closest to name, if any is close enough.
+    """
+    ensure_indexed()
+    neighbours = semantic_index.nearest(name, k=1, library=library)
+    return neighbours[0] if neighbours else None
+
+@router.get("/search")
+async def search_docs(
+    request: Request,
+    q: str = Query(..., description="Search terms, e.g. region_name"),
+    library: Optional[str] = Query(None, description="Restrict results to one library"),
+    limit: int = Query(10, ge=1, le=100),
+):
+    """
+    Full-text search across every documentation corpus, ranked with BM25.
+    """
+    ensure_indexed()
+
+    return json_response(request, {
+        "query": q,
+        "results": search_index.search(q, limit=limit, library=library),
+    })
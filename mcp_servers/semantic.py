@@ -0,0 +1,228 @@
+"""
+Nearest-neighbour lookup over documentation, for names no resolver knows.
+
+Every symbol and section is embedded as a hashed bag of character trigrams of
+its name plus the words of its text, L2-normalised. Vectors are kept as the
+columns of one NumPy matrix per library, so a lookup only touches the matrix
+rows of the query's few non-zero features and its library's columns.
+
+NumPy is imported only when the first document is indexed, so a worker that
+never searches never loads it.
+"""
+import os
+import re
+import zlib
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DIM = int(os.environ.get("MCP_SEMANTIC_DIM", "512"))
+# Cosine similarity below which a neighbour is not considered a match
+MIN_SCORE = float(os.environ.get("MCP_SEMANTIC_MIN_SCORE", "0.45"))
+# Words of a document's text that contribute to its vector, and their weight
+TEXT_WORDS = 64
+TEXT_WEIGHT = 0.25
+# Columns a library's matrix starts with; it doubles whenever it fills up
+INITIAL_COLUMNS = 256
+
+CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _numpy():
+    import numpy
+    return numpy
+
+
+def _bucket(feature: str) -> int:
+    # crc32 rather than hash() so vectors are the same in every process
+    return zlib.crc32(feature.encode("utf-8")) % DIM
+
+
+def embed(name: str, text: str = "") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Return the sparse (indices, values) vector for a name and optional text.
+    """
+    np = _numpy()
+    words = WORD_RE.findall(CAMEL_RE.sub(" ", name).lower())
+    weights: Dict[int, float] = {}
+    padded = f" {' '.join(words)} "
+    for i in range(len(padded) - 2):
+        bucket = _bucket(padded[i:i + 3])
+        weights[bucket] = weights.get(bucket, 0.0) + 1.0
+    for word in words + WORD_RE.findall(text[:TEXT_WORDS * 12].lower())[:TEXT_WORDS]:
+        bucket = _bucket("w:" + word)
+        weights[bucket] = weights.get(bucket, 0.0) + TEXT_WEIGHT
+    if not weights:
+        return np.empty(0, np.int64), np.empty(0, np.float32)
+    indices = np.fromiter(weights.keys(), np.int64, len(weights))
+    values = np.fromiter(weights.values(), np.float32, len(weights))
+    return indices, values / np.linalg.norm(values)
+
+
+class Neighbour(NamedTuple):
+    score: float
+    library: str
+    symbol: str
+    text: str
+
+
+class _Entry(NamedTuple):
+    library: str
+    symbol: str
+    text: str
+    group: Optional[str]
+
+
+class _Block:
+    """
+    One library's vectors, a column each, in a matrix that grows by doubling.
+    Removed columns are zeroed and reused by the next documents added.
+    """
+
+    def __init__(self):
+        np = _numpy()
+        self.matrix = np.zeros((DIM, INITIAL_COLUMNS), np.float32)
+        self.columns: List[Optional[_Entry]] = []
+        self.free: List[int] = []
+
+    def add(self, entry: _Entry) -> int:
+        indices, values = embed(entry.symbol, entry.text)
+        if self.free:
+            column = self.free.pop()
+            self.columns[column] = entry
+        else:
+            column = len(self.columns)
+            if column == self.matrix.shape[1]:
+                np = _numpy()
+                grown = np.zeros((DIM, 2 * column), np.float32)
+                grown[:, :column] = self.matrix
+                self.matrix = grown
+            self.columns.append(entry)
+        self.matrix[indices, column] = values
+        return column
+
+    def remove(self, column: int):
+        self.matrix[:, column] = 0.0
+        self.columns[column] = None
+        self.free.append(column)
+
+
+class SemanticIndex:
+    """
+    Hashed n-gram vectors for every indexed symbol and section, with top-k
+    cosine similarity lookups. Like the search index, documents can be
+    replaced a group at a time. Documents are embedded as they are added, so
+    replacing a group only touches that group's columns and lookups never
+    rebuild anything.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, Tuple[_Entry, int]] = {}
+        self._groups: Dict[str, List[int]] = {}
+        self._blocks: Dict[str, _Block] = {}
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, library: str, symbol: str, text: str, group: Optional[str] = None) -> int:
+        entry = _Entry(library, symbol, text, group)
+        block = self._blocks.get(library)
+        if block is None:
+            block = self._blocks[library] = _Block()
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (entry, block.add(entry))
+        if group is not None:
+            self._groups.setdefault(group, []).append(entry_id)
+        return entry_id
+
+    def replace_group(self, group: str, documents: Iterable[Tuple[str, str, str]]):
+        """
+        Swap every document in `group` for the given (library, symbol, text) tuples.
+        """
+        for entry_id in self._groups.pop(group, []):
+            entry, column = self._entries.pop(entry_id)
+            self._blocks[entry.library].remove(column)
+        for library, symbol, text in documents:
+            self.add(library, symbol, text, group)
+
+    def _searched(self, library: Optional[str]) -> List[_Block]:
+        if library is None:
+            return list(self._blocks.values())
+        block = self._blocks.get(library)
+        return [block] if block is not None else []
+
+    def _top(self, block: _Block, scores: "np.ndarray", k: int, min_score: float) -> List[Neighbour]:
+        np = _numpy()
+        if min_score > 0:
+            # Usually only a handful of columns clear the threshold; free ones score 0
+            best = np.flatnonzero(scores >= min_score)
+            wanted = k
+        else:
+            # Look at enough candidates to skip past the free columns
+            best = np.arange(len(scores))
+            wanted = k + len(block.free)
+        if wanted < len(best):
+            best = best[np.argpartition(scores[best], len(best) - wanted)[-wanted:]]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        neighbours = []
+        for column in best:
+            entry = block.columns[column]
+            if entry is None:
+                continue
+            score = float(scores[column])
+            if score < min_score or len(neighbours) == k:
+                break
+            neighbours.append(Neighbour(score, entry.library, entry.symbol, entry.text))
+        return neighbours
+
+    def nearest(self, query: str, k: int = 5, library: Optional[str] = None,
+                min_score: float = MIN_SCORE) -> List[Neighbour]:
+        """
+        Return up to k documents most similar to query, best first.
+        """
+        np = _numpy()
+        indices, values = embed(query)
+        if not len(indices):
+            return []
+        neighbours = []
+        for block in self._searched(library):
+            count = len(block.columns)
+            if not count:
+                continue
+            # Only the query's non-zero features contribute to the dot products;
+            # each is a contiguous row slice, so nothing is gathered or copied
+            matrix = block.matrix
+            scores = matrix[indices[0], :count] * values[0]
+            scaled = np.empty_like(scores)
+            for index, value in zip(indices[1:], values[1:]):
+                np.multiply(matrix[index, :count], value, out=scaled)
+                scores += scaled
+            neighbours.extend(self._top(block, scores, k, min_score))
+        return sorted(neighbours, key=lambda neighbour: -neighbour.score)[:k]
+
+    def nearest_many(self, queries: Sequence[str], k: int = 5, library: Optional[str] = None,
+                     min_score: float = MIN_SCORE) -> List[List[Neighbour]]:
+        """
+        Look up several queries with a single matrix product per library.
+        """
+        np = _numpy()
+        results: List[List[Neighbour]] = [[] for _ in queries]
+        blocks = [block for block in self._searched(library) if block.columns]
+        if not blocks or not queries:
+            return results
+        batch = np.zeros((len(queries), DIM), np.float32)
+        for row, query in enumerate(queries):
+            indices, values = embed(query)
+            batch[row, indices] = values
+        for block in blocks:
+            scores = batch @ block.matrix[:, :len(block.columns)]
+            for found, row in zip(results, scores):
+                found.extend(self._top(block, row, k, min_score))
+        return [sorted(found, key=lambda neighbour: -neighbour.score)[:k] for found in results]
+
+
+semantic_index = SemanticIndex()
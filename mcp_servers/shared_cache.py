@@ -0,0 +1,182 @@
+"""
+Cache shared by every uvicorn worker on a host.
+
+Set MCP_SHARED_CACHE to a file path and fetched pages and extracted sections
+are kept in a SQLite database (WAL mode, one transaction per write) that all
+workers read and write. Each worker keeps its own small in-memory cache in
+front of it. A worker missing an entry takes a short lease on the key before
+loading it, and the others wait for its result instead of fetching the same
+page themselves, so the fleet fetches each page once per TTL. The file
+outlives the workers, so a restarted worker starts warm. Async callers
+reach the database through a worker thread, so a busy or locked database
+never stalls the event loop.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+SHARED_CACHE_PATH = os.environ.get("MCP_SHARED_CACHE")
+# Seconds another worker may hold a key's lease while it loads the value
+LEASE_TIMEOUT = float(os.environ.get("MCP_SHARED_CACHE_LEASE", "15"))
+LEASE_POLL_INTERVAL = 0.05
+# Entries older than this are deleted; a restarted worker never sees them
+MAX_AGE = float(os.environ.get("MCP_SHARED_CACHE_MAX_AGE", "86400"))
+PRUNE_EVERY = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS leases (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+"""
+
+
+class SharedCache:
+    """
+    JSON values keyed by (namespace, key) in a SQLite file shared between processes.
+    Ages are measured in wall-clock time, which every worker agrees on.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        # The connection is shared by the event loop's worker threads
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+
+    def get(self, namespace: str, key: str, max_age: float) -> Optional[Any]:
+        """
+        Return the value stored under key if it is younger than max_age seconds, else None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ? AND stored_at > ?",
+                (namespace, key, time.time() - max_age),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, namespace: str, key: str, value: Any):
+        encoded = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (namespace, key, encoded, time.time()),
+            )
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                self._conn.execute("DELETE FROM entries WHERE stored_at < ?", (time.time() - MAX_AGE,))
+
+    async def get_async(self, namespace: str, key: str, max_age: float) -> Optional[Any]:
+        return await asyncio.to_thread(self.get, namespace, key, max_age)
+
+    async def set_async(self, namespace: str, key: str, value: Any):
+        await asyncio.to_thread(self.set, namespace, key, value)
+
+    def _acquire(self, namespace: str, key: str) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO leases VALUES (?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET expires_at = excluded.expires_at "
+                "WHERE leases.expires_at < ?",
+                (namespace, key, now + LEASE_TIMEOUT, now),
+            )
+            return cursor.rowcount == 1
+
+    def _release(self, namespace: str, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM leases WHERE namespace = ? AND key = ?", (namespace, key))
+
+    async def get_or_load(self, namespace: str, key: str, max_age: float,
+                          loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the shared value for key, loading and storing it on a miss. If
+        another worker is already loading the key, wait (up to LEASE_TIMEOUT)
+        for its result. A None result is returned but never stored.
+        """
+        value = await self.get_async(namespace, key, max_age)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        deadline = time.monotonic() + LEASE_TIMEOUT
+        leased = await asyncio.to_thread(self._acquire, namespace, key)
+        if not leased:
+            self.waits += 1
+        while not leased and time.monotonic() < deadline:
+            await asyncio.sleep(LEASE_POLL_INTERVAL)
+            value = await self.get_async(namespace, key, max_age)
+            if value is not None:
+                return value
+            # The holder released its lease without storing anything, or gave up
+            leased = await asyncio.to_thread(self._acquire, namespace, key)
+
+        try:
+            value = await loader()
+            if value is not None:
+                await self.set_async(namespace, key, value)
+            return value
+        finally:
+            if leased:
+                await asyncio.to_thread(self._release, namespace, key)
+
+    def stats(self) -> dict:
+        return {"path": self.path, "hits": self.hits, "misses": self.misses, "waits": self.waits}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared: Optional[SharedCache] = None
+
+
+def open_shared_cache(path: Optional[str] = None) -> Optional[SharedCache]:
+    """
+    Open the configured shared cache, if any. Called once per worker at app startup.
+    """
+    global _shared
+    path = path or SHARED_CACHE_PATH
+    if path and _shared is None:
+        _shared = SharedCache(path)
+    return _shared
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    return _shared
+
+
+def close_shared_cache():
+    global _shared
+    if _shared is not None:
+        _shared.close()
+        _shared = None
+
+
+async def load_shared(namespace: str, key: str, max_age: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Load through the shared cache when one is open, or call loader directly.
+    """
+    if _shared is None:
+        return await loader()
+    return await _shared.get_or_load(namespace, key, max_age, loader)
@@ -0,0 +1,213 @@
+"""
+Offline documentation snapshots.
+
+A snapshot is a single SQLite file holding extracted documentation pages and
+per-library symbol docs. The server opens it read-only and memory-mapped, so
+every uvicorn worker shares the same OS page cache instead of scraping and
+holding its own copy.
+
+Build one with:
+
+    python -m mcp_servers.snapshot --output docs.db --html-dir saved_pages/
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+from typing import Iterator, Optional, Tuple
+
+SNAPSHOT_PATH = os.environ.get("MCP_DOCS_SNAPSHOT")
+# Skip live scraping entirely and serve only the snapshot and built-in docs
+OFFLINE = os.environ.get("MCP_DOCS_OFFLINE", "").lower() in ("1", "true", "yes")
+MMAP_SIZE = int(os.environ.get("MCP_SNAPSHOT_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE pages (
+    url TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (url, kind)
+) WITHOUT ROWID;
+CREATE TABLE docs (
+    library TEXT NOT NULL,
+    symbol_key TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    documentation TEXT NOT NULL,
+    PRIMARY KEY (library, symbol_key)
+) WITHOUT ROWID;
+"""
+
+
+class DocSnapshot:
+    """
+    Read-only view over a snapshot file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        uri = f"file:{os.path.abspath(path)}?mode=ro&immutable=1"
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+
+    def page(self, url: str, kind: str = "content") -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT content FROM pages WHERE url = ? AND kind = ?", (url, kind)
+        ).fetchone()
+        return row[0] if row else None
+
+    def doc(self, library: str, symbol: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT documentation FROM docs WHERE library = ? AND symbol_key = ?",
+            (library, symbol.lower()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def docs(self, library: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (symbol, documentation) pairs for a library.
+        """
+        yield from self._conn.execute(
+            "SELECT symbol, documentation FROM docs WHERE library = ? ORDER BY symbol_key",
+            (library,),
+        )
+
+    def pages(self, kind: str = "content") -> Iterator[Tuple[str, str]]:
+        """
+        Yield (url, content) pairs for every stored page.
+        """
+        yield from self._conn.execute("SELECT url, content FROM pages WHERE kind = ? ORDER BY url", (kind,))
+
+    def all_docs(self) -> Iterator[Tuple[str, str, str]]:
+        """
+        Yield (library, symbol, documentation) for every stored symbol.
+        """
+        yield from self._conn.execute("SELECT library, symbol, documentation FROM docs ORDER BY library, symbol_key")
+
+    def close(self):
+        self._conn.close()
+
+
+_snapshot: Optional[DocSnapshot] = None
+
+
+def open_snapshot(path: Optional[str] = None) -> Optional[DocSnapshot]:
+    """
+    Open the configured snapshot, if any. Called once at app startup.
+    """
+    global _snapshot
+    path = path or SNAPSHOT_PATH
+    if path and _snapshot is None:
+        _snapshot = DocSnapshot(path)
+    return _snapshot
+
+
+def get_snapshot() -> Optional[DocSnapshot]:
+    return _snapshot
+
+
+def close_snapshot():
+    global _snapshot
+    if _snapshot is not None:
+        _snapshot.close()
+        _snapshot = None
+
+
+def page_url(base_url: str, relative_path: str) -> str:
+    """
+    Map a saved file (e.g. "documentation/agents/index.html") back to the URL it was saved from.
+    """
+    relative_path = relative_path.replace(os.sep, "/")
+    if relative_path == "index.html":
+        return base_url
+    if relative_path.endswith("/index.html"):
+        return base_url + relative_path[: -len("index.html")]
+    if relative_path.endswith(".html"):
+        return base_url + relative_path[: -len(".html")] + "/"
+    return base_url + relative_path
+
+
+def iter_html_pages(html_dir: str, base_url: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (url, html) for every saved page under html_dir.
+    """
+    for root, _, files in os.walk(html_dir):
+        for name in sorted(files):
+            if not name.endswith((".html", ".htm")):
+                continue
+            path = os.path.join(root, name)
+            with open(path, encoding="utf-8", errors="replace") as f:
+                yield page_url(base_url, os.path.relpath(path, html_dir)), f.read()
+
+
+def iter_mock_docs() -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (library, symbol, documentation) from the built-in mock tables.
+    """
+    from mcp_servers import aws_mcp, firebase_mcp, openai_agents_mcp, openai_mcp
+
+    for library, module in (
+        ("openai", openai_mcp),
+        ("firebase", firebase_mcp),
+        ("aws", aws_mcp),
+        ("openai-agents", openai_agents_mcp),
+    ):
+        for symbol, documentation in module.mock_docs.items():
+            yield library, symbol, documentation
+
+
+def build_snapshot(output: str, html_dirs=(), base_url: Optional[str] = None, include_mock: bool = True) -> dict:
+    """
+    Write a snapshot to `output` atomically and return ingestion counts.
+    """
+    from mcp_servers import openai_agents_mcp
+
+    base_url = base_url or openai_agents_mcp.base_url
+    counts = {"pages": 0, "docs": 0}
+
+    fd, tmp_path = tempfile.mkstemp(prefix=".snapshot-", dir=os.path.dirname(os.path.abspath(output)))
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        conn.executescript(SCHEMA)
+        conn.execute("INSERT INTO meta VALUES ('base_url', ?)", (base_url,))
+
+        for html_dir in html_dirs:
+            for url, html in iter_html_pages(html_dir, base_url):
+                content = openai_agents_mcp.extract_page_content(html)
+                if content:
+                    conn.execute("INSERT OR REPLACE INTO pages VALUES (?, 'content', ?)", (url, content))
+                    counts["pages"] += 1
+
+        if include_mock:
+            for library, symbol, documentation in iter_mock_docs():
+                conn.execute(
+                    "INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?)",
+                    (library, symbol.lower(), symbol, documentation),
+                )
+                counts["docs"] += 1
+
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+        os.replace(tmp_path, output)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build an offline documentation snapshot.")
+    parser.add_argument("--output", "-o", required=True, help="Path of the snapshot file to write")
+    parser.add_argument("--html-dir", action="append", default=[], help="Directory of saved documentation HTML (repeatable)")
+    parser.add_argument("--base-url", help="URL the saved HTML was downloaded from (defaults to the OpenAI Agents docs)")
+    parser.add_argument("--no-mock", action="store_true", help="Do not ingest the built-in mock documentation tables")
+    args = parser.parse_args(argv)
+
+    counts = build_snapshot(args.output, args.html_dir, args.base_url, include_mock=not args.no_mock)
+    print(f"Wrote {args.output}: {counts['pages']} pages, {counts['docs']} symbol docs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import asyncio
+import json
+import os
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+
+from mcp_servers import registry
+from mcp_servers.admission import Overloaded
+from mcp_servers.batch_mcp import BatchItem, resolve_item
+from mcp_servers.doc_index import split_sections
+from mcp_servers.protocol import close_session, open_session
+
+router = APIRouter()
+
+HEARTBEAT_INTERVAL = float(os.environ.get("MCP_SSE_HEARTBEAT", "15"))
+# Sections buffered ahead of a slow client before extraction pauses
+QUEUE_SIZE = int(os.environ.get("MCP_SSE_QUEUE_SIZE", "8"))
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def iter_sections(item: BatchItem):
+    """
+    Yield the documentation for a query one section at a time.
+    """
+    stream = registry.section_streamer(item.library)
+    if stream is not None:
+        if not item.function:
+            raise ValueError("function is required")
+        async for section in stream(item.function):
+            yield section
+        return
+
+    payload = await resolve_item(item)
+    for section in split_sections(payload["context"]["documentation"]):
+        yield section
+
+async def event_stream(request: Request, item: BatchItem):
+    """
+    Relay sections through a bounded queue so extraction runs ahead of the client
+    by at most QUEUE_SIZE sections, sending a heartbeat comment whenever the
+    stream has been idle for HEARTBEAT_INTERVAL seconds.
+    """
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+    async def produce():
+        try:
+            count = 0
+            async for section in iter_sections(item):
+                await queue.put(sse_event("section", {"index": count, "documentation": section}))
+                count += 1
+            await queue.put(sse_event("done", {"library": item.library, "function": item.function, "sections": count}))
+        except Overloaded as e:
+            await queue.put(sse_event("error", {"error": e.detail, "retry_after": e.retry_after}))
+        except Exception as e:
+            await queue.put(sse_event("error", {"error": str(e)}))
+        # Not in a finally: once cancelled, nobody reads the queue, and a put
+        # into a full one would never return
+        await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": heartbeat\n\n"
+                continue
+            if message is None:
+                break
+            yield message
+    finally:
+        producer.cancel()
+
+async def session_stream(request: Request):
+    """
+    MCP over HTTP+SSE: announce where to POST messages, then send each
+    response as a `message` event as soon as its request completes.
+    """
+    session = open_session()
+    session.outbox = asyncio.Queue()
+    try:
+        yield f"event: endpoint\ndata: /messages?session_id={session.id}\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(session.outbox.get(), HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": heartbeat\n\n"
+                continue
+            if message is None:
+                break
+            yield sse_event("message", message)
+    finally:
+        close_session(session.id)
+
+@router.get("/sse")
+async def sse_context(
+    request: Request,
+    library: Optional[str] = Query(None, description="openai, firebase, aws, openai-agents, frontend or backend"),
+    language: Optional[str] = Query(None),
+    function: Optional[str] = Query(None),
+    resource: Optional[str] = Query(None),
+    endpoint: Optional[str] = Query(None),
+    schema: Optional[str] = Query(None),
+    component: Optional[str] = Query(None),
+    page: Optional[str] = Query(None),
+):
+    """
+    Stream documentation as server-sent events, one `section` event per section
+    followed by a `done` event. Without a library, open an MCP session for
+    clients of the HTTP+SSE transport (such as mcp-remote) instead.
+    """
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if library is None:
+        return StreamingResponse(session_stream(request), media_type="text/event-stream", headers=headers)
+    if registry.server_for(library) is None:
+        raise HTTPException(status_code=422, detail=f"Unknown library: {library}")
+
+    item = BatchItem(
+        library=library, language=language, function=function, resource=resource,
+        endpoint=endpoint, schema=schema, component=component, page=page,
+    )
+    return StreamingResponse(
+        event_stream(request, item),
+        media_type="text/event-stream",
+        headers=headers,
+    )
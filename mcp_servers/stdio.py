@@ -0,0 +1,49 @@
+"""
+MCP over stdio: newline-delimited JSON-RPC on stdin and stdout.
+
+    python main.py --stdio
+
+Each request is handled as soon as its line is read, and its response is
+written as soon as it completes, so a client can keep many lookups in flight.
+Anything the routers print goes to stderr, keeping stdout for the protocol.
+"""
+import asyncio
+import contextlib
+import json
+import sys
+from typing import AsyncContextManager
+
+from mcp_servers.protocol import PARSE_ERROR, Session, error_response
+
+# Longest message line accepted on stdin
+MAX_LINE = 16 * 1024 * 1024
+
+
+async def serve_stdio(lifespan: AsyncContextManager):
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_LINE)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    stdout = sys.stdout.buffer
+
+    def deliver(message: dict):
+        stdout.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        stdout.flush()
+
+    session = Session()
+    with contextlib.redirect_stdout(sys.stderr):
+        async with lifespan:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    payload = json.loads(line)
+                except ValueError:
+                    deliver(error_response(None, PARSE_ERROR, "Parse error"))
+                    continue
+                # Batched messages are answered one by one, as they complete
+                for message in payload if isinstance(payload, list) else [payload]:
+                    session.submit(message, deliver)
+            await session.drain()
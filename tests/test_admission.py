@@ -0,0 +1,212 @@
+import asyncio
+
+import pytest
+
+from mcp_servers import admission, openai_agents_mcp, shared_cache
+from mcp_servers.admission import AdmissionMiddleware, Limiter, Overloaded, admitted, client_admitted
+from mcp_servers.doc_cache import TTLCache
+from mcp_servers.shared_cache import SharedCache
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = Limiter(1, queue_size=2)
+    monkeypatch.setattr(admission, "limiters", {"docs": limiter})
+    monkeypatch.setattr(admission, "client_slots", {})
+    return limiter
+
+
+def test_waiters_are_admitted_in_order():
+    async def main():
+        limiter = Limiter(1, queue_size=4)
+        order = []
+        assert await limiter.acquire(1)
+
+        async def wait(name):
+            assert await limiter.acquire(1)
+            order.append(name)
+            limiter.release(0)
+
+        waiters = [asyncio.create_task(wait(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        limiter.release(0)
+        await asyncio.gather(*waiters)
+        return order, limiter.active
+
+    assert asyncio.run(main()) == (["a", "b", "c"], 0)
+
+
+def test_full_queue_refuses_at_once():
+    async def main():
+        limiter = Limiter(1, queue_size=1)
+        await limiter.acquire(1)
+        waiter = asyncio.create_task(limiter.acquire(1))
+        await asyncio.sleep(0)
+        refused = await limiter.acquire(1)
+        limiter.release(0)
+        return refused, await waiter
+
+    assert asyncio.run(main()) == (False, True)
+
+
+def test_wait_times_out():
+    async def main():
+        limiter = Limiter(1, queue_size=1)
+        await limiter.acquire(1)
+        return await limiter.acquire(0.01), limiter.active, len(limiter._waiters)
+
+    assert asyncio.run(main()) == (False, 1, 0)
+
+
+def test_slow_service_time_refuses_without_queueing():
+    async def main():
+        limiter = Limiter(1, queue_size=4)
+        limiter.service_time = 5.0
+        await limiter.acquire(1)
+        return await limiter.acquire(1), limiter.expected_wait()
+
+    assert asyncio.run(main()) == (False, 5.0)
+
+
+def test_cancelled_waiter_passes_its_slot_on():
+    async def main():
+        limiter = Limiter(1, queue_size=4)
+        await limiter.acquire(1)
+        first = asyncio.create_task(limiter.acquire(1))
+        second = asyncio.create_task(limiter.acquire(1))
+        await asyncio.sleep(0)
+        # Handed the slot just as it is cancelled, the first waiter either
+        # keeps it (and must release it) or passes it to the next one
+        limiter.release(0)
+        first.cancel()
+        try:
+            if await first:
+                limiter.release(0)
+        except asyncio.CancelledError:
+            pass
+        granted = await second
+        limiter.release(0)
+        return granted, limiter.active, len(limiter._waiters)
+
+    assert asyncio.run(main()) == (True, 0, 0)
+
+
+def test_waiter_cancelled_in_the_queue_leaves_it():
+    async def main():
+        limiter = Limiter(1, queue_size=4)
+        await limiter.acquire(1)
+        waiter = asyncio.create_task(limiter.acquire(1))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        queued = len(limiter._waiters)
+        limiter.release(0)
+        return queued, limiter.active
+
+    assert asyncio.run(main()) == (0, 0)
+
+
+def test_admitted_refuses_a_busy_server(limiter, monkeypatch):
+    monkeypatch.setattr(admission, "ADMISSION_TIMEOUT", 0.01)
+
+    async def main():
+        async with admitted("docs"):
+            with pytest.raises(Overloaded) as excinfo:
+                async with admitted("docs"):
+                    pass
+        return excinfo.value
+
+    error = asyncio.run(main())
+    assert (error.status, error.retry_after) == (503, 1)
+    assert limiter.active == 0
+
+
+def test_client_admitted_limits_each_client(limiter, monkeypatch):
+    monkeypatch.setattr(admission, "CLIENT_LIMIT", 1)
+
+    async def main():
+        admission.current_client.set("10.0.0.1")
+        async with client_admitted("docs"):
+            with pytest.raises(Overloaded) as excinfo:
+                async with client_admitted("docs"):
+                    pass
+        return excinfo.value.status
+
+    assert asyncio.run(main()) == 429
+    assert admission.client_slots == {}
+    assert limiter.active == 0
+
+
+def test_coalesced_callers_are_judged_on_their_own_client(limiter, monkeypatch):
+    monkeypatch.setattr(admission, "CLIENT_LIMIT", 1)
+    monkeypatch.setattr(openai_agents_mcp, "SERVER_ID", "docs")
+    release = asyncio.Event()
+
+    async def load():
+        async with admitted("docs"):
+            await release.wait()
+        return "doc"
+
+    async def lookup(client):
+        admission.current_client.set(client)
+        return await openai_agents_mcp.load_cached(cache, "key", load)
+
+    async def main():
+        leader = asyncio.create_task(lookup("a"))
+        await asyncio.sleep(0)
+        # "a" is at its limit, which neither refuses "b" nor lets "a" in again
+        follower = asyncio.create_task(lookup("b"))
+        with pytest.raises(Overloaded):
+            await lookup("a")
+        release.set()
+        return await leader, await follower
+
+    cache = TTLCache("test", ttl=60)
+    assert asyncio.run(main()) == ("doc", "doc")
+    assert admission.client_slots == {}
+
+
+def test_shared_cache_hits_take_no_slot(limiter, monkeypatch, tmp_path):
+    shared = SharedCache(str(tmp_path / "shared.db"))
+    monkeypatch.setattr(shared_cache, "_shared", shared)
+    monkeypatch.setattr(openai_agents_mcp, "SERVER_ID", "docs")
+
+    async def main():
+        await shared.set_async("sections", "runner", ["exact", "Runner docs"])
+        # Every slot is busy, yet a section another worker stored is served
+        async with admitted("docs"):
+            return await openai_agents_mcp.load_section("Runner")
+
+    try:
+        assert asyncio.run(main()) == ("exact", "Runner docs")
+    finally:
+        shared.close()
+
+
+def test_unlimited_server_is_not_queued(limiter):
+    async def main():
+        async with admitted("other"):
+            return limiter.active
+
+    assert asyncio.run(main()) == 0
+
+
+def test_middleware_answers_503_with_retry_after():
+    async def app(scope, receive, send):
+        raise Overloaded(503, 2.5, "Server busy, retry later")
+
+    async def main():
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "headers": [], "client": ("10.0.0.1", 1234)}
+        await AdmissionMiddleware(app)(scope, None, send)
+        return sent
+
+    start, body = asyncio.run(main())
+    assert start["status"] == 503
+    assert (b"retry-after", b"3") in start["headers"]
+    assert body["body"] == b'{"detail": "Server busy, retry later"}'
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from mcp_servers import backend_mcp
+from mcp_servers.backend_catalog import BackendCatalog, build_catalog, decode_cursor
+from mcp_servers.search import search_index
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/api/v1/users": {
+            "get": {"summary": "List users", "tags": ["users"]},
+            "post": {"summary": "Create a user", "tags": ["users"]},
+            "parameters": [],
+        },
+        "/api/v1/orders/{id}": {"get": {"operationId": "getOrder"}},
+        "/api/v1/shared": "#/components/pathItems/Shared",
+    },
+    "components": {"schemas": {
+        "User": {"properties": {"id": {"type": "string", "format": "uuid"}, "tags": {"type": "array", "items": {"type": "string"}}}},
+        "Broken": "#/components/schemas/User",
+    }},
+}
+
+
+def write_spec(directory, name, document):
+    path = directory / name
+    path.write_text(document if isinstance(document, str) else json.dumps(document))
+    return path
+
+
+def test_openapi_operations_and_schemas_are_indexed():
+    catalog = BackendCatalog()
+    catalog.load_openapi(SPEC)
+    assert [(e["resource"], e["method"], e["path"]) for e in catalog.endpoints] == [
+        ("users", "GET", "/api/v1/users"),
+        ("users", "POST", "/api/v1/users"),
+        ("orders", "GET", "/api/v1/orders/{id}"),
+    ]
+    assert catalog.endpoint("get /api/v1/orders/{id}")["summary"] == "getOrder"
+    assert catalog.schemas == {"User": {"id": "string (uuid)", "tags": "array of string"}}
+    assert catalog.tables_with_field("ID") == ["User"]
+
+
+def test_filters_and_pages_through_endpoints():
+    catalog = BackendCatalog()
+    catalog.load_openapi(SPEC)
+    page, cursor = catalog.list_endpoints(resource="users", limit=1, fields=["method"])
+    assert page == [{"method": "GET"}]
+    page, cursor = catalog.list_endpoints(resource="users", cursor=cursor, limit=1, fields=["method"])
+    assert (page, cursor) == ([{"method": "POST"}], None)
+    assert catalog.list_endpoints(resource="users", method="post")[0][0]["path"] == "/api/v1/users"
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_bad_spec_files_are_reported_and_skipped(tmp_path, capsys):
+    write_spec(tmp_path, "a_broken.json", "{not json")
+    write_spec(tmp_path, "b_list.json", [1, 2])
+    write_spec(tmp_path, "c_api.json", SPEC)
+    catalog = build_catalog({}, {}, [str(tmp_path), str(tmp_path / "missing.json")])
+    assert len(catalog.endpoints) == 3
+    errors = capsys.readouterr().out
+    assert "a_broken.json" in errors and "b_list.json" in errors and "missing.json" in errors
+
+
+def test_invalidate_refreshes_the_search_indexes(monkeypatch):
+    monkeypatch.setitem(backend_mcp.backend_apis, "invoices", {"GET /api/invoices": "List all invoices"})
+    backend_mcp.invalidate_catalog()
+    try:
+        results = search_index.search("invoices", library="backend")
+        assert [result["symbol"] for result in results][:1] == ["GET /api/invoices"]
+    finally:
+        monkeypatch.undo()
+        backend_mcp.invalidate_catalog()
+    assert search_index.search("invoices", library="backend") == []
@@ -0,0 +1,46 @@
+from mcp_servers import frontend_mcp
+from mcp_servers.frontend_catalog import FrontendCatalog, parse_script
+
+BUTTON = '''
+interface ButtonProps {
+  label: string;
+  onClick?: () => void;
+}
+
+/** A clickable button. */
+export function Button({ label, onClick }: ButtonProps) {
+  return <button onClick={onClick}>{label}</button>;
+}
+'''
+
+
+def test_parses_tsx_components_with_props():
+    [record] = parse_script(BUTTON, "src/components/Button.tsx")
+    assert (record["name"], record["kind"], record["description"]) == ("Button", "component", "A clickable button.")
+    assert [(p["name"], p["type"], p["required"]) for p in record["props"]] == [
+        ("label", "string", True), ("onClick", "() => void", False)]
+
+
+def test_rescan_parses_only_changed_files(tmp_path):
+    source = tmp_path / "src"
+    (source / "pages").mkdir(parents=True)
+    (source / "Button.tsx").write_text(BUTTON)
+    (source / "pages" / "Home.tsx").write_text("export default function Home() { return null; }")
+    catalog = FrontendCatalog([str(source)], str(tmp_path / "index.json"))
+    catalog.refresh()
+    assert (list(catalog.components), list(catalog.pages), catalog.parsed) == (["Button"], ["Home"], 2)
+
+    assert not catalog.refresh()
+    (source / "pages" / "Home.tsx").unlink()
+    changes = catalog.refresh()
+    assert changes.removed and catalog.parsed == 2 and not catalog.pages
+
+    reloaded = FrontendCatalog([str(source)], str(tmp_path / "index.json"))
+    reloaded.load()
+    assert not reloaded.refresh() and list(reloaded.components) == ["Button"]
+
+
+def test_listings_keep_catalog_order():
+    documentation = frontend_mcp.frontend_context()["context"]["documentation"]
+    names = [line[2:].split(":")[0] for line in documentation.splitlines() if line.startswith("- ")]
+    assert names == list(frontend_mcp.frontend_components) + list(frontend_mcp.frontend_pages)
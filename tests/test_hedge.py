@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from mcp_servers import hedge, registry
+from mcp_servers.admission import Overloaded
+from mcp_servers.metrics import doc_resolutions, record_resolution
+from mcp_servers.resolver import EXACT, FALLBACK
+
+PRIMARY = {"id": "primary"}
+FALLBACK_SERVER = {"id": "fallback"}
+
+
+@pytest.fixture
+def servers(monkeypatch):
+    """
+    Route hedged lookups to the resolvers the test puts in the returned dict.
+    """
+    resolvers = {}
+    monkeypatch.setattr(registry, "server", lambda server_id: PRIMARY)
+    monkeypatch.setattr(registry, "fallback_for", lambda server: FALLBACK_SERVER)
+    monkeypatch.setattr(registry, "resolver", lambda server: resolvers[server["id"]])
+    return resolvers
+
+
+def resolver(outcome, delay=0.0, library=None):
+    async def resolve(function_name):
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if library:
+            record_resolution(library, outcome)
+        return outcome, f"{outcome} doc for {function_name}"
+    return resolve
+
+
+def hedged(delay=0.01):
+    async def main():
+        result = await hedge.hedged_resolve("primary", "Runner", delay)
+        pending = len(hedge._background)
+        # Let the losing lookup finish
+        await asyncio.gather(*hedge._background, return_exceptions=True)
+        await asyncio.sleep(0)
+        return result, pending, len(hedge._background)
+    return asyncio.run(main())
+
+
+def test_fast_primary_answers_without_the_fallback(servers):
+    servers["primary"] = resolver(EXACT)
+    servers["fallback"] = resolver(AssertionError("fallback should not run"))
+    assert hedged()[0] == ("primary", EXACT, "exact doc for Runner")
+
+
+def test_fallback_answers_for_a_slow_primary_which_still_finishes(servers):
+    servers["primary"] = resolver(EXACT, delay=0.2)
+    servers["fallback"] = resolver(EXACT)
+    result, pending, left = hedged()
+    assert result == ("fallback", EXACT, "exact doc for Runner")
+    assert (pending, left) == (1, 0)
+
+
+def test_primary_answer_stands_when_neither_finds_the_name(servers):
+    servers["primary"] = resolver(FALLBACK, delay=0.05)
+    servers["fallback"] = resolver(FALLBACK)
+    assert hedged()[0] == ("primary", FALLBACK, "fallback doc for Runner")
+
+
+def test_fallback_answers_for_a_failed_primary(servers):
+    servers["primary"] = resolver(RuntimeError("docs site down"), delay=0.05)
+    servers["fallback"] = resolver(FALLBACK)
+    assert hedged()[0] == ("fallback", FALLBACK, "fallback doc for Runner")
+
+
+def test_overloaded_primary_is_not_masked_by_the_fallback(servers):
+    servers["primary"] = resolver(Overloaded(503, 1, "Server busy, retry later"), delay=0.05)
+    servers["fallback"] = resolver(FALLBACK)
+    with pytest.raises(Overloaded):
+        hedged()
+
+
+def test_fallback_lookups_are_not_recorded(servers):
+    servers["primary"] = resolver(EXACT, delay=0.05, library="hedge-primary")
+    servers["fallback"] = resolver(FALLBACK, library="hedge-fallback")
+    hedged()
+    assert doc_resolutions._values.get(("hedge-primary", EXACT)) == 1
+    assert ("hedge-fallback", FALLBACK) not in doc_resolutions._values
@@ -0,0 +1,53 @@
+from mcp_servers.html_extract import DocsExtractor, SectionGrouper, extract_markdown
+
+PAGE = """
+<html><head><title>Docs</title><script>var x = "<p>no</p>";</script></head>
+<body><nav><p>Navigation</p></nav>
+<main>
+<h1>Agents</h1>
+<p>Agents use <code>tools</code>.</p>
+<ul><li>One<li>Two</ul>
+<pre>agent = Agent()</pre>
+<h2>Handoffs</h2><p>Delegate.</p>
+</main>
+<footer><p>Footer</p></footer>
+</body></html>
+"""
+
+
+def test_extracts_only_main_content():
+    text = extract_markdown(PAGE)
+    assert text == (
+        "\n## Agents\n\n"
+        "Agents use tools.\n\n"
+        "- One\n- Two\n\n"
+        "```python\nagent = Agent()\n```\n\n"
+        "\n## Handoffs\n\nDelegate.\n\n"
+    )
+
+
+def test_chunked_feed_matches_whole_feed():
+    extractor = DocsExtractor()
+    blocks = []
+    for start in range(0, len(PAGE), 7):
+        extractor.feed(PAGE[start:start + 7])
+        blocks.extend(extractor.drain())
+    extractor.close()
+    blocks.extend(extractor.drain())
+    assert "".join(blocks) == extract_markdown(PAGE)
+
+
+def test_page_without_main_falls_back_to_whole_page():
+    html = "<html><body><h1>Overview</h1><p>Intro.</p><script>skip()</script></body></html>"
+    assert extract_markdown(html) == "\n## Overview\n\nIntro.\n\n"
+
+
+def test_empty_page_extracts_nothing():
+    assert extract_markdown("<html><body></body></html>") is None
+
+
+def test_grouper_releases_sections_at_the_next_heading():
+    grouper = SectionGrouper()
+    assert grouper.add(["\n## A\n\n", "a\n\n"]) == []
+    assert grouper.add(["\n## B\n\n"]) == ["\n## A\n\na\n\n"]
+    assert grouper.finish() == ["\n## B\n\n"]
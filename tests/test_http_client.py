@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mcp_servers import http_client
+from mcp_servers.doc_cache import TTLCache
+
+URL = "http://docs.test/page/"
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Serve URL from an in-memory transport; the fixture's "chunks" are the body.
+    """
+    state = {"chunks": [b"<main>", b"<p>one</p>", b"<p>two</p>", b"</main>"], "status": 200}
+
+    async def body():
+        for chunk in state["chunks"]:
+            await asyncio.sleep(0)
+            yield chunk
+
+    def handler(request):
+        return httpx.Response(state["status"], content=body())
+
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(http_client, "_host_slots", {})
+    monkeypatch.setattr(http_client, "_breakers", {})
+    monkeypatch.setattr(http_client, "not_found", TTLCache("not-found", maxsize=8, ttl=30, stale_ttl=0))
+    return state
+
+
+def collect(url):
+    async def main():
+        return [chunk async for chunk in http_client.stream_text(url)]
+    return asyncio.run(main())
+
+
+def test_streams_the_body_and_records_success(upstream):
+    assert "".join(collect(URL)) == "<main><p>one</p><p>two</p></main>"
+    assert http_client.breaker_for("docs.test").state == "closed"
+
+
+def test_error_status_yields_nothing_and_is_remembered(upstream):
+    upstream["status"] = 404
+    assert collect(URL) == []
+    assert http_client.not_found.get(URL)
+
+
+def test_slow_consumer_does_not_hold_the_host_slot(upstream, monkeypatch):
+    monkeypatch.setattr(http_client, "MAX_CONNECTIONS_PER_HOST", 1)
+
+    async def main():
+        stream = http_client.stream_text(URL)
+        first = await stream.__anext__()
+        # The download finishes into the buffer while the consumer sits on its first chunk
+        for _ in range(20):
+            await asyncio.sleep(0)
+        slot = http_client._host_slot(URL)
+        free = not slot.locked()
+        rest = [chunk async for chunk in stream]
+        return first, free, rest
+
+    first, free, rest = asyncio.run(main())
+    assert free
+    assert first + "".join(rest) == "<main><p>one</p><p>two</p></main>"
+
+
+def test_consumer_stopping_early_settles_a_half_open_probe(upstream):
+    breaker = http_client.breaker_for("docs.test")
+    breaker.state = breaker.HALF_OPEN
+    breaker.opened_at = 0.0
+
+    async def main():
+        stream = http_client.stream_text(URL)
+        await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert breaker.state == breaker.CLOSED
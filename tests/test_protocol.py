@@ -0,0 +1,100 @@
+import asyncio
+
+from mcp_servers import protocol
+from mcp_servers.protocol import (
+    INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PROTOCOL_VERSIONS, Session,
+)
+
+
+def request(request_id, method, params=None):
+    message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+def handle(*messages):
+    async def main():
+        session = Session()
+        return session, [await session.handle(message) for message in messages]
+    return asyncio.run(main())
+
+
+def test_initialize_negotiates_the_protocol_version():
+    session, [known, unknown] = handle(
+        request(1, "initialize", {"protocolVersion": PROTOCOL_VERSIONS[-1]}),
+        request(2, "initialize", {"protocolVersion": "1999-01-01"}),
+    )
+    assert known["result"]["protocolVersion"] == PROTOCOL_VERSIONS[-1]
+    assert unknown["result"]["protocolVersion"] == PROTOCOL_VERSIONS[0]
+    assert session.protocol_version == PROTOCOL_VERSIONS[0]
+
+
+def test_notifications_get_no_response():
+    session, [response] = handle({"jsonrpc": "2.0", "method": "notifications/initialized"})
+    assert response is None
+    assert session.initialized
+
+
+def test_malformed_and_unknown_requests_are_errors():
+    _, responses = handle(
+        {"id": 1, "method": "ping"},
+        request(None, "ping"),
+        request(3, "no/such/method"),
+        request(4, "tools/call", {"name": "no_such_tool"}),
+        {"jsonrpc": "2.0", "id": 5, "result": {}},
+    )
+    assert [r["error"]["code"] if r else None for r in responses] == [
+        INVALID_REQUEST, INVALID_REQUEST, METHOD_NOT_FOUND, INVALID_PARAMS, None]
+    assert responses[0]["id"] == 1 and responses[2]["id"] == 3
+
+
+def test_tools_call_resolves_context():
+    _, [listed, called, bad] = handle(
+        request(1, "tools/list"),
+        request(2, "tools/call", {"name": "aws_context", "arguments": {"language": "python", "function": "boto3.client"}}),
+        request(3, "tools/call", {"name": "aws_context", "arguments": {"language": "python"}}),
+    )
+    names = [tool["name"] for tool in listed["result"]["tools"]]
+    assert "aws_context" in names and "search_docs" in names
+    assert "client" in called["result"]["content"][0]["text"]
+    assert not called["result"]["isError"]
+    assert bad["result"]["isError"]
+
+
+def test_requests_are_answered_as_they_finish(monkeypatch):
+    async def slow_call_tool(params):
+        await asyncio.sleep(params["delay"])
+        return {"content": [], "isError": False}
+
+    monkeypatch.setattr(protocol, "call_tool", slow_call_tool)
+
+    async def main():
+        session = Session()
+        answered = []
+        session.submit(request("slow", "tools/call", {"delay": 0.05}), lambda r: answered.append(r["id"]))
+        session.submit(request("fast", "tools/call", {"delay": 0}), lambda r: answered.append(r["id"]))
+        await session.drain()
+        return answered
+
+    assert asyncio.run(main()) == ["fast", "slow"]
+
+
+def test_cancelled_request_gets_no_response(monkeypatch):
+    async def main():
+        release = asyncio.Event()
+
+        async def blocked_call_tool(params):
+            await release.wait()
+
+        monkeypatch.setattr(protocol, "call_tool", blocked_call_tool)
+        session = Session()
+        pending = asyncio.create_task(session.handle(request(7, "tools/call", {})))
+        await asyncio.sleep(0)
+        await session.handle({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 7}})
+        response = await pending
+        return session, response
+
+    session, response = asyncio.run(main())
+    assert response is None
+    assert not session._in_flight and not session._cancelled
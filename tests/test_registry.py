@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_after_startup(servers):
+    code = (
+        "import sys, main; "
+        "print(' '.join(m for m in ('httpx', 'numpy', 'mcp_servers.openai_agents_mcp') if m in sys.modules))"
+    )
+    env = dict(os.environ, MCP_SERVERS=servers)
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_slim_worker_skips_the_scraping_stack():
+    assert imported_after_startup("frontend-mcp,backend-mcp") == []
+
+
+def test_agents_worker_loads_its_router():
+    assert "mcp_servers.openai_agents_mcp" in imported_after_startup("openai-agents-mcp")
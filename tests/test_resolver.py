@@ -0,0 +1,87 @@
+import pytest
+
+from mcp_servers.openai_agents_mcp import base_url, doc_pages, page_url_for
+from mcp_servers.resolver import EXACT, FUZZY, SymbolResolver
+
+
+def make_resolver(**kwargs):
+    return SymbolResolver(
+        ("boto3.", "aws."),
+        {"client": "client doc", "resource": "resource doc", "s3.Bucket": "bucket doc", "s3.Bucket.upload_file": "upload doc"},
+        **kwargs,
+    )
+
+
+def test_strips_longest_prefix_preserving_case():
+    resolver = SymbolResolver(("openai.", "openai.agents."))
+    assert resolver.strip_prefix("OpenAI.Agents.Runner") == "Runner"
+    assert resolver.strip_prefix("openai.ChatCompletion") == "ChatCompletion"
+    assert resolver.strip_prefix("Runner") == "Runner"
+
+
+def test_exact_segments_match_case_insensitively():
+    assert make_resolver().resolve("boto3.CLIENT").value == "client doc"
+
+
+def test_longest_match_wins():
+    resolver = make_resolver()
+    assert resolver.resolve("boto3.s3.Bucket.upload_file").value == "upload doc"
+    assert resolver.resolve("s3.Bucket.copy").value == "bucket doc"
+
+
+def test_ties_go_to_leftmost_match():
+    assert make_resolver().resolve("resource.client").value == "resource doc"
+
+
+def test_whole_segments_match_exactly():
+    match = make_resolver().resolve("boto3.s3.Bucket")
+    assert (match.value, match.kind) == ("bucket doc", EXACT)
+
+
+def test_partial_segments_match_only_at_word_boundaries():
+    resolver = make_resolver()
+    # "client" sits inside the segment; only a leading word of it may match, fuzzily
+    match = resolver.resolve("boto3.resource_client_helper")
+    assert (match.value, match.kind) == ("resource doc", FUZZY)
+    assert resolver.resolve("boto3.helper_client") is None
+    assert resolver.resolve("boto3.clientele") is None
+    assert SymbolResolver((), {"Agent": "agent doc"}).resolve("Agentic") is None
+
+
+def test_last_segment_prefix_matches():
+    resolver = SymbolResolver(("firebase.",), {"auth.signIn": "sign in", "firestore.collection": "collection"})
+    match = resolver.resolve("firebase.auth.signInWithEmailAndPassword")
+    assert (match.value, match.kind) == ("sign in", FUZZY)
+    assert resolver.resolve("auth.signinwithemail") is None
+    assert resolver.resolve("auth.signOut") is None
+
+
+def test_substring_fallback_is_opt_in():
+    assert make_resolver().resolve("get_s3_client") is None
+    match = make_resolver(substring=True).resolve("get_s3_client")
+    assert (match.value, match.kind) == ("client doc", FUZZY)
+
+
+def test_first_registration_wins():
+    resolver = SymbolResolver((), {"Agent": 1, "agent": 2})
+    assert len(resolver) == 1
+    assert resolver.resolve("agent").value == 1
+
+
+@pytest.mark.parametrize("name, page", [
+    ("agents.Agent", "Agent"),
+    ("AgentHooks", "Agent"),
+    ("agents.Runner.run_sync", "Runner"),
+    ("Handoffs", "Handoff"),
+    ("handoff", "Handoff"),
+    ("InputGuardrail", "Guardrail"),
+    ("Guardrails", "Guardrail"),
+    ("function_tool", "Tool"),
+    ("VoicePipeline", "Voice"),
+])
+def test_agents_pages_are_routed_by_name(name, page):
+    assert page_url_for(name) == base_url + doc_pages[page]
+
+
+def test_unknown_agents_names_go_to_the_landing_page():
+    assert page_url_for("set_default_openai_key") == base_url
@@ -0,0 +1,53 @@
+from mcp_servers.semantic import SemanticIndex
+
+
+def make_index():
+    index = SemanticIndex()
+    index.replace_group("aws", [
+        ("boto3", "client", "Create a low-level service client by name."),
+        ("boto3", "resource", "Create a resource service client by name."),
+    ])
+    index.replace_group("firebase", [("firebase", "auth.signIn", "Sign in with email and password.")])
+    return index
+
+
+def test_nearest_finds_the_closest_symbol_in_a_library():
+    neighbours = make_index().nearest("get_client", k=1, library="boto3")
+    assert [n.symbol for n in neighbours] == ["client"]
+
+
+def test_nearest_respects_the_library_and_min_score():
+    index = make_index()
+    assert [n.library for n in index.nearest("signIn", library="firebase")] == ["firebase"]
+    assert index.nearest("client", library="unknown") == []
+    assert index.nearest("zzzz qqqq", library="boto3") == []
+
+
+def test_replacing_a_group_drops_its_old_documents():
+    index = make_index()
+    index.replace_group("aws", [("boto3", "session", "Create a session.")])
+    assert len(index) == 2
+    assert [n.symbol for n in index.nearest("Session", library="boto3")] == ["session"]
+
+
+def test_nearest_many_matches_nearest():
+    index = make_index()
+    queries = ["get_client", "resource"]
+    many = index.nearest_many(queries, k=1, library="boto3")
+    assert [[n.symbol for n in found] for found in many] == [["client"], ["resource"]]
+
+
+def test_replaced_columns_are_reused_and_never_returned():
+    index = make_index()
+    block = index._blocks["boto3"]
+    index.replace_group("aws", [])
+    assert index.nearest("client", library="boto3", min_score=0) == []
+    index.replace_group("aws", [("boto3", "session", "Create a session.")])
+    assert len(block.columns) == 2
+    assert [n.symbol for n in index.nearest("Session", library="boto3", min_score=0)] == ["session"]
+
+
+def test_nearest_without_a_library_searches_them_all():
+    neighbours = make_index().nearest("signIn", k=2, min_score=0)
+    assert neighbours[0].library == "firebase"
+    assert len(neighbours) == 2
@@ -0,0 +1,36 @@
+import asyncio
+
+from mcp_servers.shared_cache import SharedCache
+
+
+def test_values_round_trip_between_connections(tmp_path):
+    path = str(tmp_path / "shared.db")
+    writer, reader = SharedCache(path), SharedCache(path)
+    try:
+        asyncio.run(writer.set_async("pages", "url", ["exact", "text"]))
+        assert asyncio.run(reader.get_async("pages", "url", 60)) == ["exact", "text"]
+        assert reader.get("pages", "url", -1) is None
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_concurrent_misses_load_once(tmp_path):
+    cache = SharedCache(str(tmp_path / "shared.db"))
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "page"
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_load("pages", "url", 60, loader) for _ in range(3)))
+
+    try:
+        assert asyncio.run(main()) == ["page"] * 3
+        assert calls == 1
+        assert (cache.misses, cache.waits) == (3, 2)
+    finally:
+        cache.close()
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from mcp_servers.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    async def main():
+        flights = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+        return flights, calls, results
+
+    flights, calls, results = asyncio.run(main())
+    assert calls == 1
+    assert results == [1] * 5
+    assert (flights.leaders, flights.shared, len(flights)) == (1, 4, 0)
+
+
+def test_different_keys_run_separately():
+    async def main():
+        flights = SingleFlight()
+
+        async def work(value):
+            await asyncio.sleep(0)
+            return value
+
+        return await asyncio.gather(flights.do("a", lambda: work(1)), flights.do("b", lambda: work(2)))
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_exception_reaches_every_caller():
+    async def main():
+        flights = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        return await asyncio.gather(*(flights.do("key", work) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelled_leader_does_not_fail_waiters():
+    async def main():
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "page"
+
+        leader = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return leader, await waiter
+
+    leader, result = asyncio.run(main())
+    assert leader.cancelled()
+    assert result == "page"
+
+
+def test_work_finishes_after_every_caller_left():
+    async def main():
+        flights = SingleFlight()
+        finished = asyncio.Event()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            finished.set()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(flights.do("key", work), 0.001)
+        await asyncio.wait_for(finished.wait(), 1)
+        await asyncio.sleep(0)
+        return len(flights)
+
+    assert asyncio.run(main()) == 0
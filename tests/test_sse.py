@@ -0,0 +1,44 @@
+import asyncio
+
+from mcp_servers import sse_mcp
+from mcp_servers.batch_mcp import BatchItem
+from mcp_servers.doc_index import split_sections
+
+
+def test_indented_docs_split_into_sections():
+    text = """
+    # SDK
+
+    Intro.
+
+    ## Agent
+
+    Agents.
+
+    ## Runner
+
+    Runs agents.
+    """
+    assert split_sections(text) == ["# SDK\n\nIntro.", "## Agent\n\nAgents.", "## Runner\n\nRuns agents."]
+
+
+def test_disconnect_with_a_full_queue_stops_the_producer(monkeypatch):
+    async def sections(item):
+        for count in range(sse_mcp.QUEUE_SIZE * 2):
+            yield f"## Section {count}"
+
+    monkeypatch.setattr(sse_mcp, "iter_sections", sections)
+
+    async def main():
+        stream = sse_mcp.event_stream(None, BatchItem(library="openai", language="python", function="x"))
+        first = await stream.__anext__()
+        # Let the producer fill the queue and block on it
+        for _ in range(sse_mcp.QUEUE_SIZE * 2):
+            await asyncio.sleep(0)
+        await stream.aclose()
+        await asyncio.sleep(0)
+        return first, [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    first, pending = asyncio.run(main())
+    assert first.startswith("event: section\n")
+    assert pending == []